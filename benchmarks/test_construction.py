@@ -0,0 +1,48 @@
+from functools import reduce
+from itertools import islice
+from operator import add
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Tuple
+
+from pytest import mark
+
+from chained_iterable import ChainedIterable
+
+
+# short inputs, so that the fixed cost per call dominates
+DATA = [3, 1, 2]
+
+
+def _increment(x: int) -> int:
+    return x + 1
+
+
+Case = Tuple[Callable[[], Any], Callable[[], Any]]
+CASES: Dict[str, Case] = {
+    "construct": (lambda: ChainedIterable(DATA), lambda: iter(DATA)),
+    "islice": (
+        lambda: ChainedIterable(iter(DATA)).islice(1, 2),
+        lambda: islice(iter(DATA), 1, 2),
+    ),
+    "map": (
+        lambda: ChainedIterable(iter(DATA)).map(_increment),
+        lambda: map(_increment, iter(DATA)),
+    ),
+    "max": (lambda: ChainedIterable(DATA).max(), lambda: max(DATA)),
+    "range": (lambda: ChainedIterable.range(3), lambda: range(3)),
+    "reduce": (
+        lambda: ChainedIterable(DATA).reduce(add),
+        lambda: reduce(add, DATA),
+    ),
+    "sum": (lambda: ChainedIterable(DATA).sum(), lambda: sum(DATA)),
+}
+
+
+@mark.parametrize("name", sorted(CASES))
+@mark.parametrize("kind", ["chained", "bare"])
+def test_call_overhead(benchmark: Any, name: str, kind: str) -> None:
+    benchmark.group = f"call overhead: {name}"
+    chained, bare = CASES[name]
+    benchmark(chained if kind == "chained" else bare)
@@ -0,0 +1,43 @@
+from operator import mod
+from typing import Any
+from typing import Callable
+from typing import Iterable
+
+from more_itertools import consume
+from pytest import mark
+
+from chained_iterable import ChainedIterable
+
+
+NUM_ELEMENTS = 100_000
+
+
+def _increment(x: int) -> int:
+    return x + 1
+
+
+def _not_multiple_of_7(x: int) -> bool:
+    return mod(x, 7) != 0
+
+
+def _build(iterable: ChainedIterable[int], depth: int) -> ChainedIterable[int]:
+    for i in range(depth):
+        if i % 2 == 0:
+            iterable = iterable.map(_increment)
+        else:
+            iterable = iterable.filter(_not_multiple_of_7)
+    return iterable
+
+
+@mark.parametrize("depth", [1, 2, 4, 8, 16])
+@mark.parametrize(
+    "make",
+    [ChainedIterable, lambda x: ChainedIterable(x).fuse()],
+    ids=["pipe", "fused"],
+)
+def test_chain_depth(
+    benchmark: Any, make: Callable[[Iterable[int]], Any], depth: int,
+) -> None:
+    benchmark.group = f"depth={depth}"
+    source = range(NUM_ELEMENTS)
+    benchmark(lambda: consume(_build(make(source), depth)))
@@ -0,0 +1,199 @@
+from heapq import nlargest
+from heapq import nsmallest
+from operator import itemgetter
+from operator import mod
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import Tuple
+
+from more_itertools import consume
+
+from pytest import mark
+
+from chained_iterable import ChainedMapping
+
+
+NUM_KEYS = 100_000
+MAPPING = {i: i for i in range(NUM_KEYS)}
+
+
+def _is_odd(x: int) -> bool:
+    return mod(x, 2) == 1
+
+
+def _is_not_multiple_of_3(x: int) -> bool:
+    return mod(x, 3) != 0
+
+
+def _increment(x: int) -> int:
+    return x + 1
+
+
+def _transform(mapping: ChainedMapping[int, int]) -> ChainedMapping[int, int]:
+    return (
+        mapping.filter_keys(_is_odd)
+        .map_values(_increment)
+        .filter_values(_is_not_multiple_of_3)
+        .map_values(_increment)
+        .filter_items(lambda k, v: k < v)
+    )
+
+
+def _comprehension() -> Dict[int, int]:
+    out = {}
+    for k, v in MAPPING.items():
+        if _is_odd(k):
+            v = _increment(v)
+            if _is_not_multiple_of_3(v):
+                v = _increment(v)
+                if k < v:
+                    out[k] = v
+    return out
+
+
+MAKERS: Dict[str, Callable[[], ChainedMapping[int, int]]] = {
+    "eager": lambda: ChainedMapping(MAPPING),
+    "lazy": lambda: ChainedMapping(MAPPING).lazy(),
+}
+
+
+@mark.parametrize("name", sorted(MAKERS))
+def test_transform_chain(benchmark: Any, name: str) -> None:
+    benchmark.group = "mapping: transform chain"
+    make = MAKERS[name]
+    benchmark(lambda: _transform(make()).dict())
+
+
+def test_transform_chain_comprehension(benchmark: Any) -> None:
+    benchmark.group = "mapping: transform chain"
+    benchmark(_comprehension)
+
+
+@mark.parametrize("name", sorted(MAKERS))
+def test_transform_lookup(benchmark: Any, name: str) -> None:
+    benchmark.group = "mapping: single lookup"
+    make = MAKERS[name]
+    benchmark(lambda: _transform(make())[1])
+
+
+# each case pairs a ChainedMapping method with the bare call it wraps
+Case = Tuple[Callable[[], Any], Callable[[], Any]]
+CHAINED = ChainedMapping(MAPPING)
+CASES: Dict[str, Case] = {
+    "all_keys": (lambda: CHAINED.all_keys(), lambda: all(MAPPING)),
+    "all_values": (
+        lambda: CHAINED.all_values(),
+        lambda: all(MAPPING.values()),
+    ),
+    "any_keys": (lambda: CHAINED.any_keys(), lambda: any(MAPPING)),
+    "any_values": (
+        lambda: CHAINED.any_values(),
+        lambda: any(MAPPING.values()),
+    ),
+    "dict": (lambda: CHAINED.dict(), lambda: dict(MAPPING)),
+    "filter_items": (
+        lambda: CHAINED.filter_items(lambda k, v: k < v),
+        lambda: {k: v for k, v in MAPPING.items() if k < v},
+    ),
+    "filter_keys": (
+        lambda: CHAINED.filter_keys(_is_odd),
+        lambda: {k: v for k, v in MAPPING.items() if _is_odd(k)},
+    ),
+    "filter_values": (
+        lambda: CHAINED.filter_values(_is_odd),
+        lambda: {k: v for k, v in MAPPING.items() if _is_odd(v)},
+    ),
+    "frozenset_items": (
+        lambda: CHAINED.frozenset_items(),
+        lambda: frozenset(MAPPING.items()),
+    ),
+    "frozenset_keys": (
+        lambda: CHAINED.frozenset_keys(),
+        lambda: frozenset(MAPPING),
+    ),
+    "frozenset_values": (
+        lambda: CHAINED.frozenset_values(),
+        lambda: frozenset(MAPPING.values()),
+    ),
+    "get": (lambda: CHAINED.get(1), lambda: MAPPING.get(1)),
+    "items": (lambda: iter(CHAINED.items()), lambda: iter(MAPPING.items())),
+    "keys": (lambda: iter(CHAINED.keys()), lambda: iter(MAPPING.keys())),
+    "lazy": (lambda: CHAINED.lazy(), lambda: MAPPING),
+    "list_items": (
+        lambda: CHAINED.list_items(),
+        lambda: list(MAPPING.items()),
+    ),
+    "list_keys": (lambda: CHAINED.list_keys(), lambda: list(MAPPING)),
+    "list_values": (
+        lambda: CHAINED.list_values(),
+        lambda: list(MAPPING.values()),
+    ),
+    "map_items": (
+        lambda: CHAINED.map_items(lambda k, v: (v, k)),
+        lambda: {v: k for k, v in MAPPING.items()},
+    ),
+    "map_keys": (
+        lambda: CHAINED.map_keys(_increment),
+        lambda: {_increment(k): v for k, v in MAPPING.items()},
+    ),
+    "map_values": (
+        lambda: CHAINED.map_values(_increment),
+        lambda: {k: _increment(v) for k, v in MAPPING.items()},
+    ),
+    "max_items": (
+        lambda: CHAINED.max_items(key=itemgetter(1)),
+        lambda: max(MAPPING.items(), key=itemgetter(1)),
+    ),
+    "max_keys": (lambda: CHAINED.max_keys(), lambda: max(MAPPING)),
+    "max_values": (
+        lambda: CHAINED.max_values(),
+        lambda: max(MAPPING.values()),
+    ),
+    "nlargest_items": (
+        lambda: CHAINED.nlargest_items(10),
+        lambda: nlargest(10, MAPPING.items()),
+    ),
+    "nlargest_keys": (
+        lambda: CHAINED.nlargest_keys(10),
+        lambda: nlargest(10, MAPPING),
+    ),
+    "nlargest_values": (
+        lambda: CHAINED.nlargest_values(10),
+        lambda: nlargest(10, MAPPING.values()),
+    ),
+    "nsmallest_items": (
+        lambda: CHAINED.nsmallest_items(10),
+        lambda: nsmallest(10, MAPPING.items()),
+    ),
+    "nsmallest_keys": (
+        lambda: CHAINED.nsmallest_keys(10),
+        lambda: nsmallest(10, MAPPING),
+    ),
+    "nsmallest_values": (
+        lambda: CHAINED.nsmallest_values(10),
+        lambda: nsmallest(10, MAPPING.values()),
+    ),
+    "set_items": (lambda: CHAINED.set_items(), lambda: set(MAPPING.items())),
+    "set_keys": (lambda: CHAINED.set_keys(), lambda: set(MAPPING)),
+    "set_values": (
+        lambda: CHAINED.set_values(),
+        lambda: set(MAPPING.values()),
+    ),
+    "values": (lambda: iter(CHAINED.values()), lambda: iter(MAPPING.values()),),
+}
+
+
+def _run(func: Callable[[], Any]) -> None:
+    result = func()
+    if isinstance(result, Iterator):
+        consume(result)
+
+
+@mark.parametrize("name", sorted(CASES))
+@mark.parametrize("kind", ["chained", "bare"])
+def test_overhead(benchmark: Any, name: str, kind: str) -> None:
+    benchmark.group = f"mapping overhead: {name}"
+    chained, bare = CASES[name]
+    benchmark(_run, chained if kind == "chained" else bare)
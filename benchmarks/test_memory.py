@@ -0,0 +1,63 @@
+from tracemalloc import get_traced_memory
+from tracemalloc import start
+from tracemalloc import stop
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+from more_itertools import consume
+from pytest import mark
+
+from chained_iterable import ChainedIterable
+
+
+NUM_ELEMENTS = 100_000
+
+
+def _peak(func: Callable[[], Any]) -> int:
+    start()
+    try:
+        func()
+        _, peak = get_traced_memory()
+    finally:
+        stop()
+    return peak
+
+
+def _source() -> ChainedIterable[int]:
+    # a generator, so that only the method under test holds elements
+    return ChainedIterable(iter(range(NUM_ELEMENTS)))
+
+
+CASES: Dict[str, Callable[[], Any]] = {
+    "cache": lambda: _source().cache().list(),
+    "cache(compact)": lambda: consume(_source().cache(compact=True)),
+    "cache(max_items)": lambda: consume(_source().cache(max_items=1_000)),
+    "eq": lambda: _source() == iter(range(NUM_ELEMENTS)),
+    "external_sorted": lambda: consume(
+        _source().external_sorted(run_size=10_000),
+    ),
+    "len": lambda: _source().len(),
+    "list": lambda: _source().list(),
+    "sorted": lambda: _source().sorted(),
+    "sorted(limit)": lambda: _source().sorted(limit=10),
+}
+
+
+# streaming methods whose peak must not grow with the input
+CONSTANT_MEMORY = {"eq", "len", "sorted(limit)"}
+
+
+@mark.parametrize("name", sorted(CASES))
+def test_memory_peak(benchmark: Any, name: str) -> None:
+    benchmark.group = "memory peak"
+    func = CASES[name]
+    peak = _peak(func)
+    benchmark.extra_info["peak_bytes"] = peak
+    if name in CONSTANT_MEMORY:
+        assert peak < 64 * 1024
+    benchmark(func)
+
+
+def test_compact_cache_is_smaller() -> None:
+    assert 2 * _peak(CASES["cache(compact)"]) < _peak(CASES["cache"])
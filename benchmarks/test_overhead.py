@@ -0,0 +1,329 @@
+from functools import reduce
+from heapq import nlargest
+from heapq import nsmallest
+from itertools import accumulate
+from itertools import chain
+from itertools import combinations
+from itertools import combinations_with_replacement
+from itertools import compress
+from itertools import count
+from itertools import cycle
+from itertools import dropwhile
+from itertools import filterfalse
+from itertools import groupby
+from itertools import islice
+from itertools import permutations
+from itertools import product
+from itertools import repeat
+from itertools import starmap
+from itertools import tee
+from itertools import zip_longest
+from operator import add
+from operator import mod
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Tuple
+
+from more_itertools import all_equal
+from more_itertools import consume
+from more_itertools import dotproduct
+from more_itertools import first_true
+from more_itertools import flatten
+from more_itertools import grouper
+from more_itertools import ncycles
+from more_itertools import nth
+from more_itertools import padnone
+from more_itertools import pairwise
+from more_itertools import partition
+from more_itertools import powerset
+from more_itertools import prepend
+from more_itertools import quantify
+from more_itertools import roundrobin
+from more_itertools import tabulate
+from more_itertools import tail
+from more_itertools import take
+from more_itertools import unique_everseen
+from more_itertools import unique_justseen
+from pytest import mark
+
+from chained_iterable import ChainedIterable
+
+
+NUM_ELEMENTS = 100_000
+DATA = list(range(NUM_ELEMENTS))
+PAIRS = list(zip(DATA, DATA))
+# inputs to the combinatoric methods, whose outputs grow much faster
+SMALL = list(range(8))
+
+
+def _increment(x: int) -> int:
+    return x + 1
+
+
+def _is_even(x: int) -> bool:
+    return mod(x, 2) == 0
+
+
+def _is_big(x: int) -> bool:
+    return x >= NUM_ELEMENTS - 1
+
+
+def _is_small(x: int) -> bool:
+    return x < NUM_ELEMENTS // 2
+
+
+# each case pairs a chained call with the bare call it wraps
+Case = Tuple[Callable[[], Any], Callable[[], Any]]
+CASES: Dict[str, Case] = {
+    "all_equal": (
+        lambda: ChainedIterable(DATA).all_equal(),
+        lambda: all_equal(DATA),
+    ),
+    "combinations": (
+        lambda: ChainedIterable(SMALL).combinations(4),
+        lambda: combinations(SMALL, 4),
+    ),
+    "combinations_with_replacement": (
+        lambda: ChainedIterable(SMALL).combinations_with_replacement(4),
+        lambda: combinations_with_replacement(SMALL, 4),
+    ),
+    "compress": (
+        lambda: ChainedIterable(DATA).compress(DATA),
+        lambda: compress(DATA, DATA),
+    ),
+    "consume": (
+        lambda: ChainedIterable(iter(DATA)).consume(),
+        lambda: consume(iter(DATA)),
+    ),
+    "count": (
+        lambda: islice(ChainedIterable.count(), NUM_ELEMENTS),
+        lambda: islice(count(), NUM_ELEMENTS),
+    ),
+    "cycle": (
+        lambda: ChainedIterable(SMALL).cycle().take(NUM_ELEMENTS),
+        lambda: take(NUM_ELEMENTS, cycle(SMALL)),
+    ),
+    "dotproduct": (
+        lambda: ChainedIterable(DATA).dotproduct(DATA),
+        lambda: dotproduct(DATA, DATA),
+    ),
+    "filterfalse": (
+        lambda: ChainedIterable(DATA).filterfalse(_is_even),
+        lambda: filterfalse(_is_even, DATA),
+    ),
+    "first_true": (
+        lambda: ChainedIterable(DATA).first_true(pred=_is_big),
+        lambda: first_true(DATA, pred=_is_big),
+    ),
+    "flatten": (
+        lambda: ChainedIterable(PAIRS).flatten(),
+        lambda: flatten(PAIRS),
+    ),
+    "frozenset": (
+        lambda: ChainedIterable(DATA).frozenset(),
+        lambda: frozenset(DATA),
+    ),
+    "grouper": (
+        lambda: ChainedIterable(DATA).grouper(3),
+        lambda: grouper(DATA, 3),
+    ),
+    "last": (lambda: ChainedIterable(DATA).last(), lambda: DATA[-1]),
+    "ncycles": (
+        lambda: ChainedIterable(DATA).ncycles(2),
+        lambda: ncycles(DATA, 2),
+    ),
+    "nlargest": (
+        lambda: ChainedIterable(DATA).nlargest(10),
+        lambda: nlargest(10, DATA),
+    ),
+    "nsmallest": (
+        lambda: ChainedIterable(DATA).nsmallest(10),
+        lambda: nsmallest(10, DATA),
+    ),
+    "nth": (
+        lambda: ChainedIterable(iter(DATA)).nth(NUM_ELEMENTS - 1),
+        lambda: nth(iter(DATA), NUM_ELEMENTS - 1),
+    ),
+    "padnone": (
+        lambda: ChainedIterable(DATA).padnone().take(NUM_ELEMENTS),
+        lambda: take(NUM_ELEMENTS, padnone(DATA)),
+    ),
+    "partition": (
+        lambda: ChainedIterable(DATA).partition(_is_even),
+        lambda: partition(_is_even, DATA),
+    ),
+    "permutations": (
+        lambda: ChainedIterable(SMALL).permutations(),
+        lambda: permutations(SMALL),
+    ),
+    "powerset": (
+        lambda: ChainedIterable(SMALL).powerset(),
+        lambda: powerset(SMALL),
+    ),
+    "prepend": (
+        lambda: ChainedIterable(DATA).prepend(-1),
+        lambda: prepend(-1, DATA),
+    ),
+    "product": (
+        lambda: ChainedIterable(SMALL).product(SMALL, SMALL),
+        lambda: product(SMALL, SMALL, SMALL),
+    ),
+    "quantify": (
+        lambda: ChainedIterable(DATA).quantify(_is_even),
+        lambda: quantify(DATA, _is_even),
+    ),
+    "range": (
+        lambda: ChainedIterable.range(NUM_ELEMENTS),
+        lambda: range(NUM_ELEMENTS),
+    ),
+    "repeat": (
+        lambda: ChainedIterable.repeat(0, times=NUM_ELEMENTS),
+        lambda: repeat(0, NUM_ELEMENTS),
+    ),
+    "reversed": (
+        lambda: ChainedIterable(DATA).reversed(),
+        lambda: reversed(DATA),
+    ),
+    "roundrobin": (
+        lambda: ChainedIterable(DATA).roundrobin(DATA),
+        lambda: roundrobin(DATA, DATA),
+    ),
+    "tabulate": (
+        lambda: ChainedIterable.tabulate(_increment).take(NUM_ELEMENTS),
+        lambda: take(NUM_ELEMENTS, tabulate(_increment)),
+    ),
+    "tail": (
+        lambda: ChainedIterable(iter(DATA)).tail(10),
+        lambda: tail(10, iter(DATA)),
+    ),
+    "take": (
+        lambda: ChainedIterable(DATA).take(NUM_ELEMENTS // 2),
+        lambda: take(NUM_ELEMENTS // 2, DATA),
+    ),
+    "tee": (lambda: ChainedIterable(DATA).tee(), lambda: tee(DATA),),
+    "unique_justseen": (
+        lambda: ChainedIterable(DATA).unique_justseen(),
+        lambda: unique_justseen(DATA),
+    ),
+    "zip_longest": (
+        lambda: ChainedIterable(DATA).zip_longest(SMALL),
+        lambda: zip_longest(DATA, SMALL),
+    ),
+    "accumulate": (
+        lambda: ChainedIterable(iter(DATA)).accumulate(),
+        lambda: accumulate(iter(DATA)),
+    ),
+    "all": (lambda: ChainedIterable(DATA).all(), lambda: all(DATA)),
+    "any": (lambda: ChainedIterable(DATA).any(), lambda: any(DATA)),
+    "chain": (
+        lambda: ChainedIterable(iter(DATA)).chain(DATA),
+        lambda: chain(iter(DATA), DATA),
+    ),
+    "dict": (lambda: ChainedIterable(PAIRS).dict(), lambda: dict(PAIRS)),
+    "dropwhile": (
+        lambda: ChainedIterable(DATA).dropwhile(_is_small),
+        lambda: dropwhile(_is_small, DATA),
+    ),
+    "enumerate": (
+        lambda: ChainedIterable(iter(DATA)).enumerate(),
+        lambda: enumerate(iter(DATA)),
+    ),
+    "filter": (
+        lambda: ChainedIterable(DATA).filter(_is_even),
+        lambda: filter(_is_even, DATA),
+    ),
+    "first": (lambda: ChainedIterable(DATA).first(), lambda: next(iter(DATA))),
+    "groupby": (
+        lambda: ChainedIterable(DATA).groupby(_is_even),
+        lambda: groupby(DATA, _is_even),
+    ),
+    "islice": (
+        lambda: ChainedIterable(iter(DATA)).islice(10, None, 2),
+        lambda: islice(iter(DATA), 10, None, 2),
+    ),
+    "len": (
+        lambda: ChainedIterable(iter(DATA)).len(),
+        lambda: sum(1 for _ in iter(DATA)),
+    ),
+    "list": (lambda: ChainedIterable(DATA).list(), lambda: list(DATA)),
+    "map": (
+        lambda: ChainedIterable(iter(DATA)).map(_increment),
+        lambda: map(_increment, iter(DATA)),
+    ),
+    "max": (lambda: ChainedIterable(DATA).max(), lambda: max(DATA)),
+    "min": (lambda: ChainedIterable(DATA).min(), lambda: min(DATA)),
+    "pairwise": (
+        lambda: ChainedIterable(DATA).pairwise(),
+        lambda: pairwise(DATA),
+    ),
+    "reduce": (
+        lambda: ChainedIterable(DATA).reduce(add),
+        lambda: reduce(add, DATA),
+    ),
+    "set": (lambda: ChainedIterable(DATA).set(), lambda: set(DATA)),
+    "sorted": (
+        lambda: ChainedIterable(DATA).sorted(reverse=True),
+        lambda: sorted(DATA, reverse=True),
+    ),
+    "starmap": (
+        lambda: ChainedIterable(PAIRS).starmap(add),
+        lambda: starmap(add, PAIRS),
+    ),
+    "sum": (lambda: ChainedIterable(DATA).sum(), lambda: sum(DATA)),
+    "tuple": (lambda: ChainedIterable(DATA).tuple(), lambda: tuple(DATA)),
+    "unique_everseen": (
+        lambda: ChainedIterable(DATA).unique_everseen(),
+        lambda: unique_everseen(DATA),
+    ),
+    "zip": (lambda: ChainedIterable(DATA).zip(DATA), lambda: zip(DATA, DATA),),
+}
+
+
+def _run(func: Callable[[], Any]) -> None:
+    result = func()
+    if isinstance(result, (ChainedIterable, Iterator)):
+        consume(result)
+
+
+@mark.parametrize("name", sorted(CASES))
+@mark.parametrize("kind", ["chained", "bare"])
+def test_overhead(benchmark: Any, name: str, kind: str) -> None:
+    benchmark.group = f"overhead: {name}"
+    chained, bare = CASES[name]
+    benchmark(_run, chained if kind == "chained" else bare)
+
+
+@mark.parametrize("depth", [1, 4, 16, 64])
+def test_pipe_depth(benchmark: Any, depth: int) -> None:
+    # a short source isolates the per-stage construction cost of a method
+    benchmark.group = "pipe depth"
+
+    def build() -> Iterable[int]:
+        iterable = ChainedIterable(iter(range(10)))
+        for _ in range(depth):
+            iterable = iterable.map(_increment)
+        return iterable
+
+    benchmark(_run, build)
+
+
+SOURCES: Dict[str, Callable[[], Iterable[int]]] = {
+    "raw": lambda: DATA,
+    "chained": lambda: ChainedIterable(DATA),
+    "nested": lambda: ChainedIterable(ChainedIterable(ChainedIterable(DATA))),
+}
+
+
+@mark.parametrize("name", list(SOURCES))
+def test_iteration(benchmark: Any, name: str) -> None:
+    benchmark.group = "iteration"
+    iterable = SOURCES[name]()
+
+    def loop() -> None:
+        for _ in iterable:
+            pass
+
+    benchmark(loop)
@@ -1,9 +1,20 @@
 """Python iterables in a functional-programming style."""
+from chained_iterable.async_chained_iterable import AsyncChainedIterable
 from chained_iterable.chained_iterable import ChainedIterable
 from chained_iterable.chained_iterable import ChainedMapping
 from chained_iterable.errors import EmptyIterableError
 from chained_iterable.errors import MultipleElementsError
+from chained_iterable.profiling import Profiler
+from chained_iterable.profiling import StageStats
 
 
 __version__ = "0.5.2"
-_ = {ChainedIterable, ChainedMapping, EmptyIterableError, MultipleElementsError}
+_ = {
+    AsyncChainedIterable,
+    ChainedIterable,
+    ChainedMapping,
+    EmptyIterableError,
+    MultipleElementsError,
+    Profiler,
+    StageStats,
+}
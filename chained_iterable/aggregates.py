@@ -0,0 +1,143 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Mapping
+from typing import Tuple
+from typing import Union
+
+from chained_iterable.errors import EmptyIterableError
+from chained_iterable.sketches import HyperLogLog
+from chained_iterable.sketches import Welford
+from chained_iterable.utilities import sentinel
+
+
+class Count:
+    __slots__ = ("_count",)
+
+    def __init__(self) -> None:
+        self._count = 0
+
+    def update(self, x: Any) -> None:
+        self._count += 1
+
+    def result(self) -> int:
+        return self._count
+
+
+class Fold:
+    """A reducer from a binary function and an initial value."""
+
+    __slots__ = ("_func", "_value")
+
+    def __init__(self, func: Callable[[Any, Any], Any], initial: Any) -> None:
+        self._func = func
+        self._value = initial
+
+    def update(self, x: Any) -> None:
+        self._value = self._func(self._value, x)
+
+    def result(self) -> Any:
+        return self._value
+
+
+class Max:
+    __slots__ = ("_value",)
+
+    def __init__(self) -> None:
+        self._value: Any = sentinel
+
+    def update(self, x: Any) -> None:
+        if self._value is sentinel or x > self._value:
+            self._value = x
+
+    def result(self) -> Any:
+        if self._value is sentinel:
+            raise EmptyIterableError
+        return self._value
+
+
+class Mean(Welford):
+    __slots__ = ()
+
+    def result(self) -> float:
+        return self.mean
+
+
+class Min(Max):
+    __slots__ = ()
+
+    def update(self, x: Any) -> None:
+        if self._value is sentinel or x < self._value:
+            self._value = x
+
+
+class Std(Welford):
+    __slots__ = ()
+
+    def result(self) -> float:
+        return self.std
+
+
+class Sum:
+    __slots__ = ("_total",)
+
+    def __init__(self) -> None:
+        self._total: Any = 0
+
+    def update(self, x: Any) -> None:
+        self._total += x
+
+    def result(self) -> Any:
+        return self._total
+
+
+class Var(Welford):
+    __slots__ = ()
+
+    def result(self) -> float:
+        return self.variance
+
+
+# a reducer is any object with `update(x)` and `result()`, such as a
+# P2Quantile; these are the ones which can be named
+REDUCERS = {
+    "count": Count,
+    "distinct": HyperLogLog,
+    "max": Max,
+    "mean": Mean,
+    "min": Min,
+    "std": Std,
+    "sum": Sum,
+    "var": Var,
+}
+DESCRIBE = ("count", "distinct", "max", "mean", "min", "std", "sum")
+Spec = Union[str, Tuple[Callable[[Any, Any], Any], Any], Any]
+
+
+def make_reducer(spec: Spec) -> Any:
+    if isinstance(spec, str):
+        try:
+            return REDUCERS[spec]()
+        except KeyError:
+            raise ValueError(
+                f"Expected a reducer in {sorted(REDUCERS)}; got {spec!r}",
+            )
+    elif isinstance(spec, tuple):
+        return Fold(*spec)
+    elif hasattr(spec, "update") and hasattr(spec, "result"):
+        return spec
+    else:
+        raise TypeError(
+            "Expected a reducer name, a (func, initial) pair or an object "
+            f"with update and result; got {spec!r}",
+        )
+
+
+def aggregate(iterable: Iterable[Any], specs: Mapping[str, Spec]) -> Dict:
+    reducers = {name: make_reducer(spec) for name, spec in specs.items()}
+    updates = [reducer.update for reducer in reducers.values()]
+    for x in iterable:
+        for update in updates:
+            update(x)
+    return {name: reducer.result() for name, reducer in reducers.items()}
@@ -0,0 +1,406 @@
+from asyncio import ensure_future
+from asyncio import Future
+from collections import deque
+from inspect import isawaitable
+from itertools import count
+from itertools import islice as islice_
+from operator import gt
+from operator import lt
+from typing import Any
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import Callable
+from typing import cast
+from typing import Deque
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
+from typing import Union
+
+from chained_iterable.errors import EmptyIterableError
+from chained_iterable.utilities import last_helper
+from chained_iterable.utilities import Sentinel
+from chained_iterable.utilities import sentinel
+
+
+_T = TypeVar("_T")
+_U = TypeVar("_U")
+AnyIterable = Union[AsyncIterable[_T], Iterable[_T]]
+
+
+# helpers
+
+
+async def _apply(func: Callable[..., Any], *args: Any) -> Any:
+    result = func(*args)
+    if isawaitable(result):
+        return await result
+    else:
+        return result
+
+
+async def _extremum(
+    iterable: AsyncIterable[_T],
+    key: Optional[Callable[[_T], Any]],
+    default: Union[_T, Sentinel],
+    better: Callable[[Any, Any], bool],
+    name: str,
+) -> _T:
+    # a running fold, so that the stream isn't buffered; as with the
+    # built-ins, the first of several extreme elements wins
+    best: Any = sentinel
+    best_key = None
+    async for x in iterable:
+        k = x if key is None else key(x)
+        if best is sentinel or better(k, best_key):
+            best, best_key = x, k
+    if best is not sentinel:
+        return best
+    elif default is not sentinel:
+        return default  # type: ignore
+    else:
+        raise ValueError(f"{name}() arg is an empty sequence")
+
+
+async def _from_iterable(iterable: Iterable[_T]) -> AsyncIterator[_T]:
+    for x in iterable:
+        yield x
+
+
+def to_async_iterator(iterable: AnyIterable[_T]) -> AsyncIterator[_T]:
+    if isinstance(iterable, AsyncIterable):
+        return iterable.__aiter__()
+    else:
+        return _from_iterable(iterable).__aiter__()
+
+
+# stages
+
+
+async def batched(iterable: AnyIterable[_T], n: int) -> AsyncIterator[List[_T]]:
+    batch: List[_T] = []
+    async for x in to_async_iterator(iterable):
+        batch.append(x)
+        if len(batch) == n:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def chain(*iterables: AnyIterable[_T]) -> AsyncIterator[_T]:
+    for iterable in iterables:
+        async for x in to_async_iterator(iterable):
+            yield x
+
+
+async def enumerate_(
+    iterable: AnyIterable[_T], start: int = 0,
+) -> AsyncIterator[Tuple[int, _T]]:
+    counter = count(start)
+    async for x in to_async_iterator(iterable):
+        yield next(counter), x
+
+
+async def filter_(
+    func: Optional[Callable[[_T], Any]], iterable: AnyIterable[_T],
+) -> AsyncIterator[_T]:
+    async for x in to_async_iterator(iterable):
+        keep = x if func is None else await _apply(func, x)
+        if keep:
+            yield x
+
+
+async def groupby(
+    iterable: AnyIterable[_T], key: Optional[Callable[[_T], Any]] = None,
+) -> AsyncIterator[Tuple[Any, List[_T]]]:
+    group: List[_T] = []
+    current: Any = sentinel
+    async for x in to_async_iterator(iterable):
+        k = x if key is None else await _apply(key, x)
+        if group and k != current:
+            yield current, group
+            group = []
+        current = k
+        group.append(x)
+    if group:
+        yield current, group
+
+
+async def islice(
+    iterable: AnyIterable[_T], *args: Optional[int],
+) -> AsyncIterator[_T]:
+    slice_ = slice(*args)
+    start, stop, step = slice_.start or 0, slice_.stop, slice_.step or 1
+    if stop is None:
+        indices: Iterator[int] = count(start, step)
+    else:
+        indices = iter(range(start, stop, step))
+    next_index = next(indices, None)
+    if next_index is None:
+        return
+    i = 0
+    async for x in to_async_iterator(iterable):
+        if i == next_index:
+            yield x
+            next_index = next(indices, None)
+            if next_index is None:
+                return
+        i += 1
+
+
+async def map_(
+    func: Callable[..., Any], iterable: AnyIterable[Any], concurrency: int = 1,
+) -> AsyncIterator[Any]:
+    if concurrency == 1:
+        async for x in to_async_iterator(iterable):
+            yield await _apply(func, x)
+        return
+    pending: Deque[Future] = deque()
+    try:
+        async for x in to_async_iterator(iterable):
+            pending.append(ensure_future(_apply(func, x)))
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def starmap(
+    func: Callable[..., _U], iterable: AnyIterable[Tuple],
+) -> AsyncIterator[_U]:
+    async for args in to_async_iterator(iterable):
+        yield await _apply(func, *args)
+
+
+async def takewhile(
+    func: Callable[[_T], Any], iterable: AnyIterable[_T],
+) -> AsyncIterator[_T]:
+    async for x in to_async_iterator(iterable):
+        if await _apply(func, x):
+            yield x
+        else:
+            return
+
+
+class AsyncChainedIterable(AsyncIterable[_T]):
+    __slots__ = ("_iterable",)
+
+    def __init__(self, iterable: AnyIterable[_T]) -> None:
+        if isinstance(iterable, AsyncIterable):
+            self._iterable: AnyIterable[_T] = iterable
+        else:
+            try:
+                iter(iterable)
+            except TypeError as error:
+                (msg,) = error.args
+                raise TypeError(
+                    f"{type(self).__name__} expected an iterable or "
+                    f"async iterable, but {msg}",
+                )
+            else:
+                self._iterable = iterable
+
+    def __aiter__(self) -> AsyncIterator[_T]:
+        return to_async_iterator(self._iterable)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._iterable!r})"
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}({self._iterable})"
+
+    # built-in
+
+    async def all(self) -> bool:
+        async for x in self:
+            if not x:
+                return False
+        return True
+
+    async def any(self) -> bool:
+        async for x in self:
+            if x:
+                return True
+        return False
+
+    async def dict(self: "AsyncChainedIterable[Tuple[_T, _U]]") -> Dict[_T, _U]:
+        return dict(await self.list())
+
+    def enumerate(
+        self, start: int = 0,
+    ) -> "AsyncChainedIterable[Tuple[int, _T]]":
+        return self.pipe(enumerate_, start=start, index=0)
+
+    def filter(
+        self, func: Optional[Callable[[_T], Any]],
+    ) -> "AsyncChainedIterable[_T]":
+        return self.pipe(filter_, func, index=1)
+
+    async def frozenset(self) -> FrozenSet[_T]:
+        return frozenset(await self.list())
+
+    async def list(self) -> List[_T]:
+        return [x async for x in self]
+
+    def map(
+        self, func: Callable[[_T], _U], *, concurrency: int = 1,
+    ) -> "AsyncChainedIterable[_U]":
+        if concurrency < 1:
+            raise ValueError(
+                f"Expected a positive concurrency; got {concurrency}",
+            )
+        return self.pipe(map_, func, concurrency=concurrency, index=1)
+
+    async def max(
+        self,
+        *,
+        key: Optional[Callable[[_T], Any]] = None,
+        default: Union[_T, Sentinel] = sentinel,
+    ) -> _T:
+        return await _extremum(self, key, default, gt, "max")
+
+    async def min(
+        self,
+        *,
+        key: Optional[Callable[[_T], Any]] = None,
+        default: Union[_T, Sentinel] = sentinel,
+    ) -> _T:
+        return await _extremum(self, key, default, lt, "min")
+
+    @classmethod
+    def range(
+        cls: Type["AsyncChainedIterable"],
+        start: int,
+        stop: Union[int, Sentinel] = sentinel,
+        step: Union[int, Sentinel] = sentinel,
+    ) -> "AsyncChainedIterable[int]":
+        if stop is sentinel:
+            args: Tuple[Any, ...] = ()
+        elif step is sentinel:
+            args = (stop,)
+        else:
+            args = (stop, step)
+        return cls(range(start, *args))
+
+    async def set(self) -> Set[_T]:
+        return set(await self.list())
+
+    async def sorted(
+        self,
+        *,
+        key: Optional[Callable[[_T], Any]] = None,
+        reverse: bool = False,
+    ) -> List[_T]:
+        items: List[Any] = await self.list()
+        return sorted(items, key=key, reverse=reverse)
+
+    async def sum(self, start: Union[_T, int] = 0) -> Union[_T, int]:
+        total = start
+        async for x in self:
+            total = total + x  # type: ignore
+        return total
+
+    async def tuple(self) -> Tuple[_T, ...]:
+        return tuple(await self.list())
+
+    # extra public methods
+
+    def batched(self, n: int) -> "AsyncChainedIterable[List[_T]]":
+        if n < 1:
+            raise ValueError(f"Expected a positive batch size; got {n}")
+        return self.pipe(batched, n, index=0)
+
+    async def first(self) -> _T:
+        async for x in self:
+            return x
+        raise EmptyIterableError
+
+    async def last(self) -> _T:
+        return await self.reduce(last_helper)
+
+    async def len(self) -> int:
+        n = 0
+        async for _ in self:
+            n += 1
+        return n
+
+    def pipe(
+        self,
+        func: Callable[..., AnyIterable[_U]],
+        *args: Any,
+        index: int = 0,
+        **kwargs: Any,
+    ) -> "AsyncChainedIterable[_U]":
+        new_args = (*args[:index], self._iterable, *args[index:])
+        cls = cast(Type[AsyncChainedIterable[_U]], type(self))
+        return cls(func(*new_args, **kwargs))
+
+    # functools
+
+    async def reduce(
+        self,
+        func: Callable[[Any, _T], Any],
+        initial: Union[_U, Sentinel] = sentinel,
+    ) -> Any:
+        iterator = self.__aiter__()
+        if initial is sentinel:
+            try:
+                result: Any = await iterator.__anext__()
+            except StopAsyncIteration:
+                raise EmptyIterableError from None
+        else:
+            result = initial
+        async for x in iterator:
+            result = await _apply(func, result, x)
+        return result
+
+    # itertools
+
+    def chain(
+        self, *iterables: AnyIterable[_U],
+    ) -> "AsyncChainedIterable[Union[_T, _U]]":
+        return self.pipe(chain, *iterables, index=0)
+
+    def groupby(
+        self, key: Optional[Callable[[_T], Any]] = None,
+    ) -> "AsyncChainedIterable[Tuple[Any, List[_T]]]":
+        return self.pipe(groupby, key=key, index=0)
+
+    def islice(
+        self,
+        start: int,
+        stop: Union[int, Sentinel] = sentinel,
+        step: Union[int, Sentinel] = sentinel,
+    ) -> "AsyncChainedIterable[_T]":
+        if stop is sentinel:
+            args: Tuple[Any, ...] = ()
+        elif step is sentinel:
+            args = (stop,)
+        else:
+            args = (stop, step)
+        islice_((), start, *args)  # validate the arguments as itertools does
+        return self.pipe(islice, start, *args, index=0)
+
+    def starmap(self, func: Callable[..., _U]) -> "AsyncChainedIterable[_U]":
+        return self.pipe(starmap, func, index=1)
+
+    def takewhile(
+        self, func: Callable[[_T], Any],
+    ) -> "AsyncChainedIterable[_T]":
+        return self.pipe(takewhile, func, index=1)
+
+    # itertools-recipes
+
+    def take(self, n: int) -> "AsyncChainedIterable[_T]":
+        return self.islice(n)
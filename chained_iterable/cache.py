@@ -0,0 +1,217 @@
+from array import array
+from io import SEEK_END
+from itertools import chain
+from itertools import islice
+from pickle import dump
+from pickle import HIGHEST_PROTOCOL
+from pickle import load
+from sys import getsizeof
+from sys import maxsize
+from tempfile import TemporaryFile
+from threading import RLock
+from typing import Any
+from typing import Generic
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import TypeVar
+from typing import Union
+
+
+_T = TypeVar("_T")
+
+
+# typecodes for streams holding only (exact) ints or only floats
+COMPACT_TYPECODES = {int: "q", float: "d"}
+COMPACT_KINDS = {typecode: kind for kind, typecode in COMPACT_TYPECODES.items()}
+
+
+def compact_typecode(x: Any) -> str:
+    try:
+        return COMPACT_TYPECODES[type(x)]
+    except KeyError:
+        raise TypeError(
+            f"Expected an int or float; got a(n) {type(x).__name__}",
+        ) from None
+
+
+def check_compact(kind: type, x: Any) -> None:
+    if type(x) is not kind:
+        raise TypeError(
+            f"Expected only {kind.__name__}s; got a(n) {type(x).__name__}",
+        )
+    elif isinstance(x, int) and not -(2 ** 63) <= x < 2 ** 63:
+        raise OverflowError(f"Expected only ints within 64 bits; got {x}")
+
+
+def compact_array(
+    iterable: Iterable[Any], typecode: Optional[str] = None,
+) -> array:
+    if typecode is not None:
+        return array(typecode, iterable)
+    iterator = iter(iterable)
+    for first in iterator:
+        out = array(compact_typecode(first))
+        kind = type(first)
+        for x in chain([first], iterator):
+            check_compact(kind, x)
+            out.append(x)
+        return out
+    return array("q")
+
+
+class SpillFile(Generic[_T]):
+    """An append-only temporary file of pickled elements."""
+
+    __slots__ = ("_file", "_offsets")
+
+    def __init__(self) -> None:
+        self._file = TemporaryFile()
+        self._offsets = array("q")
+
+    def __getitem__(self, index: int) -> _T:
+        self._file.seek(self._offsets[index])
+        return load(self._file)
+
+    def __iter__(self) -> Iterator[_T]:
+        position = 0
+        for _ in range(len(self)):
+            self._file.seek(position)
+            x = load(self._file)
+            position = self._file.tell()
+            yield x
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def append(self, x: _T) -> None:
+        self._offsets.append(self._file.seek(0, SEEK_END))
+        dump(x, self._file, protocol=HIGHEST_PROTOCOL)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class Cache(Iterable[_T]):
+    """A lazily-filled, replayable cache which spills to disk when full.
+
+    Elements are kept in memory until either `max_items` elements or
+    `max_bytes` bytes (as measured by `sys.getsizeof`) are held; all later
+    elements are pickled to a temporary file. With `compact`, the in-memory
+    elements are unboxed into an `array.array`.
+    """
+
+    __slots__ = (
+        "_compact",
+        "_iterator",
+        "_lock",
+        "_max_bytes",
+        "_max_items",
+        "_memory",
+        "_num_bytes",
+        "_spill",
+    )
+
+    def __init__(
+        self,
+        iterable: Iterable[_T],
+        *,
+        max_items: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        compact: bool = False,
+    ) -> None:
+        self._compact = compact
+        self._iterator: Optional[Iterator[_T]] = iter(iterable)
+        self._lock = RLock()
+        self._max_bytes = max_bytes
+        self._max_items = max_items
+        self._memory: Union[List[_T], array] = []
+        self._num_bytes = 0
+        self._spill: Optional[SpillFile[_T]] = None
+
+    def __getitem__(self, index: int) -> _T:
+        if index < 0:
+            raise IndexError(f"Expected a non-negative index; got {index}")
+        memory = self._memory
+        if index < len(memory):
+            return memory[index]
+        with self._lock:
+            self._fill(index)
+            memory = self._memory
+            if index < len(memory):
+                return memory[index]
+            elif index < self._num_cached():
+                return self._spill[index - len(memory)]  # type: ignore
+            else:
+                raise IndexError(f"{type(self).__name__} index out of range")
+
+    def __iter__(self) -> Iterator[_T]:
+        index = 0
+        while True:
+            # re-read, as a compact cache swaps in its array on first append
+            memory = self._memory
+            stop = len(memory)
+            if index < stop:
+                yield from islice(memory, index, stop)
+                index = stop
+            else:
+                try:
+                    x = self[index]
+                except IndexError:
+                    return
+                yield x
+                index += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._fill(maxsize)
+            return self._num_cached()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._memory!r}, ...)"
+
+    def __reversed__(self) -> Iterator[_T]:
+        len(self)
+        spill = self._spill
+        if spill is not None:
+            for index in range(len(spill) - 1, -1, -1):
+                yield spill[index]
+        yield from reversed(self._memory)
+
+    def _fill(self, index: int) -> None:
+        while self._iterator is not None and index >= self._num_cached():
+            try:
+                x = next(self._iterator)
+            except StopIteration:
+                self._iterator = None
+                return
+            try:
+                self._append(x)
+            except Exception:
+                # keep a rejected element, so that every later read rejects it
+                self._iterator = chain([x], self._iterator)
+                raise
+
+    def _append(self, x: _T) -> None:
+        if self._spill is None:
+            if self._compact:
+                if isinstance(self._memory, list):
+                    self._memory = array(compact_typecode(x))
+                check_compact(COMPACT_KINDS[self._memory.typecode], x)
+                self._num_bytes += self._memory.itemsize
+            else:
+                self._num_bytes += getsizeof(x)
+            if (
+                self._max_items is None or len(self._memory) < self._max_items
+            ) and (
+                self._max_bytes is None or self._num_bytes <= self._max_bytes
+            ):
+                self._memory.append(x)
+                return
+            self._spill = SpillFile()
+        self._spill.append(x)
+
+    def _num_cached(self) -> int:
+        spill = self._spill
+        return len(self._memory) + (0 if spill is None else len(spill))
@@ -1,4 +1,8 @@
+from collections import Counter
+from copy import copy
 from functools import reduce
+from heapq import nlargest
+from heapq import nsmallest
 from itertools import accumulate
 from itertools import chain
 from itertools import combinations
@@ -23,17 +27,22 @@ from typing import Callable
 from typing import cast
 from typing import Dict
 from typing import FrozenSet
+from typing import Hashable
+from typing import ItemsView
 from typing import Iterable
 from typing import Iterator
+from typing import KeysView
 from typing import List
 from typing import Mapping
 from typing import Optional
 from typing import overload
 from typing import Set
+from typing import Sized
 from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union
+from typing import ValuesView
 
 from more_itertools.recipes import all_equal
 from more_itertools.recipes import consume
@@ -60,24 +69,90 @@ from more_itertools.recipes import roundrobin
 from more_itertools.recipes import tabulate
 from more_itertools.recipes import tail
 from more_itertools.recipes import take
-from more_itertools.recipes import unique_everseen
 from more_itertools.recipes import unique_justseen
 
+from chained_iterable.aggregates import aggregate
+from chained_iterable.aggregates import DESCRIBE
+from chained_iterable.aggregates import Spec
+from chained_iterable.cache import Cache
+from chained_iterable.cache import compact_array
+from chained_iterable.dedup import unique_everseen
 from chained_iterable.errors import EmptyIterableError
 from chained_iterable.errors import MultipleElementsError
 from chained_iterable.errors import UnsupportVersionError
+from chained_iterable.external_sort import external_sorted
+from chained_iterable.files import file_ranges
+from chained_iterable.files import iter_file
+from chained_iterable.files import Path
+from chained_iterable.fused import FUSIBLE
+from chained_iterable.fused import FusedPipeline
+from chained_iterable.joins import anti_join
+from chained_iterable.joins import join
+from chained_iterable.joins import left_join
+from chained_iterable.joins import merge_join
+from chained_iterable.joins import semi_join
+from chained_iterable.mapping_views import FilterItemsView
+from chained_iterable.mapping_views import FilterKeysView
+from chained_iterable.mapping_views import FilterValuesView
+from chained_iterable.mapping_views import MapItemsView
+from chained_iterable.mapping_views import MapKeysView
+from chained_iterable.mapping_views import MappingView
+from chained_iterable.mapping_views import MapValuesView
+from chained_iterable.numpy_backend import accumulate_vector
+from chained_iterable.numpy_backend import as_ufunc
+from chained_iterable.numpy_backend import filter_vector
+from chained_iterable.numpy_backend import is_vector
+from chained_iterable.numpy_backend import map_vector
+from chained_iterable.numpy_backend import max_vector
+from chained_iterable.numpy_backend import min_vector
+from chained_iterable.numpy_backend import quantify_vector
+from chained_iterable.numpy_backend import sum_vector
+from chained_iterable.numpy_backend import to_array
+from chained_iterable.parallel import ExecutorLike
+from chained_iterable.parallel import parallel_extremum
+from chained_iterable.parallel import parallel_filter
+from chained_iterable.parallel import parallel_map
+from chained_iterable.parallel import parallel_quantify
+from chained_iterable.parallel import parallel_reduce
+from chained_iterable.parallel import parallel_starmap
+from chained_iterable.parallel import parallel_sum
+from chained_iterable.profiling import ProfiledStage
+from chained_iterable.profiling import Profiler
+from chained_iterable.profiling import stage_name
+from chained_iterable.sketches import P2Quantile
+from chained_iterable.utilities import batched
 from chained_iterable.utilities import drop_sentinel
+from chained_iterable.utilities import filter_batches
+from chained_iterable.utilities import identity
 from chained_iterable.utilities import last_helper
 from chained_iterable.utilities import len_helper
+from chained_iterable.utilities import map_batches
 from chained_iterable.utilities import Sentinel
 from chained_iterable.utilities import sentinel
+from chained_iterable.utilities import SEQUENCES
 from chained_iterable.utilities import VERSION
 from chained_iterable.utilities import Version
+from chained_iterable.views import EnumerateView
+from chained_iterable.views import MapView
+from chained_iterable.views import slice_view
+from chained_iterable.windows import rolling_max
+from chained_iterable.windows import rolling_mean
+from chained_iterable.windows import rolling_min
+from chained_iterable.windows import rolling_sum
+from chained_iterable.windows import session_window
+from chained_iterable.windows import sliding_window
+from chained_iterable.windows import tumbling_window
+from chained_iterable.windows import Window
 
 
 _T = TypeVar("_T")
 _U = TypeVar("_U")
+_V = TypeVar("_V")
+_W = TypeVar("_W")
 _GroupByTU = Tuple[_U, Iterator[_T]]
+# wrappers which `pipe` must special-case; matched by exact type, as an ABC
+# `isinstance` check costs more than the rest of `pipe`
+_SPECIAL_WRAPPERS = frozenset({FusedPipeline, ProfiledStage})
 
 
 if VERSION in {Version.py36, Version.py37}:
@@ -85,7 +160,10 @@ if VERSION in {Version.py36, Version.py37}:
     def _accumulate(
         self: "ChainedIterable[_T]", func: Callable[[_T, _T], _T] = add,
     ) -> "ChainedIterable[_T]":
-        return self.pipe(accumulate, func, index=0)
+        if is_vector(self._iterable) and as_ufunc(func, 2) is not None:
+            return self._pipe(accumulate_vector, func, None, index=0)
+        else:
+            return self._pipe(accumulate, func, index=0)
 
     _max_min_key_annotation = Union[Callable[[_T], Any], Sentinel]
     _max_min_key_default = sentinel
@@ -98,7 +176,10 @@ elif VERSION is Version.py38:
         func: Callable[[_T, _T], _T] = add,
         initial: Optional[_T] = None,
     ) -> "ChainedIterable[_T]":
-        return self.pipe(accumulate, func, initial=initial, index=0)
+        if is_vector(self._iterable) and as_ufunc(func, 2) is not None:
+            return self._pipe(accumulate_vector, func, initial, index=0)
+        else:
+            return self._pipe(accumulate, func, initial=initial, index=0)
 
     _max_min_key_annotation = Optional[Callable[[_T], Any]]  # type: ignore
     _max_min_key_default = None  # type: ignore
@@ -108,10 +189,34 @@ else:
     raise UnsupportVersionError(VERSION)  # pragma: no cover
 
 
+def _extremum(
+    func: Callable[..., Any],
+    iterable: Iterable[Any],
+    key: Union[Callable[[Any], Any], Sentinel, None],
+    default: Any,
+) -> Any:
+    # before Python 3.8, max and min reject key=None; any given default is used
+    if key is None or key is sentinel:
+        if default is sentinel:
+            return func(iterable)
+        else:
+            return func(iterable, default=default)
+    elif default is sentinel:
+        return func(iterable, key=key)
+    else:
+        return func(iterable, key=key, default=default)
+
+
 class ChainedIterable(Iterable[_T]):
     __slots__ = ("_iterable",)
 
+    _iterable: Iterable[_T]
+
     def __init__(self, iterable: Iterable[_T]) -> None:
+        if isinstance(iterable, ChainedIterable):
+            # share the source rather than stacking another layer on it
+            self._iterable = iterable._iterable
+            return
         try:
             iter(iterable)
         except TypeError as error:
@@ -128,7 +233,7 @@ class ChainedIterable(Iterable[_T]):
         except TypeError:
             return False
         else:
-            return self.list() == list(other)
+            return self.equals(other)
 
     @overload  # noqa: U100
     def __getitem__(self, item: int) -> _T:
@@ -142,14 +247,23 @@ class ChainedIterable(Iterable[_T]):
         self, item: Union[int, slice],
     ) -> Union[_T, "ChainedIterable[_T]"]:
         if isinstance(item, int):
-            if item < 0:
+            if isinstance(self._iterable, SEQUENCES) or (
+                isinstance(self._iterable, Cache) and item >= 0
+            ):
+                try:
+                    return self._iterable[item]
+                except IndexError:
+                    raise IndexError(
+                        f"{type(self).__name__} index out of range",
+                    ) from None
+            elif item < 0:
                 raise IndexError(f"Expected a non-negative index; got {item}")
             elif item > maxsize:
                 raise IndexError(
                     f"Expected an index at most {maxsize}; got {item}",
                 )
             else:
-                slice_ = islice(self._iterable, item, item + 1)
+                slice_ = islice(self._iterable, item, None)
                 try:
                     return next(slice_)
                 except StopIteration:
@@ -157,14 +271,17 @@ class ChainedIterable(Iterable[_T]):
                         f"{type(self).__name__} index out of range",
                     )
         elif isinstance(item, slice):
-            return self.islice(item.start, item.stop, item.step)
+            if isinstance(self._iterable, SEQUENCES):
+                return self._pipe(slice_view, item, index=0)
+            else:
+                return self.islice(item.start, item.stop, item.step)
         else:
             raise TypeError(
                 f"Expected an int or slice; got a(n) {type(item).__name__}",
             )
 
     def __iter__(self) -> Iterator[_T]:
-        yield from self._iterable
+        return iter(self._iterable)
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self._iterable!r})"
@@ -184,12 +301,43 @@ class ChainedIterable(Iterable[_T]):
         return dict(self._iterable)
 
     def enumerate(self, start: int = 0) -> "ChainedIterable[Tuple[int, _T]]":
-        return self.pipe(enumerate, start=start, index=0)
+        if isinstance(self._iterable, SEQUENCES):
+            return self._pipe(EnumerateView, start=start, index=0)
+        else:
+            return self._pipe(enumerate, start=start, index=0)
 
     def filter(
-        self, func: Optional[Callable[[_T], bool]],
+        self,
+        func: Optional[Callable[[_T], bool]],
+        *,
+        executor: Optional[ExecutorLike] = None,
+        workers: Optional[int] = None,
+        chunksize: int = 1,
+        ordered: bool = True,
     ) -> "ChainedIterable[_T]":
-        return self.pipe(filter, func, index=1)
+        if executor is None:
+            if is_vector(self._iterable) and (
+                func is None or as_ufunc(func, 1) is not None
+            ):
+                return self._pipe(filter_vector, func, index=0)
+            else:
+                return self._pipe(filter, func, index=1)
+        else:
+            return self._pipe(
+                parallel_filter,
+                func,
+                executor=executor,
+                workers=workers,
+                chunksize=chunksize,
+                ordered=ordered,
+                index=1,
+            )
+
+    @classmethod
+    def from_array(
+        cls: Type["ChainedIterable"], array: Iterable[_T], dtype: Any = None,
+    ) -> "ChainedIterable[_T]":
+        return cls._new(to_array(array, dtype=dtype))
 
     def frozenset(self) -> FrozenSet[_T]:
         return frozenset(self._iterable)
@@ -198,27 +346,97 @@ class ChainedIterable(Iterable[_T]):
         return list(self._iterable)
 
     def map(
-        self, func: Callable[..., _U], *iterables: Iterable,
+        self,
+        func: Callable[..., _U],
+        *iterables: Iterable,
+        executor: Optional[ExecutorLike] = None,
+        workers: Optional[int] = None,
+        chunksize: int = 1,
+        ordered: bool = True,
     ) -> "ChainedIterable[_U]":
-        return self.pipe(map, func, *iterables, index=1)
+        if executor is None:
+            if (
+                is_vector(self._iterable)
+                and not iterables
+                and as_ufunc(func, 1) is not None
+            ):
+                return self._pipe(map_vector, func, index=0)
+            elif isinstance(self._iterable, SEQUENCES) and (
+                not iterables
+                or all(isinstance(x, SEQUENCES) for x in iterables)
+            ):
+                return self._pipe(MapView, func, *iterables, index=1)
+            else:
+                return self._pipe(map, func, *iterables, index=1)
+        else:
+            return self._pipe(
+                parallel_map,
+                func,
+                *iterables,
+                executor=executor,
+                workers=workers,
+                chunksize=chunksize,
+                ordered=ordered,
+                index=1,
+            )
 
     def max(
         self,
         *,
         key: _max_min_key_annotation = _max_min_key_default,
         default: Union[_T, Sentinel] = sentinel,
+        executor: Optional[ExecutorLike] = None,
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
     ) -> _T:
-        _, kwargs = drop_sentinel(key=key, default=default)
-        return max(self._iterable, **kwargs)
+        if (
+            executor is None
+            and is_vector(self._iterable)
+            and (key is None or key is sentinel)
+            and len(self._iterable)  # type: ignore
+        ):
+            return max_vector(self._iterable)
+        if executor is not None:
+            _, kwargs = drop_sentinel(key=key, default=default)
+            return parallel_extremum(
+                max,
+                self._iterable,
+                kwargs=kwargs,
+                executor=executor,
+                workers=workers,
+                chunksize=chunksize,
+            )
+        else:
+            return _extremum(max, self._iterable, key, default)
 
     def min(
         self,
         *,
         key: _max_min_key_annotation = _max_min_key_default,
         default: Union[_T, Sentinel] = sentinel,
+        executor: Optional[ExecutorLike] = None,
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
     ) -> _T:
-        _, kwargs = drop_sentinel(key=key, default=default)
-        return min(self._iterable, **kwargs)
+        if (
+            executor is None
+            and is_vector(self._iterable)
+            and (key is None or key is sentinel)
+            and len(self._iterable)  # type: ignore
+        ):
+            return min_vector(self._iterable)
+        if executor is not None:
+            _, kwargs = drop_sentinel(key=key, default=default)
+            return parallel_extremum(
+                min,
+                self._iterable,
+                kwargs=kwargs,
+                executor=executor,
+                workers=workers,
+                chunksize=chunksize,
+            )
+        else:
+            return _extremum(min, self._iterable, key, default)
 
     @classmethod
     def range(
@@ -227,11 +445,19 @@ class ChainedIterable(Iterable[_T]):
         stop: Union[int, Sentinel] = sentinel,
         step: Union[int, Sentinel] = sentinel,
     ) -> "ChainedIterable[int]":
-        args, _ = drop_sentinel(stop, step)
-        return cls(range(start, *args))
+        if stop is sentinel:
+            args: Tuple[Any, ...] = ()
+        elif step is sentinel:
+            args = (stop,)
+        else:
+            args = (stop, step)
+        return cls._new(range(start, *args))
 
     def reversed(self) -> "ChainedIterable[_T]":
-        return self.pipe(reversed, index=0)
+        if isinstance(self._iterable, SEQUENCES):
+            return self._pipe(slice_view, slice(None, None, -1), index=0)
+        else:
+            return self._pipe(reversed, index=0)
 
     def set(self) -> Set[_T]:
         return set(self._iterable)
@@ -241,23 +467,197 @@ class ChainedIterable(Iterable[_T]):
         *,
         key: Optional[Callable[[_T], Any]] = None,
         reverse: bool = False,
+        limit: Optional[int] = None,
     ) -> List[_T]:
-        return sorted(self._iterable, key=key, reverse=reverse)
+        if limit is None:
+            return sorted(self._iterable, key=key, reverse=reverse)
+        elif limit < 0:
+            raise ValueError(f"Expected a non-negative limit; got {limit}")
+        elif reverse:
+            return nlargest(limit, self._iterable, key=key)
+        else:
+            return nsmallest(limit, self._iterable, key=key)
+
+    def sum(
+        self,
+        start: Union[_T, int] = 0,
+        *,
+        executor: Optional[ExecutorLike] = None,
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+    ) -> Union[_T, int]:
+        if executor is None and is_vector(self._iterable):
+            return sum_vector(self._iterable, start)
+        elif executor is None:
+            return sum(self._iterable, start)
+        else:
+            return parallel_sum(
+                self._iterable,
+                start,
+                executor=executor,
+                workers=workers,
+                chunksize=chunksize,
+            )
 
-    def sum(self, start: Union[_T, int] = 0) -> Union[_T, int]:
-        args, _ = drop_sentinel(start)
-        return sum(self._iterable, *args)
+    def to_numpy(self, dtype: Any = None) -> Any:
+        return to_array(self._iterable, dtype=dtype)
 
     def tuple(self) -> Tuple[_T, ...]:
         return tuple(self._iterable)
 
     def zip(self, *iterables: Iterable) -> "ChainedIterable[Tuple]":
-        return self.pipe(zip, *iterables, index=0)
+        return self._pipe(zip, *iterables, index=0)
 
     # extra public methods
 
-    def cache(self) -> "ChainedIterable[_T]":
-        return self.pipe(list, index=0)
+    def anti_join(
+        self,
+        other: Union[Iterable[_U], Mapping[Any, _U]],
+        key: Optional[Callable[[_T], Any]] = None,
+        other_key: Optional[Callable[[_U], Any]] = None,
+    ) -> "ChainedIterable[_T]":
+        return self._pipe(
+            anti_join, other, key or identity, other_key or identity, index=0,
+        )
+
+    def approx_median(self) -> float:
+        return self.approx_quantile(0.5)
+
+    def approx_quantile(self, q: float) -> float:
+        estimate = P2Quantile(q)
+        for x in self._iterable:
+            estimate.update(x)  # type: ignore
+        return estimate.result()
+
+    def aggregate(self, **specs: Spec) -> "ChainedMapping[str, Any]":
+        return ChainedMapping(aggregate(self._iterable, specs))
+
+    def aggregate_by(
+        self,
+        key: Callable[[_T], _U],
+        func: Callable[[_V, Any], _V],
+        initial: _V,
+        value: Optional[Callable[[_T], Any]] = None,
+    ) -> "ChainedMapping[_U, _V]":
+        groups: Dict[_U, _V] = {}
+        for x in self._iterable:
+            k = key(x)
+            try:
+                accumulated = groups[k]
+            except KeyError:
+                # each group gets its own copy, as `func` may mutate it
+                accumulated = copy(initial)
+            groups[k] = func(accumulated, x if value is None else value(x))
+        return ChainedMapping(groups)
+
+    def array(self, typecode: Optional[str] = None) -> "ChainedIterable[_T]":
+        return self._pipe(compact_array, typecode, index=0)
+
+    def batched(self, n: int) -> "ChainedIterable[List[_T]]":
+        return self._pipe(batched, n, index=0)
+
+    def cache(
+        self,
+        *,
+        max_items: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        compact: bool = False,
+    ) -> "ChainedIterable[_T]":
+        return self._pipe(
+            Cache,
+            max_items=max_items,
+            max_bytes=max_bytes,
+            compact=compact,
+            index=0,
+        )
+
+    def count_by(
+        self, key: Optional[Callable[[_T], _U]] = None,
+    ) -> "ChainedMapping[_U, int]":
+        keys: Iterable[Any] = self._iterable
+        if key is not None:
+            keys = map(key, keys)
+        return ChainedMapping(Counter(keys))
+
+    def describe(self) -> "ChainedMapping[str, Any]":
+        return self.aggregate(**{name: name for name in DESCRIBE})
+
+    def diff(
+        self, other: Iterable[_U], key: Optional[Callable[[Any], Any]] = None,
+    ) -> Optional[Tuple[int, Union[_T, Sentinel], Union[_U, Sentinel]]]:
+        # the first mismatch as (index, left, right), with `sentinel` standing
+        # in for the missing side when one is shorter
+        pairs = zip_longest(self._iterable, other, fillvalue=sentinel)
+        for i, (x, y) in enumerate(pairs):
+            if x is y:
+                continue
+            elif (
+                x is sentinel
+                or y is sentinel
+                or (x != y if key is None else key(x) != key(y))
+            ):
+                return i, x, y
+        return None
+
+    def equals(
+        self, other: Iterable[_U], key: Optional[Callable[[Any], Any]] = None,
+    ) -> bool:
+        if isinstance(other, ChainedIterable):
+            other = other._iterable
+        if (
+            isinstance(self._iterable, Sized)
+            and isinstance(other, Sized)
+            and len(self._iterable) != len(other)
+        ):
+            return False
+        return self.diff(other, key=key) is None
+
+    def external_sorted(
+        self,
+        *,
+        key: Optional[Callable[[_T], Any]] = None,
+        reverse: bool = False,
+        run_size: int = 100_000,
+    ) -> "ChainedIterable[_T]":
+        return self._pipe(
+            external_sorted, key=key, reverse=reverse, run_size=run_size,
+        )
+
+    @classmethod
+    def file_ranges(
+        cls: Type["ChainedIterable"], path: Path, parts: int,
+    ) -> "ChainedIterable[Tuple[int, int]]":
+        return cls._new(file_ranges(path, parts))
+
+    @classmethod
+    def from_file(
+        cls: Type["ChainedIterable"],
+        path: Path,
+        mode: str = "lines",
+        *,
+        delimiter: bytes = b"\n",
+        size: Optional[int] = None,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> "ChainedIterable[memoryview]":
+        return cls._new(
+            iter_file(
+                path,
+                mode,
+                delimiter=delimiter,
+                size=size,
+                start=start,
+                stop=stop,
+            ),
+        )
+
+    def fuse(self) -> "ChainedIterable[_T]":
+        return self._pipe(FusedPipeline, index=0)
+
+    def filter_batches(
+        self, func: Callable[[List[_T]], Iterable[bool]], size: int,
+    ) -> "ChainedIterable[_T]":
+        return self._pipe(filter_batches, func, size, index=1)
 
     def first(self) -> _T:
         try:
@@ -265,21 +665,104 @@ class ChainedIterable(Iterable[_T]):
         except StopIteration:
             raise EmptyIterableError from None
 
+    def group_by_key(
+        self,
+        key: Callable[[_T], _U],
+        value: Optional[Callable[[_T], Any]] = None,
+        reduce: Optional[Callable[[Any, Any], Any]] = None,
+    ) -> "ChainedMapping[_U, Any]":
+        groups: Dict[_U, Any] = {}
+        for x in self._iterable:
+            k = key(x)
+            v = x if value is None else value(x)
+            if reduce is None:
+                groups.setdefault(k, []).append(v)
+            elif k in groups:
+                groups[k] = reduce(groups[k], v)
+            else:
+                groups[k] = v
+        return ChainedMapping(groups)
+
+    def join(
+        self,
+        other: Union[Iterable[_U], Mapping[Any, _U]],
+        key: Optional[Callable[[_T], Any]] = None,
+        other_key: Optional[Callable[[_U], Any]] = None,
+    ) -> "ChainedIterable[Tuple[_T, _U]]":
+        return self._pipe(
+            join, other, key or identity, other_key or identity, index=0,
+        )
+
     def last(self) -> _T:
-        return self.reduce(last_helper)
+        if isinstance(self._iterable, SEQUENCES):
+            if len(self._iterable) == 0:
+                raise EmptyIterableError
+            else:
+                return self._iterable[-1]
+        else:
+            return self.reduce(last_helper)
+
+    def map_batches(
+        self, func: Callable[[List[_T]], Iterable[_U]], size: int,
+    ) -> "ChainedIterable[_U]":
+        return self._pipe(map_batches, func, size, index=1)
+
+    def merge_join(
+        self,
+        other: Iterable[_U],
+        key: Optional[Callable[[_T], Any]] = None,
+        other_key: Optional[Callable[[_U], Any]] = None,
+    ) -> "ChainedIterable[Tuple[_T, _U]]":
+        return self._pipe(
+            merge_join, other, key or identity, other_key or identity, index=0,
+        )
 
     def mapping(
         self: "ChainedIterable[Tuple[_T, _U]]",
     ) -> "ChainedMapping[_T, _U]":
         return ChainedMapping(dict(self._iterable))
 
+    def left_join(
+        self,
+        other: Union[Iterable[_U], Mapping[Any, _U]],
+        key: Optional[Callable[[_T], Any]] = None,
+        other_key: Optional[Callable[[_U], Any]] = None,
+        fillvalue: _V = None,  # type: ignore
+    ) -> "ChainedIterable[Tuple[_T, Union[_U, _V]]]":
+        return self._pipe(
+            left_join,
+            other,
+            key or identity,
+            other_key or identity,
+            fillvalue,
+            index=0,
+        )
+
     def len(self) -> int:
+        if isinstance(self._iterable, Sized):
+            return len(self._iterable)
         iterable = self.enumerate(start=1).map(len_helper)
         try:
             return iterable.last()
         except EmptyIterableError:
             return 0
 
+    def memoryview(self) -> memoryview:
+        try:
+            return memoryview(self._iterable)  # type: ignore
+        except TypeError:
+            return memoryview(compact_array(self._iterable))  # type: ignore
+
+    def nlargest(
+        self, n: int, key: Optional[Callable[[_T], Any]] = None,
+    ) -> "ChainedIterable[_T]":
+        return self._pipe(nlargest, n, key=key, index=1)
+
+    def nsmallest(
+        self, n: int, key: Optional[Callable[[_T], Any]] = None,
+    ) -> "ChainedIterable[_T]":
+        return self._pipe(nsmallest, n, key=key, index=1)
+
     def one(self) -> _T:
         head: List[_T] = self.islice(2).list()
         if head:
@@ -293,6 +776,53 @@ class ChainedIterable(Iterable[_T]):
         else:
             raise EmptyIterableError
 
+    def rolling_max(self, n: int) -> "ChainedIterable[_T]":
+        return self._pipe(rolling_max, n, index=0)
+
+    def rolling_mean(self, n: int) -> "ChainedIterable[float]":
+        return self._pipe(rolling_mean, n, index=0)
+
+    def rolling_min(self, n: int) -> "ChainedIterable[_T]":
+        return self._pipe(rolling_min, n, index=0)
+
+    def rolling_sum(self, n: int) -> "ChainedIterable[_T]":
+        return self._pipe(rolling_sum, n, index=0)
+
+    def semi_join(
+        self,
+        other: Union[Iterable[_U], Mapping[Any, _U]],
+        key: Optional[Callable[[_T], Any]] = None,
+        other_key: Optional[Callable[[_U], Any]] = None,
+    ) -> "ChainedIterable[_T]":
+        return self._pipe(
+            semi_join, other, key or identity, other_key or identity, index=0,
+        )
+
+    def session_window(
+        self, gap: float, key: Callable[[_T], float], lateness: float = 0,
+    ) -> "ChainedIterable[Window]":
+        return self._pipe(session_window, gap, key, lateness=lateness, index=0)
+
+    def sliding_window(
+        self, n: int, step: int = 1,
+    ) -> "ChainedIterable[Tuple[_T, ...]]":
+        return self._pipe(sliding_window, n, step=step, index=0)
+
+    def tumbling_window(
+        self, size: float, key: Callable[[_T], float], lateness: float = 0,
+    ) -> "ChainedIterable[Window]":
+        return self._pipe(
+            tumbling_window, size, key, lateness=lateness, index=0,
+        )
+
+    def unbatch(
+        self: "ChainedIterable[Iterable[_U]]",
+    ) -> "ChainedIterable[_U]":
+        return self._pipe(chain.from_iterable, index=0)
+
+    def profile(self, profiler: Profiler) -> "ChainedIterable[_T]":
+        return self._new(profiler.wrap(self._iterable, "source"))
+
     def pipe(
         self,
         func: Callable[..., Iterable[_U]],
@@ -300,11 +830,10 @@ class ChainedIterable(Iterable[_T]):
         index: int = 0,
         **kwargs: Any,
     ) -> "ChainedIterable[_U]":
-        new_args = chain(
-            islice(args, index), [self._iterable], islice(args, index, None),
-        )
+        # unlike the built-in stages, `func` is arbitrary, so check its result
+        piped = self._pipe(func, *args, index=index, **kwargs)
         cls = cast(Type[ChainedIterable[_U]], type(self))
-        return cls(func(*new_args, **kwargs))
+        return cls(piped._iterable)
 
     # functools
 
@@ -312,10 +841,27 @@ class ChainedIterable(Iterable[_T]):
         self,
         func: Callable[[_T, _T], _T],
         initial: Union[_U, Sentinel] = sentinel,
+        *,
+        combine: Optional[Callable[[Any, Any], Any]] = None,
+        executor: Optional[ExecutorLike] = None,
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
     ) -> Any:
-        args, _ = drop_sentinel(initial)
         try:
-            return reduce(func, self._iterable, *args)
+            if executor is not None:
+                return parallel_reduce(
+                    func,
+                    self._iterable,
+                    *(() if initial is sentinel else (initial,)),
+                    combine=combine,
+                    executor=executor,
+                    workers=workers,
+                    chunksize=chunksize,
+                )
+            elif initial is sentinel:
+                return reduce(func, self._iterable)
+            else:
+                return reduce(func, self._iterable, initial)  # type: ignore
         except TypeError as error:
             (msg,) = error.args
             if msg == "reduce() of empty sequence with no initial value":
@@ -329,41 +875,41 @@ class ChainedIterable(Iterable[_T]):
     def count(
         cls: Type["ChainedIterable"], start: int = 0, step: int = 1,
     ) -> "ChainedIterable[int]":
-        return cls(count(start=start, step=step))
+        return cls._new(count(start=start, step=step))
 
     def cycle(self) -> "ChainedIterable[_T]":
-        return self.pipe(cycle, index=0)
+        return self._pipe(cycle, index=0)
 
     @classmethod
     def repeat(
         cls: Type["ChainedIterable[_T]"], x: _T, times: int,
     ) -> "ChainedIterable[_T]":
-        return cls(repeat(x, times=times))
+        return cls._new(repeat(x, times=times))
 
     accumulate = _accumulate
 
     def chain(
         self, *iterables: Iterable[_U],
     ) -> "ChainedIterable[Union[_T,_U]]":
-        return self.pipe(chain, *iterables, index=0)
+        return self._pipe(chain, *iterables, index=0)
 
     def compress(self, selectors: Iterable) -> "ChainedIterable[_T]":
-        return self.pipe(compress, selectors, index=0)
+        return self._pipe(compress, selectors, index=0)
 
     def dropwhile(
         self, func: Callable[[_T], bool],
     ) -> "ChainedIterable[Tuple[_T]]":
-        return self.pipe(dropwhile, func, index=0)
+        return self._pipe(dropwhile, func, index=1)
 
     def filterfalse(
         self, func: Callable[[_T], bool],
     ) -> "ChainedIterable[Tuple[_T]]":
-        return self.pipe(filterfalse, func, index=0)
+        return self._pipe(filterfalse, func, index=1)
 
     def groupby(
         self, key: Optional[Callable[[_T], _U]] = None,
     ) -> "ChainedIterable[_GroupByTU]":
-        return self.pipe(groupby, key=key, index=0)
+        return self._pipe(groupby, key=key, index=0)
 
     def islice(
         self,
@@ -371,54 +917,87 @@ class ChainedIterable(Iterable[_T]):
         stop: Union[int, Sentinel] = sentinel,
         step: Union[int, Sentinel] = sentinel,
     ) -> "ChainedIterable[_T]":
-        args, _ = drop_sentinel(stop, step)
-        return self.pipe(islice, start, *args, index=0)
+        if stop is sentinel:
+            args: Tuple[Any, ...] = ()
+        elif step is sentinel:
+            args = (stop,)
+        else:
+            args = (stop, step)
+        if isinstance(self._iterable, SEQUENCES) and all(
+            x is None or x >= 0 for x in (start, *args)
+        ):
+            return self._pipe(slice_view, slice(start, *args), index=0)
+        else:
+            return self._pipe(islice, start, *args, index=0)
 
-    def starmap(self, func: Callable[[Tuple], _U]) -> "ChainedIterable[_U]":
-        return self.pipe(starmap, func, index=1)
+    def starmap(
+        self,
+        func: Callable[[Tuple], _U],
+        *,
+        executor: Optional[ExecutorLike] = None,
+        workers: Optional[int] = None,
+        chunksize: int = 1,
+        ordered: bool = True,
+    ) -> "ChainedIterable[_U]":
+        if executor is None:
+            return self._pipe(starmap, func, index=1)
+        else:
+            return self._pipe(
+                parallel_starmap,
+                func,
+                executor=executor,
+                workers=workers,
+                chunksize=chunksize,
+                ordered=ordered,
+                index=1,
+            )
 
     def tee(self, n: int = 2) -> "ChainedIterable[Iterator[_T]]":
-        return self.pipe(tee, n=n, index=0)
+        return self._pipe(tee, n, index=0)
 
     def zip_longest(
         self, *iterables: Iterable, fillvalue: Any = None,
     ) -> "ChainedIterable[Iterable[Tuple]]":
-        return self.pipe(zip_longest, *iterables, fillvalue=fillvalue, index=0)
+        return self._pipe(zip_longest, *iterables, fillvalue=fillvalue, index=0)
 
     def product(
         self, *iterables: Iterable, repeat: int = 1,
     ) -> "ChainedIterable[Tuple[_T, ...]]":
-        return self.pipe(product, *iterables, repeat=repeat, index=0)
+        return self._pipe(product, *iterables, repeat=repeat, index=0)
 
     def permutations(
         self, r: Optional[int] = None,
     ) -> "ChainedIterable[Tuple[_T, ...]]":
-        return self.pipe(permutations, r=r, index=0)
+        return self._pipe(permutations, r=r, index=0)
 
     def combinations(self, r: int) -> "ChainedIterable[Tuple[_T, ...]]":
-        return self.pipe(combinations, r, index=0)
+        return self._pipe(combinations, r, index=0)
 
     def combinations_with_replacement(
         self, r: int,
     ) -> "ChainedIterable[Tuple[_T, ...]]":
-        return self.pipe(combinations_with_replacement, r, index=0)
+        return self._pipe(combinations_with_replacement, r, index=0)
 
     # itertools-recipes
 
     def take(self, n: int) -> "ChainedIterable[_T]":
-        return self.pipe(take, n, index=1)
+        return self._pipe(take, n, index=1)
 
     def prepend(self, value: _T) -> "ChainedIterable[_T]":
-        return self.pipe(prepend, value, index=1)
+        return self._pipe(prepend, value, index=1)
 
     @classmethod
     def tabulate(
         cls: Type["ChainedIterable"], func: Callable[[int], _T], start: int = 0,
     ) -> "ChainedIterable[_T]":
-        return cls(tabulate(func, start=start))
+        return cls._new(tabulate(func, start=start))
 
     def tail(self, n: int) -> "ChainedIterable[_T]":
-        return self.pipe(tail, n, index=1)
+        if isinstance(self._iterable, SEQUENCES) and n >= 0:
+            start = max(len(self._iterable) - n, 0)
+            return self._pipe(slice_view, slice(start, None), index=0)
+        else:
+            return self._pipe(tail, n, index=1)
 
     def consume(self, n: Optional[int] = None) -> "ChainedIterable[_T]":
         consume(self._iterable, n=n)
@@ -427,27 +1006,60 @@ class ChainedIterable(Iterable[_T]):
     def nth(
         self, n: int, default: Optional[_U] = None,
     ) -> Optional[Union[_T, _U]]:
-        return nth(self._iterable, n, default=default)
+        if isinstance(self._iterable, SEQUENCES) and n >= 0:
+            if n < len(self._iterable):
+                return self._iterable[n]
+            else:
+                return default
+        else:
+            return nth(self._iterable, n, default=default)
 
     def all_equal(self) -> bool:
         return all_equal(self._iterable)
 
-    def quantify(self, pred: Callable[[_T], bool] = bool) -> int:
-        return quantify(self._iterable, pred=pred)
+    def quantify(
+        self,
+        pred: Callable[[_T], bool] = bool,
+        *,
+        executor: Optional[ExecutorLike] = None,
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+    ) -> int:
+        if is_vector(self._iterable) and (
+            pred is bool or as_ufunc(pred, 1) is not None
+        ):
+            return quantify_vector(self._iterable, pred)
+        elif executor is None:
+            return quantify(self._iterable, pred=pred)
+        else:
+            return parallel_quantify(
+                pred,
+                self._iterable,
+                executor=executor,
+                workers=workers,
+                chunksize=chunksize,
+            )
 
     def padnone(self) -> "ChainedIterable[Optional[_T]]":
-        return self.pipe(padnone, index=0)
+        return self._pipe(padnone, index=0)
 
     def ncycles(self, n: int) -> "ChainedIterable[_T]":
-        return self.pipe(ncycles, n, index=0)
+        return self._pipe(ncycles, n, index=0)
 
     def dotproduct(
         self: "ChainedIterable[object]", iterable: Iterable[object],
     ) -> object:
-        return dotproduct(self._iterable, iterable)
+        if (
+            is_vector(self._iterable)
+            and is_vector(iterable)
+            and len(self._iterable) == len(iterable)  # type: ignore
+        ):
+            return self._iterable.dot(iterable)  # type: ignore
+        else:
+            return dotproduct(self._iterable, iterable)
 
     def flatten(self: "ChainedIterable[Iterable[_T]]") -> "ChainedIterable[_T]":
-        return self.pipe(flatten, index=0)
+        return self._pipe(flatten, index=0)
 
     @classmethod
     def repeatfunc(
@@ -456,36 +1068,50 @@ class ChainedIterable(Iterable[_T]):
         times: Optional[int] = None,
         *args: Any,
     ) -> "ChainedIterable[_T]":
-        return cls(repeatfunc(func, times=times, *args))  # type: ignore
+        return cls._new(repeatfunc(func, times=times, *args))  # type: ignore
 
     def pairwise(self) -> "ChainedIterable[Tuple[_T,_T]]":
-        return self.pipe(pairwise, index=0)
+        return self._pipe(pairwise, index=0)
 
     def grouper(
         self, n: int, fillvalue: Optional[_T] = None,
     ) -> "ChainedIterable[Tuple[_T,...]]":
-        return self.pipe(grouper, n, fillvalue=fillvalue, index=0)
+        return self._pipe(grouper, n, fillvalue=fillvalue, index=0)
 
     def partition(
         self, func: Callable[[_T], bool],
     ) -> Tuple["ChainedIterable[_T]", ...]:
-        return self.pipe(partition, func, index=1).map(type(self)).tuple()
+        return self._pipe(partition, func, index=1).map(type(self)).tuple()
 
     def powerset(self) -> "ChainedIterable[Tuple[_T,...]]":
-        return self.pipe(powerset, index=0)
+        return self._pipe(powerset, index=0)
 
     def roundrobin(self, *iterables: Iterable[_T]) -> "ChainedIterable[_T]":
-        return self.pipe(roundrobin, *iterables, index=0)
+        return self._pipe(roundrobin, *iterables, index=0)
 
     def unique_everseen(
-        self, key: Optional[Callable[[_T], Any]] = None,
+        self,
+        key: Optional[Callable[[_T], Any]] = None,
+        *,
+        window: Optional[int] = None,
+        capacity: Optional[int] = None,
+        error_rate: Optional[float] = None,
+        serialize: Optional[Callable[[Any], Hashable]] = None,
     ) -> "ChainedIterable[_T]":
-        return self.pipe(unique_everseen, key=key, index=0)
+        return self._pipe(
+            unique_everseen,
+            key=key,
+            window=window,
+            capacity=capacity,
+            error_rate=error_rate,
+            serialize=serialize,
+            index=0,
+        )
 
     def unique_justseen(
         self, key: Optional[Callable[[_T], Any]] = None,
     ) -> "ChainedIterable[_T]":
-        return self.pipe(unique_justseen, key=key, index=0)
+        return self._pipe(unique_justseen, key=key, index=0)
 
     @classmethod
     def iter_except(
@@ -494,7 +1120,7 @@ class ChainedIterable(Iterable[_T]):
         exception: Type[Exception],
         first: Optional[Callable[..., _U]] = None,
     ) -> "ChainedIterable[Union[_T,_U]]":
-        return cls(iter_except(func, exception, first=first))
+        return cls._new(iter_except(func, exception, first=first))
 
     def first_true(
         self,
@@ -520,16 +1146,69 @@ class ChainedIterable(Iterable[_T]):
     def nth_combination(self, r: int, index: int) -> Tuple[_T, ...]:
         return nth_combination(self._iterable, r, index)
 
+    # private
 
-_V = TypeVar("_V")
-_W = TypeVar("_W")
+    @classmethod
+    def _new(
+        cls: Type["ChainedIterable"], iterable: Iterable[_U],
+    ) -> "ChainedIterable[_U]":
+        # a trusted constructor, for iterables which are known to be such
+        new = object.__new__(cls)
+        new._iterable = iterable
+        return new
+
+    def _pipe(
+        self,
+        func: Callable[..., Iterable[_U]],
+        *args: Any,
+        index: int = 0,
+        **kwargs: Any,
+    ) -> "ChainedIterable[_U]":
+        iterable = self._iterable
+        if type(iterable) in _SPECIAL_WRAPPERS:
+            return self._pipe_special(func, args, index, kwargs)
+        elif index == 0:
+            return self._new(func(iterable, *args, **kwargs))
+        else:
+            return self._new(
+                func(*args[:index], iterable, *args[index:], **kwargs),
+            )
+
+    def _pipe_special(
+        self,
+        func: Callable[..., Iterable[_U]],
+        args: Tuple[Any, ...],
+        index: int,
+        kwargs: Dict[str, Any],
+    ) -> "ChainedIterable[_U]":
+        iterable = self._iterable
+        if isinstance(iterable, FusedPipeline):
+            kind = FUSIBLE.get(func)
+            if (
+                kind is not None
+                and index == 1
+                and len(args) == 1
+                and not kwargs
+            ):
+                (stage_func,) = args
+                return self._new(iterable.append(kind, stage_func))
+        result = func(*args[:index], iterable, *args[index:], **kwargs)
+        if isinstance(iterable, ProfiledStage):
+            result = iterable.profiler.wrap(
+                result, stage_name(func, args), upstream=iterable,
+            )
+        return self._new(result)
 
 
 class ChainedMapping(Mapping[_T, _U]):
     __slots__ = ("_mapping",)
 
+    _mapping: Mapping[_T, _U]
+
     def __init__(self, mapping: Mapping[_T, _U]) -> None:
-        if isinstance(mapping, Mapping):
+        if isinstance(mapping, ChainedMapping):
+            self._mapping = mapping._mapping
+        elif isinstance(mapping, Mapping):
             self._mapping = mapping
         else:
             raise TypeError(
@@ -547,11 +1226,20 @@ class ChainedMapping(Mapping[_T, _U]):
         return self._mapping[item]
 
     def __iter__(self) -> Iterator[_T]:
-        yield from self._mapping
+        return iter(self._mapping)
 
     def __len__(self) -> int:
         return len(self._mapping)
 
+    def items(self) -> ItemsView[_T, _U]:
+        return self._mapping.items()  # type: ignore
+
+    def keys(self) -> KeysView[_T]:
+        return self._mapping.keys()  # type: ignore
+
+    def values(self) -> ValuesView[_U]:
+        return self._mapping.values()
+
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self._mapping!r})"
 
@@ -573,11 +1261,15 @@ class ChainedMapping(Mapping[_T, _U]):
         return any(self._mapping.values())
 
     def dict(self) -> Dict[_T, _U]:
+        if isinstance(self._mapping, MappingView):
+            return dict(self._mapping.iter_items())
         return dict(self._mapping)
 
     def filter_keys(
         self, func: Callable[[_T], bool],
     ) -> "ChainedMapping[_T, _U]":
+        if isinstance(self._mapping, MappingView):
+            return self._new(FilterKeysView(self._mapping, func))
         return self._new(
             {key: value for key, value in self._mapping.items() if func(key)},
         )
@@ -585,6 +1277,8 @@ class ChainedMapping(Mapping[_T, _U]):
     def filter_values(
         self, func: Callable[[_U], bool],
     ) -> "ChainedMapping[_T, _U]":
+        if isinstance(self._mapping, MappingView):
+            return self._new(FilterValuesView(self._mapping, func))
         return self._new(
             {key: value for key, value in self._mapping.items() if func(value)},
         )
@@ -592,6 +1286,8 @@ class ChainedMapping(Mapping[_T, _U]):
     def filter_items(
         self, func: Callable[[_T, _U], bool],
     ) -> "ChainedMapping[_T, _U]":
+        if isinstance(self._mapping, MappingView):
+            return self._new(FilterItemsView(self._mapping, func))
         return self._new(
             {
                 key: value
@@ -618,12 +1314,19 @@ class ChainedMapping(Mapping[_T, _U]):
     def list_items(self) -> List[Tuple[_T, _U]]:
         return list(self.items())
 
+    def lazy(self) -> "ChainedMapping[_T, _U]":
+        return self._new(MappingView(self._mapping))
+
     def map_keys(self, func: Callable[[_T], _V]) -> "ChainedMapping[_V, _U]":
+        if isinstance(self._mapping, MappingView):
+            return self._new(MapKeysView(self._mapping, func))
         return self._new(
             {func(key): value for key, value in self._mapping.items()},
         )
 
     def map_values(self, func: Callable[[_U], _V]) -> "ChainedMapping[_T, _V]":
+        if isinstance(self._mapping, MappingView):
+            return self._new(MapValuesView(self._mapping, func))
         return self._new(
             {key: func(value) for key, value in self._mapping.items()},
         )
@@ -631,11 +1334,9 @@ class ChainedMapping(Mapping[_T, _U]):
     def map_items(
         self, func: Callable[[_T, _U], Tuple[_V, _W]],
     ) -> "ChainedMapping[_V, _W]":
-        out = {}
-        for key, value in self._mapping.items():
-            new_key, new_value = func(key, value)
-            out[new_key] = new_value
-        return self._new(out)
+        if isinstance(self._mapping, MappingView):
+            return self._new(MapItemsView(self._mapping, func))
+        return self._new(dict(starmap(func, self._mapping.items())))
 
     def max_keys(
         self,
@@ -643,8 +1344,7 @@ class ChainedMapping(Mapping[_T, _U]):
         key: _max_min_key_annotation = _max_min_key_default,
         default: Union[_T, Sentinel] = sentinel,
     ) -> _T:
-        _, kwargs = drop_sentinel(key=key, default=default)
-        return max(self.keys(), **kwargs)
+        return _extremum(max, self.keys(), key, default)
 
     def max_values(
         self,
@@ -652,8 +1352,7 @@ class ChainedMapping(Mapping[_T, _U]):
         key: _max_min_key_annotation = _max_min_key_default,
         default: Union[_T, Sentinel] = sentinel,
     ) -> _T:
-        _, kwargs = drop_sentinel(key=key, default=default)
-        return max(self.values(), **kwargs)
+        return _extremum(max, self.values(), key, default)
 
     def max_items(
         self,
@@ -661,8 +1360,37 @@ class ChainedMapping(Mapping[_T, _U]):
         key: _max_min_key_annotation = _max_min_key_default,
         default: Union[_T, Sentinel] = sentinel,
     ) -> _T:
-        _, kwargs = drop_sentinel(key=key, default=default)
-        return max(self.items(), **kwargs)
+        return _extremum(max, self.items(), key, default)
+
+    def nlargest_keys(
+        self, n: int, key: Optional[Callable[[_T], Any]] = None,
+    ) -> List[_T]:
+        return nlargest(n, self.keys(), key=key)
+
+    def nlargest_values(
+        self, n: int, key: Optional[Callable[[_U], Any]] = None,
+    ) -> List[_U]:
+        return nlargest(n, self.values(), key=key)
+
+    def nlargest_items(
+        self, n: int, key: Optional[Callable[[Tuple[_T, _U]], Any]] = None,
+    ) -> List[Tuple[_T, _U]]:
+        return nlargest(n, self.items(), key=key)
+
+    def nsmallest_keys(
+        self, n: int, key: Optional[Callable[[_T], Any]] = None,
+    ) -> List[_T]:
+        return nsmallest(n, self.keys(), key=key)
+
+    def nsmallest_values(
+        self, n: int, key: Optional[Callable[[_U], Any]] = None,
+    ) -> List[_U]:
+        return nsmallest(n, self.values(), key=key)
+
+    def nsmallest_items(
+        self, n: int, key: Optional[Callable[[Tuple[_T, _U]], Any]] = None,
+    ) -> List[Tuple[_T, _U]]:
+        return nsmallest(n, self.items(), key=key)
 
     def set_keys(self) -> Set[_T]:
         return set(self.keys())
@@ -677,6 +1405,6 @@ class ChainedMapping(Mapping[_T, _U]):
 
     @classmethod
     def _new(
-        cls: Type["ChainedMapping"], mapping: Dict[_V, _W],
+        cls: Type["ChainedMapping"], mapping: Mapping[_V, _W],
     ) -> "ChainedMapping[_V, _W]":
-        return cls(type(mapping)(mapping))
+        return cls(mapping)
@@ -1,13 +1,77 @@
+from array import array
+from bisect import bisect_left
+from heapq import merge
+from itertools import chain
+from itertools import filterfalse
+from itertools import groupby
+from itertools import islice
+from typing import AbstractSet
+from typing import Any
+from typing import Dict
 from typing import FrozenSet
 from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import NoReturn
+from typing import Optional
+from typing import Sequence
 from typing import Set
 from typing import TypeVar
+from typing import Union
 
 
 _T = TypeVar("_T")
 
 
+def as_set(iterable: Iterable[_T]) -> AbstractSet[_T]:
+    if isinstance(iterable, AbstractSet):
+        return iterable
+    else:
+        return frozenset(iterable)
+
+
+# set algebra as single passes, so that results are built without an
+# intermediate set
+
+
+def difference_elements(
+    first: AbstractSet[_T], others: Iterable[Iterable[_T]],
+) -> Iterator[_T]:
+    sets = list(map(as_set, others))
+    if len(sets) == 1:
+        (other,) = sets
+        return filterfalse(other.__contains__, first)
+    else:
+        return (x for x in first if not any(x in s for s in sets))
+
+
+def intersection_elements(
+    first: AbstractSet[_T], others: Iterable[Iterable[_T]],
+) -> Iterator[_T]:
+    smallest, *rest = sorted([first, *map(as_set, others)], key=size_hint)
+    if not rest:
+        return iter(smallest)
+    elif len(rest) == 1:
+        (other,) = rest
+        return filter(other.__contains__, smallest)
+    else:
+        return (x for x in smallest if all(x in s for s in rest))
+
+
+def size_hint(x: AbstractSet[Any]) -> int:
+    return x.size_hint() if isinstance(x, SetExpression) else len(x)
+
+
+def symmetric_difference_elements(
+    first: AbstractSet[_T], other: Iterable[_T],
+) -> Iterator[_T]:
+    other = as_set(other)
+    return chain(
+        filterfalse(other.__contains__, first),  # type: ignore
+        filterfalse(first.__contains__, other),
+    )
+
+
 class CSet(Set[_T]):
     """A set with chainable methods."""
 
@@ -20,19 +84,28 @@ class CSet(Set[_T]):
     # set & frozenset methods
 
     def union(self, *others: Iterable[_T]) -> "CSet[_T]":
-        return type(self)(super().union(*others))
+        new = type(self)(self)
+        set.update(new, *others)
+        return new
 
     def intersection(self, *others: Iterable[_T]) -> "CSet[_T]":
-        return type(self)(super().intersection(*others))
+        return type(self)(intersection_elements(self, others))
 
     def difference(self, *others: Iterable[_T]) -> "CSet[_T]":
-        return type(self)(super().difference(*others))
+        new = type(self)(self)
+        set.difference_update(new, *others)
+        return new
 
     def symmetric_difference(self, other: Iterable[_T]) -> "CSet[_T]":
-        return type(self)(super().symmetric_difference(other))
+        return type(self)(symmetric_difference_elements(self, other))
 
     def copy(self) -> "CSet[_T]":
-        return type(self)(super().copy())
+        return type(self)(self)
+
+    # extra public methods
+
+    def lazy(self) -> "SetExpression[_T]":
+        return SetExpression(self)
 
     # set methods
 
@@ -88,16 +161,696 @@ class CFrozenSet(FrozenSet[_T]):
     # set & frozenset methods
 
     def union(self, *others: Iterable[_T]) -> "CFrozenSet[_T]":
-        return type(self)(super().union(*others))
+        return type(self)(chain(self, *others))
 
     def intersection(self, *others: Iterable[_T]) -> "CFrozenSet[_T]":
-        return type(self)(super().intersection(*others))
+        return type(self)(intersection_elements(self, others))
 
     def difference(self, *others: Iterable[_T]) -> "CFrozenSet[_T]":
-        return type(self)(super().difference(*others))
+        return type(self)(difference_elements(self, others))
 
     def symmetric_difference(self, other: Iterable[_T]) -> "CFrozenSet[_T]":
-        return type(self)(super().symmetric_difference(other))
+        return type(self)(symmetric_difference_elements(self, other))
 
     def copy(self) -> "CFrozenSet[_T]":
-        return type(self)(super().copy())
+        return self
+
+    # extra public methods
+
+    def lazy(self) -> "SetExpression[_T]":
+        return SetExpression(self)
+
+
+class SetExpression(AbstractSet[_T]):
+    """A deferred set expression; subclasses combine their operands.
+
+    Membership tests, iteration and `len` are answered from the operands
+    without building intermediate sets.
+    """
+
+    __slots__ = ("_operands",)
+
+    def __init__(self, *operands: AbstractSet[_T]) -> None:
+        self._operands = operands
+
+    def __and__(self, other: Iterable[Any]) -> "SetExpression[_T]":
+        return self.intersection(other)
+
+    def __contains__(self, x: Any) -> bool:
+        (operand,) = self._operands
+        return x in operand
+
+    def __iter__(self) -> Iterator[_T]:
+        (operand,) = self._operands
+        return iter(operand)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __or__(self, other: Iterable[Any]) -> "SetExpression[_T]":
+        return self.union(other)
+
+    def __repr__(self) -> str:
+        operands = ", ".join(map(repr, self._operands))
+        return f"{type(self).__name__}({operands})"
+
+    def __sub__(self, other: Iterable[Any]) -> "SetExpression[_T]":
+        return self.difference(other)
+
+    def __xor__(self, other: Iterable[Any]) -> "SetExpression[_T]":
+        return self.symmetric_difference(other)
+
+    @classmethod
+    def _from_iterable(cls, iterable: Iterable[_T]) -> "CFrozenSet[_T]":
+        # used by the remaining `AbstractSet` mixins
+        return CFrozenSet(iterable)
+
+    def difference(self, *others: Iterable[_T]) -> "SetExpression[_T]":
+        return DifferenceExpression(
+            *self._flatten(DifferenceExpression, others)
+        )
+
+    def frozenset(self) -> CFrozenSet[_T]:
+        return CFrozenSet(self)
+
+    def intersection(self, *others: Iterable[_T]) -> "SetExpression[_T]":
+        return IntersectionExpression(
+            *self._flatten(IntersectionExpression, others),
+        )
+
+    def set(self) -> CSet[_T]:
+        return CSet(self)
+
+    def size_hint(self) -> int:
+        (operand,) = self._operands
+        return size_hint(operand)
+
+    def symmetric_difference(self, other: Iterable[_T]) -> "SetExpression[_T]":
+        return SymmetricDifferenceExpression(self, as_set(other))
+
+    def union(self, *others: Iterable[_T]) -> "SetExpression[_T]":
+        return UnionExpression(*self._flatten(UnionExpression, others))
+
+    def _flatten(
+        self, cls: type, others: Iterable[Iterable[_T]],
+    ) -> List[AbstractSet[_T]]:
+        # nested operations of one kind are merged into a single node
+        if type(self) is cls:
+            operands = list(self._operands)
+        elif type(self) is SetExpression:
+            operands = [*self._operands]
+        else:
+            operands = [self]
+        operands.extend(map(as_set, others))
+        return operands
+
+
+class DifferenceExpression(SetExpression[_T]):
+    __slots__ = ()
+
+    def __contains__(self, x: Any) -> bool:
+        first, *rest = self._operands
+        return x in first and not any(x in s for s in rest)
+
+    def __iter__(self) -> Iterator[_T]:
+        first, *rest = self._operands
+        return difference_elements(first, rest)
+
+    def size_hint(self) -> int:
+        return size_hint(self._operands[0])
+
+
+class IntersectionExpression(SetExpression[_T]):
+    __slots__ = ()
+
+    def __contains__(self, x: Any) -> bool:
+        return all(x in s for s in self._operands)
+
+    def __iter__(self) -> Iterator[_T]:
+        first, *rest = self._operands
+        return intersection_elements(first, rest)
+
+    def size_hint(self) -> int:
+        return min(map(size_hint, self._operands))
+
+
+class SymmetricDifferenceExpression(SetExpression[_T]):
+    __slots__ = ()
+
+    def __contains__(self, x: Any) -> bool:
+        first, second = self._operands
+        return (x in first) != (x in second)
+
+    def __iter__(self) -> Iterator[_T]:
+        first, second = self._operands
+        return symmetric_difference_elements(first, second)
+
+    def size_hint(self) -> int:
+        return sum(map(size_hint, self._operands))
+
+
+class UnionExpression(SetExpression[_T]):
+    __slots__ = ()
+
+    def __contains__(self, x: Any) -> bool:
+        return any(x in s for s in self._operands)
+
+    def __iter__(self) -> Iterator[_T]:
+        # each element is yielded from the first operand holding it
+        operands = self._operands
+        for i, operand in enumerate(operands):
+            earlier = operands[:i]
+            for x in operand:
+                if not any(x in s for s in earlier):
+                    yield x
+
+    def size_hint(self) -> int:
+        return sum(map(size_hint, self._operands))
+
+
+# sorted sets
+
+
+def sorted_contains(items: Sequence[Any], x: Any) -> bool:
+    try:
+        i = bisect_left(items, x)
+    except TypeError:
+        return False
+    return i < len(items) and items[i] == x
+
+
+class CSortedSet(AbstractSet[_T]):
+    """A set kept as a sorted array, with chainable methods and rank/select.
+
+    Elements must be mutually comparable, but need not be hashable. With a
+    `typecode`, they are stored unboxed in an `array.array`.
+    """
+
+    __slots__ = ("_items", "_typecode")
+
+    def __init__(
+        self, iterable: Iterable[_T] = (), typecode: Optional[str] = None,
+    ) -> None:
+        self._typecode = typecode
+        runs = groupby(sorted(iterable))  # type: ignore
+        self._items = self._store(k for k, _ in runs)
+
+    def __and__(self, other: Iterable[Any]) -> "CSortedSet[_T]":
+        return self.intersection(other)
+
+    def __contains__(self, x: Any) -> bool:
+        return sorted_contains(self._items, x)
+
+    def __iter__(self) -> Iterator[_T]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __or__(self, other: Iterable[Any]) -> "CSortedSet[_T]":
+        return self.union(other)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._items)!r})"
+
+    def __reversed__(self) -> Iterator[_T]:
+        return reversed(self._items)
+
+    def __sub__(self, other: Iterable[Any]) -> "CSortedSet[_T]":
+        return self.difference(other)
+
+    def __xor__(self, other: Iterable[Any]) -> "CSortedSet[_T]":
+        return self.symmetric_difference(other)
+
+    @classmethod
+    def _from_iterable(cls, iterable: Iterable[_T]) -> "CSortedSet[_T]":
+        return cls(iterable)
+
+    # set & frozenset methods
+
+    def union(self, *others: Iterable[_T]) -> "CSortedSet[_T]":
+        merged = merge(self._items, *map(self._sorted_items, others))
+        return self._new(k for k, _ in groupby(merged))
+
+    def intersection(self, *others: Iterable[_T]) -> "CSortedSet[_T]":
+        items: Sequence[_T] = self._items
+        for other in others:
+            if isinstance(other, CSortedSet) and len(other) < len(items):
+                # probe the larger side from the smaller
+                items = [x for x in other._items if sorted_contains(items, x)]
+            else:
+                lookup = self._lookup(other)
+                items = [x for x in items if x in lookup]
+        return self._new(items)
+
+    def difference(self, *others: Iterable[_T]) -> "CSortedSet[_T]":
+        lookups = list(map(self._lookup, others))
+        return self._new(
+            x for x in self._items if not any(x in s for s in lookups)
+        )
+
+    def symmetric_difference(self, other: Iterable[_T]) -> "CSortedSet[_T]":
+        other_set = self._from_iterable_like(other)
+        return self._new(
+            merge(
+                filterfalse(other_set.__contains__, self._items),
+                filterfalse(self.__contains__, other_set._items),
+            ),
+        )
+
+    def copy(self) -> "CSortedSet[_T]":
+        return self._new(self._items)
+
+    # set methods
+
+    def add(self, element: _T) -> "CSortedSet[_T]":
+        items = self._items
+        i = bisect_left(items, element)
+        if i == len(items) or items[i] != element:
+            items.insert(i, element)
+        return self
+
+    def remove(self, element: _T) -> "CSortedSet[_T]":
+        if element not in self:
+            raise KeyError(element)
+        return self.discard(element)
+
+    def discard(self, element: _T) -> "CSortedSet[_T]":
+        items = self._items
+        if sorted_contains(items, element):
+            del items[bisect_left(items, element)]
+        return self
+
+    def pop(self) -> "CSortedSet[_T]":
+        if not self._items:
+            raise KeyError("pop from an empty set")
+        self._items.pop()
+        return self
+
+    def clear(self) -> "CSortedSet[_T]":
+        del self._items[:]
+        return self
+
+    # extra public methods
+
+    def lazy(self) -> "SetExpression[_T]":
+        return SetExpression(self)
+
+    def range(
+        self, start: Optional[_T] = None, stop: Optional[_T] = None,
+    ) -> "CSortedSet[_T]":
+        items = self._items
+        lo = 0 if start is None else bisect_left(items, start)
+        hi = len(items) if stop is None else bisect_left(items, stop)
+        return self._new(items[lo:hi])
+
+    def rank(self, x: _T) -> int:
+        return bisect_left(self._items, x)
+
+    def select(self, i: int) -> _T:
+        try:
+            return self._items[i]
+        except IndexError:
+            raise IndexError(f"{type(self).__name__} index out of range")
+
+    # private
+
+    def _from_iterable_like(self, iterable: Iterable[_T]) -> "CSortedSet[_T]":
+        if isinstance(iterable, CSortedSet):
+            return iterable
+        else:
+            return type(self)(iterable, typecode=self._typecode)
+
+    def _lookup(self, iterable: Iterable[_T]) -> AbstractSet[_T]:
+        if isinstance(iterable, AbstractSet):
+            return iterable
+        else:
+            return self._from_iterable_like(iterable)
+
+    def _new(self, items: Iterable[_T]) -> "CSortedSet[_T]":
+        # a trusted constructor, for items already sorted and unique
+        new = object.__new__(type(self))
+        new._typecode = self._typecode
+        new._items = new._store(items)
+        return new
+
+    def _sorted_items(self, iterable: Iterable[_T]) -> Sequence[_T]:
+        return self._from_iterable_like(iterable)._items
+
+    def _store(self, items: Iterable[_T]) -> Union[List[_T], array]:
+        if self._typecode is None:
+            return list(items)
+        else:
+            return array(self._typecode, items)
+
+
+# bitmap sets
+
+
+# ints are bucketed by their high bits into containers of 2 ** 16; each is a
+# sorted array("H") of low bits while sparse, and an int bitmap once dense
+CONTAINER_BITS = 16
+CONTAINER_BYTES = 2 ** CONTAINER_BITS // 8
+LOW_MASK = 2 ** CONTAINER_BITS - 1
+ARRAY_MAX = 4096
+BYTE_BITS = tuple(
+    tuple(i for i in range(8) if byte >> i & 1) for byte in range(256)
+)
+Container = Union[array, int]
+
+
+def bitmap_bits(bitmap: int) -> Iterator[int]:
+    data = bitmap.to_bytes(CONTAINER_BYTES, "little")
+    for i, byte in enumerate(data):
+        if byte:
+            base = i << 3
+            for bit in BYTE_BITS[byte]:
+                yield base | bit
+
+
+def check_id(x: Any) -> None:
+    if not isinstance(x, int):
+        raise TypeError(f"Expected a non-negative int; got {x!r}")
+    elif x < 0:
+        raise ValueError(f"Expected a non-negative int; got {x}")
+
+
+def container_bits(container: Container) -> Iterator[int]:
+    if isinstance(container, int):
+        return bitmap_bits(container)
+    else:
+        return iter(container)
+
+
+def container_len(container: Container) -> int:
+    if isinstance(container, int):
+        return bin(container).count("1")
+    else:
+        return len(container)
+
+
+def to_bitmap(container: Container) -> int:
+    if isinstance(container, int):
+        return container
+    return int.from_bytes(to_bytes(container), "little")
+
+
+def to_bytes(lows: Iterable[int]) -> bytearray:
+    data = bytearray(CONTAINER_BYTES)
+    for low in lows:
+        data[low >> 3] |= 1 << (low & 7)
+    return data
+
+
+def to_container(lows: Iterable[int]) -> Optional[Container]:
+    container = array("H", sorted(set(lows)))
+    if not container:
+        return None
+    elif len(container) > ARRAY_MAX:
+        return to_bitmap(container)
+    else:
+        return container
+
+
+def normalise(bitmap: int) -> Optional[Container]:
+    size = bin(bitmap).count("1")
+    if size == 0:
+        return None
+    elif size <= ARRAY_MAX:
+        return array("H", bitmap_bits(bitmap))
+    else:
+        return bitmap
+
+
+class CBitmapSet(AbstractSet[int]):
+    """A compressed (roaring-style) bitmap of non-negative ints.
+
+    It has chainable methods, rank/select and range queries; algebra works on
+    whole containers at once, with dense ones combined as int bitmaps.
+    """
+
+    __slots__ = ("_containers", "_len")
+
+    def __init__(self, iterable: Iterable[int] = ()) -> None:
+        if isinstance(iterable, CBitmapSet):
+            self._set_containers(iterable._containers)
+            return
+        # buckets are filled as elements arrive: an unsorted array("H") while
+        # small, then a bytearray bitmap, so memory stays compact throughout
+        buckets: Dict[int, Union[array, bytearray]] = {}
+        for x in iterable:
+            check_id(x)
+            key, low = x >> CONTAINER_BITS, x & LOW_MASK
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = array("H", [low])
+            elif isinstance(bucket, bytearray):
+                bucket[low >> 3] |= 1 << (low & 7)
+            else:
+                bucket.append(low)
+                if len(bucket) > ARRAY_MAX:
+                    buckets[key] = to_bytes(bucket)
+        containers = {}
+        for key, bucket in buckets.items():
+            if isinstance(bucket, bytearray):
+                containers[key] = normalise(int.from_bytes(bucket, "little"))
+            else:
+                containers[key] = to_container(bucket)
+        self._set_containers(containers)  # type: ignore
+
+    def __and__(self, other: Iterable[Any]) -> "CBitmapSet":
+        return self.intersection(other)
+
+    def __contains__(self, x: Any) -> bool:
+        if not isinstance(x, int) or x < 0:
+            return False
+        container = self._containers.get(x >> CONTAINER_BITS)
+        if container is None:
+            return False
+        low = x & LOW_MASK
+        if isinstance(container, int):
+            return bool(container >> low & 1)
+        else:
+            return sorted_contains(container, low)
+
+    def __iter__(self) -> Iterator[int]:
+        containers = self._containers
+        for key in sorted(containers):
+            base = key << CONTAINER_BITS
+            for low in container_bits(containers[key]):
+                yield base | low
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __or__(self, other: Iterable[Any]) -> "CBitmapSet":
+        return self.union(other)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def __sub__(self, other: Iterable[Any]) -> "CBitmapSet":
+        return self.difference(other)
+
+    def __xor__(self, other: Iterable[Any]) -> "CBitmapSet":
+        return self.symmetric_difference(other)
+
+    @classmethod
+    def _from_iterable(cls, iterable: Iterable[int]) -> "CBitmapSet":
+        return cls(iterable)
+
+    # set & frozenset methods
+
+    def union(self, *others: Iterable[int]) -> "CBitmapSet":
+        containers = dict(self._containers)
+        for other in map(self._as_bitmap_set, others):
+            for key, container in other._containers.items():
+                mine = containers.get(key)
+                if mine is None:
+                    containers[key] = container
+                else:
+                    containers[key] = normalise(  # type: ignore
+                        to_bitmap(mine) | to_bitmap(container),
+                    )
+        return self._new(containers)
+
+    def intersection(self, *others: Iterable[int]) -> "CBitmapSet":
+        containers = dict(self._containers)
+        for other in map(self._as_bitmap_set, others):
+            theirs = other._containers
+            combined = {}
+            for key in containers.keys() & theirs.keys():
+                container = normalise(
+                    to_bitmap(containers[key]) & to_bitmap(theirs[key]),
+                )
+                if container is not None:
+                    combined[key] = container
+            containers = combined
+        return self._new(containers)
+
+    def difference(self, *others: Iterable[int]) -> "CBitmapSet":
+        containers = dict(self._containers)
+        for other in map(self._as_bitmap_set, others):
+            for key, container in other._containers.items():
+                if key in containers:
+                    remaining = normalise(
+                        to_bitmap(containers[key]) & ~to_bitmap(container),
+                    )
+                    if remaining is None:
+                        del containers[key]
+                    else:
+                        containers[key] = remaining
+        return self._new(containers)
+
+    def symmetric_difference(self, other: Iterable[int]) -> "CBitmapSet":
+        containers = dict(self._containers)
+        for key, container in self._as_bitmap_set(other)._containers.items():
+            if key in containers:
+                remaining = normalise(
+                    to_bitmap(containers[key]) ^ to_bitmap(container),
+                )
+                if remaining is None:
+                    del containers[key]
+                else:
+                    containers[key] = remaining
+            else:
+                containers[key] = container
+        return self._new(containers)
+
+    def copy(self) -> "CBitmapSet":
+        return self._new(self._containers)
+
+    # set methods
+
+    def add(self, element: int) -> "CBitmapSet":
+        check_id(element)
+        key, low = element >> CONTAINER_BITS, element & LOW_MASK
+        container = self._containers.get(key)
+        if container is None:
+            self._containers[key] = array("H", [low])
+        elif isinstance(container, int):
+            if container >> low & 1:
+                return self
+            self._containers[key] = container | (1 << low)
+        else:
+            i = bisect_left(container, low)
+            if i < len(container) and container[i] == low:
+                return self
+            elif len(container) < ARRAY_MAX:
+                container.insert(i, low)
+            else:
+                self._containers[key] = to_bitmap(container) | (1 << low)
+        self._len += 1
+        return self
+
+    def remove(self, element: int) -> "CBitmapSet":
+        if element not in self:
+            raise KeyError(element)
+        return self.discard(element)
+
+    def discard(self, element: int) -> "CBitmapSet":
+        if element not in self:
+            return self
+        key, low = element >> CONTAINER_BITS, element & LOW_MASK
+        container = self._containers[key]
+        if isinstance(container, int):
+            # dense containers are not demoted one removal at a time
+            container &= ~(1 << low)
+            self._containers[key] = container
+        else:
+            del container[bisect_left(container, low)]
+        if not container:
+            del self._containers[key]
+        self._len -= 1
+        return self
+
+    def pop(self) -> "CBitmapSet":
+        if not self._len:
+            raise KeyError("pop from an empty set")
+        return self.discard(self.select(self._len - 1))
+
+    def clear(self) -> "CBitmapSet":
+        self._set_containers({})
+        return self
+
+    # extra public methods
+
+    def lazy(self) -> "SetExpression[int]":
+        return SetExpression(self)
+
+    def range(
+        self, start: Optional[int] = None, stop: Optional[int] = None,
+    ) -> "CBitmapSet":
+        start = 0 if start is None else max(start, 0)
+        containers: Dict[int, Container] = {}
+        if stop is not None and stop <= start:
+            return self._new(containers)
+        for key, container in self._containers.items():
+            base = key << CONTAINER_BITS
+            end = base + LOW_MASK + 1
+            if end <= start or (stop is not None and base >= stop):
+                continue
+            elif base >= start and (stop is None or end <= stop):
+                containers[key] = container
+            else:
+                lo = max(start - base, 0)
+                hi = LOW_MASK + 1 if stop is None else min(stop - base, end)
+                mask = (1 << hi) - (1 << lo)
+                clipped = normalise(to_bitmap(container) & mask)
+                if clipped is not None:
+                    containers[key] = clipped
+        return self._new(containers)
+
+    def rank(self, x: int) -> int:
+        # the number of elements less than x
+        if x <= 0:
+            return 0
+        x_key, x_low = x >> CONTAINER_BITS, x & LOW_MASK
+        count = 0
+        for key, container in self._containers.items():
+            if key < x_key:
+                count += container_len(container)
+            elif key == x_key:
+                if isinstance(container, int):
+                    count += bin(container & ((1 << x_low) - 1)).count("1")
+                else:
+                    count += bisect_left(container, x_low)
+        return count
+
+    def select(self, i: int) -> int:
+        if not 0 <= i < self._len:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        containers = self._containers
+        for key in sorted(containers):
+            container = containers[key]
+            size = container_len(container)
+            if i < size:
+                if isinstance(container, int):
+                    low = next(islice(bitmap_bits(container), i, None))
+                else:
+                    low = container[i]
+                return (key << CONTAINER_BITS) | low
+            i -= size
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    # private
+
+    def _as_bitmap_set(self, iterable: Iterable[int]) -> "CBitmapSet":
+        if isinstance(iterable, CBitmapSet):
+            return iterable
+        else:
+            return type(self)(iterable)
+
+    def _new(self, containers: Dict[int, Container]) -> "CBitmapSet":
+        new = object.__new__(type(self))
+        new._set_containers(containers)
+        return new
+
+    def _set_containers(self, containers: Dict[int, Container]) -> None:
+        # arrays are mutable, so each set owns its own, even when they came
+        # unchanged from an operand; int bitmaps are immutable and shared
+        self._containers: Dict[int, Container] = {
+            key: container if isinstance(container, int) else container[:]
+            for key, container in containers.items()
+        }
+        self._len = sum(map(container_len, containers.values()))
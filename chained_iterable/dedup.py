@@ -0,0 +1,77 @@
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import TypeVar
+
+from more_itertools.recipes import unique_everseen as unique_everseen_
+
+from chained_iterable.sketches import BloomFilter
+
+
+_T = TypeVar("_T")
+Key = Optional[Callable[[Any], Any]]
+
+
+def compose_key(key: Key, serialize: Key) -> Key:
+    if serialize is None:
+        return key
+    elif key is None:
+        return serialize
+    else:
+        return lambda x: serialize(key(x))  # type: ignore
+
+
+def unique_bloom(
+    iterable: Iterable[_T], key: Key, seen: BloomFilter,
+) -> Iterator[_T]:
+    add = seen.add
+    for x in iterable:
+        if add(x if key is None else key(x)):
+            yield x
+
+
+def unique_everseen(
+    iterable: Iterable[_T],
+    key: Key = None,
+    *,
+    window: Optional[int] = None,
+    capacity: Optional[int] = None,
+    error_rate: Optional[float] = None,
+    serialize: Key = None,
+) -> Iterator[_T]:
+    key = compose_key(key, serialize)
+    if window is not None and error_rate is not None:
+        raise ValueError("Expected at most one of window and error_rate")
+    elif window is not None:
+        if window < 1:
+            raise ValueError(f"Expected a positive window; got {window}")
+        return unique_window(iterable, key, window)
+    elif error_rate is not None:
+        # BloomFilter validates both
+        seen = BloomFilter(
+            1_000_000 if capacity is None else capacity, error_rate,
+        )
+        return unique_bloom(iterable, key, seen)
+    else:
+        return unique_everseen_(iterable, key=key)
+
+
+def unique_window(
+    iterable: Iterable[_T], key: Key, window: int,
+) -> Iterator[_T]:
+    # keys seen within the last `window` distinct keys, oldest first; a repeat
+    # refreshes its key
+    seen: "OrderedDict[Hashable, None]" = OrderedDict()
+    for x in iterable:
+        k = x if key is None else key(x)
+        if k in seen:
+            seen.move_to_end(k)
+        else:
+            seen[k] = None
+            if len(seen) > window:
+                seen.popitem(last=False)
+            yield x
@@ -0,0 +1,66 @@
+from heapq import merge
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+
+from more_itertools import chunked
+
+from chained_iterable.cache import SpillFile
+
+
+_T = TypeVar("_T")
+
+
+# elements are pickled in blocks to amortise the per-frame overhead
+BLOCK_SIZE = 1024
+
+
+def external_sorted(
+    iterable: Iterable[_T],
+    *,
+    key: Optional[Callable[[_T], Any]] = None,
+    reverse: bool = False,
+    run_size: int = 100_000,
+) -> Iterator[_T]:
+    if run_size < 1:
+        raise ValueError(f"Expected a positive run size; got {run_size}")
+    return _external_sorted(iterable, key, reverse, run_size)
+
+
+def _external_sorted(
+    iterable: Iterable[_T],
+    key: Optional[Callable[[_T], Any]],
+    reverse: bool,
+    run_size: int,
+) -> Iterator[_T]:
+    # every run goes to one spill file, as a range of its blocks, so that the
+    # merge holds one file open however many runs there are
+    spill: SpillFile[List[_T]] = SpillFile()
+    bounds: List[Tuple[int, int]] = []
+    run: List[_T] = []
+    try:
+        for run in chunked(iterable, run_size):
+            run.sort(key=key, reverse=reverse)
+            if len(run) < run_size:
+                break
+            start = len(spill)
+            for block in chunked(run, BLOCK_SIZE):
+                spill.append(block)
+            bounds.append((start, len(spill)))
+            run = []
+        runs = [read_blocks(spill, start, stop) for start, stop in bounds]
+        yield from merge(*runs, run, key=key, reverse=reverse)
+    finally:
+        spill.close()
+
+
+def read_blocks(
+    spill: SpillFile[List[_T]], start: int, stop: int,
+) -> Iterator[_T]:
+    for index in range(start, stop):
+        yield from spill[index]
@@ -0,0 +1,80 @@
+from mmap import ACCESS_READ
+from mmap import mmap
+from os import PathLike
+from os.path import getsize
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+
+Path = Union[str, bytes, PathLike]
+MODES = ("lines", "fixed", "delimited")
+
+
+def file_ranges(path: Path, parts: int) -> List[Tuple[int, int]]:
+    if parts < 1:
+        raise ValueError(f"Expected a positive number of parts; got {parts}")
+    size = getsize(path)
+    bounds = [size * i // parts for i in range(parts + 1)]
+    return list(zip(bounds, bounds[1:]))
+
+
+def iter_file(
+    path: Path,
+    mode: str = "lines",
+    *,
+    delimiter: bytes = b"\n",
+    size: Optional[int] = None,
+    start: int = 0,
+    stop: Optional[int] = None,
+) -> Iterator[memoryview]:
+    if mode not in MODES:
+        raise ValueError(f"Expected mode to be one of {MODES}; got {mode!r}")
+    elif mode == "fixed" and (size is None or size < 1):
+        raise ValueError(f"Expected a positive record size; got {size}")
+    elif mode != "fixed" and not delimiter:
+        raise ValueError("Expected a non-empty delimiter")
+    elif start < 0:
+        raise ValueError(f"Expected a non-negative start; got {start}")
+    return _iter_file(path, mode, delimiter, size, start, stop)
+
+
+def _iter_file(
+    path: Path,
+    mode: str,
+    delimiter: bytes,
+    size: Optional[int],
+    start: int,
+    stop: Optional[int],
+) -> Iterator[memoryview]:
+    with open(path, "rb") as file:
+        try:
+            mapped = mmap(file.fileno(), 0, access=ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return
+    # the mapping is closed once it and every slice of it are garbage
+    view = memoryview(mapped)  # type: ignore
+    stop = len(mapped) if stop is None else min(stop, len(mapped))
+    if mode == "fixed":
+        first = -(-start // size) * size  # type: ignore
+        for position in range(first, stop, size):  # type: ignore
+            yield view[position : position + size]  # type: ignore
+        return
+    # records are owned by the range they start in
+    width = len(delimiter)
+    keep = width if mode == "lines" else 0
+    find = mapped.find
+    if start == 0:
+        position = 0
+    else:
+        index = find(delimiter, max(start - width, 0))
+        position = len(mapped) if index == -1 else index + width
+    while position < stop:
+        index = find(delimiter, position)
+        if index == -1:
+            yield view[position:]
+            return
+        yield view[position : index + keep]
+        position = index + width
@@ -0,0 +1,84 @@
+from itertools import filterfalse
+from itertools import starmap
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+
+
+_T = TypeVar("_T")
+_Stage = Tuple[str, Optional[Callable[..., Any]]]
+
+
+# pipe-able functions which can be fused, keyed to their stage kind
+FUSIBLE: Dict[Callable[..., Iterable], str] = {
+    filter: "filter",
+    filterfalse: "filterfalse",
+    map: "map",
+    starmap: "starmap",
+}
+
+
+_STATEMENTS = {
+    "filter": ["if not {f}(x):", "    continue"],
+    "falsy": ["if x:", "    continue"],
+    "filterfalse": ["if {f}(x):", "    continue"],
+    "map": ["x = {f}(x)"],
+    "starmap": ["x = {f}(*x)"],
+    "truthy": ["if not x:", "    continue"],
+}
+_PREDICATE_FREE = {"filter": "truthy", "filterfalse": "falsy"}
+_COMPILED: Dict[Tuple[str, ...], Callable[..., Iterator]] = {}
+
+
+def compile_stages(kinds: Tuple[str, ...]) -> Callable[..., Iterator]:
+    if kinds in _COMPILED:
+        return _COMPILED[kinds]
+    names = [f"f{i}" for i, _ in enumerate(kinds)]
+    lines = [f"def fused(source, {', '.join(names)}):", "    for x in source:"]
+    for name, kind in zip(names, kinds):
+        lines.extend(
+            f"        {statement.format(f=name)}"
+            for statement in _STATEMENTS[kind]
+        )
+    lines.append("        yield x")
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)  # noqa: S102
+    func = _COMPILED[kinds] = namespace["fused"]
+    return func
+
+
+class FusedPipeline(Iterable[_T]):
+    """A deferred list of map/filter stages, run as a single loop."""
+
+    __slots__ = ("_source", "_stages")
+
+    def __init__(
+        self, source: Iterable[Any], stages: Tuple[_Stage, ...] = (),
+    ) -> None:
+        self._source = source
+        self._stages = stages
+
+    def __iter__(self) -> Iterator[_T]:
+        if not self._stages:
+            return iter(self._source)
+        kinds, funcs = zip(*self._stages)
+        return compile_stages(kinds)(self._source, *funcs)
+
+    def __repr__(self) -> str:
+        stages = ", ".join(
+            kind if func is None else f"{kind}({func!r})"
+            for kind, func in self._stages
+        )
+        return f"{type(self).__name__}({self._source!r}, [{stages}])"
+
+    def append(
+        self, kind: str, func: Optional[Callable[..., Any]],
+    ) -> "FusedPipeline[Any]":
+        if func is None and kind in _PREDICATE_FREE:
+            kind = _PREDICATE_FREE[kind]
+        return type(self)(self._source, self._stages + ((kind, func),))
@@ -0,0 +1,122 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Set
+from typing import Sized
+from typing import Tuple
+from typing import TypeVar
+from typing import Union
+
+from chained_iterable.utilities import sentinel
+
+
+_T = TypeVar("_T")
+_U = TypeVar("_U")
+_V = TypeVar("_V")
+Key = Callable[[Any], Any]
+Other = Union[Iterable[_U], Mapping[Any, _U]]
+
+
+def _build_index(iterable: Iterable[_T], key: Key) -> Dict[Any, List[_T]]:
+    index: Dict[Any, List[_T]] = {}
+    for x in iterable:
+        index.setdefault(key(x), []).append(x)
+    return index
+
+
+def _build_keys(other: Other[_U], other_key: Key) -> Union[Set, Mapping]:
+    if isinstance(other, Mapping):
+        return other
+    else:
+        return set(map(other_key, other))
+
+
+def _matcher(other: Other[_U], other_key: Key) -> Callable[[Any], Iterable[_U]]:
+    if isinstance(other, Mapping):
+        return lambda k: (other[k],) if k in other else ()  # type: ignore
+    else:
+        index = _build_index(other, other_key)
+        return lambda k: index.get(k, ())
+
+
+def anti_join(
+    iterable: Iterable[_T], other: Other[_U], key: Key, other_key: Key,
+) -> Iterator[_T]:
+    keys = _build_keys(other, other_key)
+    for x in iterable:
+        if key(x) not in keys:
+            yield x
+
+
+def join(
+    iterable: Iterable[_T], other: Other[_U], key: Key, other_key: Key,
+) -> Iterator[Tuple[_T, _U]]:
+    if (
+        isinstance(iterable, Sized)
+        and isinstance(other, Sized)
+        and not isinstance(other, Mapping)
+        and len(iterable) < len(other)
+    ):
+        # index the smaller side, at the cost of the output order
+        index = _build_index(iterable, key)
+        for y in other:
+            for x in index.get(other_key(y), ()):
+                yield x, y
+    else:
+        matches = _matcher(other, other_key)
+        for x in iterable:
+            for y in matches(key(x)):
+                yield x, y
+
+
+def left_join(
+    iterable: Iterable[_T],
+    other: Other[_U],
+    key: Key,
+    other_key: Key,
+    fillvalue: _V,
+) -> Iterator[Tuple[_T, Union[_U, _V]]]:
+    matches = _matcher(other, other_key)
+    for x in iterable:
+        found = matches(key(x))
+        if found:
+            for y in found:
+                yield x, y
+        else:
+            yield x, fillvalue
+
+
+def merge_join(
+    iterable: Iterable[_T], other: Iterable[_U], key: Key, other_key: Key,
+) -> Iterator[Tuple[_T, _U]]:
+    others = iter(other)
+    y = next(others, sentinel)
+    k_y = sentinel if y is sentinel else other_key(y)
+    run: List[_U] = []
+    k_run: Any = sentinel
+    for x in iterable:
+        k = key(x)
+        if k_run is sentinel or k != k_run:
+            run, k_run = [], k
+            while y is not sentinel and k_y < k:
+                y = next(others, sentinel)
+                k_y = sentinel if y is sentinel else other_key(y)
+            while y is not sentinel and k_y == k:
+                run.append(y)  # type: ignore
+                y = next(others, sentinel)
+                k_y = sentinel if y is sentinel else other_key(y)
+        for match in run:
+            yield x, match
+
+
+def semi_join(
+    iterable: Iterable[_T], other: Other[_U], key: Key, other_key: Key,
+) -> Iterator[_T]:
+    keys = _build_keys(other, other_key)
+    for x in iterable:
+        if key(x) in keys:
+            yield x
@@ -0,0 +1,179 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import ItemsView
+from typing import Iterator
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+from typing import ValuesView
+
+
+_T = TypeVar("_T")
+_U = TypeVar("_U")
+_V = TypeVar("_V")
+_W = TypeVar("_W")
+
+
+def iter_items(mapping: Mapping[_T, _U]) -> Iterator[Tuple[_T, _U]]:
+    if isinstance(mapping, MappingView):
+        return mapping.iter_items()
+    else:
+        return iter(mapping.items())
+
+
+class _ItemsView(ItemsView[_T, _U]):
+    def __iter__(self) -> Iterator[Tuple[_T, _U]]:
+        return self._mapping.iter_items()  # type: ignore
+
+
+class _ValuesView(ValuesView[_U]):
+    def __iter__(self) -> Iterator[_U]:
+        return (v for _, v in self._mapping.iter_items())  # type: ignore
+
+
+class MappingView(Mapping[_T, _U]):
+    """A lazy view of a mapping; subclasses transform it on access."""
+
+    __slots__ = ("_mapping",)
+
+    def __init__(self, mapping: Mapping[_T, _U]) -> None:
+        self._mapping = mapping
+
+    def __getitem__(self, key: _T) -> _U:
+        return self._mapping[key]
+
+    def __iter__(self) -> Iterator[_T]:
+        return (k for k, _ in self.iter_items())
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.iter_items())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._mapping!r})"
+
+    def items(self) -> ItemsView[_T, _U]:
+        return _ItemsView(self)
+
+    def iter_items(self) -> Iterator[Tuple[_T, _U]]:
+        return iter_items(self._mapping)
+
+    def values(self) -> ValuesView[_U]:
+        return _ValuesView(self)
+
+
+class _FuncView(MappingView[_T, _U]):
+    __slots__ = ("_func",)
+
+    def __init__(self, mapping: Mapping[Any, Any], func: Callable) -> None:
+        super().__init__(mapping)
+        self._func = func
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._mapping!r}, {self._func!r})"
+
+
+class FilterKeysView(_FuncView[_T, _U]):
+    __slots__ = ()
+
+    def __getitem__(self, key: _T) -> _U:
+        if self._func(key):
+            return self._mapping[key]
+        else:
+            raise KeyError(key)
+
+    def iter_items(self) -> Iterator[Tuple[_T, _U]]:
+        func = self._func
+        return ((k, v) for k, v in iter_items(self._mapping) if func(k))
+
+
+class FilterValuesView(_FuncView[_T, _U]):
+    __slots__ = ()
+
+    def __getitem__(self, key: _T) -> _U:
+        value = self._mapping[key]
+        if self._func(value):
+            return value
+        else:
+            raise KeyError(key)
+
+    def iter_items(self) -> Iterator[Tuple[_T, _U]]:
+        func = self._func
+        return ((k, v) for k, v in iter_items(self._mapping) if func(v))
+
+
+class FilterItemsView(_FuncView[_T, _U]):
+    __slots__ = ()
+
+    def __getitem__(self, key: _T) -> _U:
+        value = self._mapping[key]
+        if self._func(key, value):
+            return value
+        else:
+            raise KeyError(key)
+
+    def iter_items(self) -> Iterator[Tuple[_T, _U]]:
+        func = self._func
+        return ((k, v) for k, v in iter_items(self._mapping) if func(k, v))
+
+
+class MapValuesView(_FuncView[_T, _V]):
+    __slots__ = ()
+
+    def __getitem__(self, key: _T) -> _V:
+        return self._func(self._mapping[key])
+
+    def __iter__(self) -> Iterator[_T]:
+        return iter(self._mapping)
+
+    def __len__(self) -> int:
+        return len(self._mapping)
+
+    def iter_items(self) -> Iterator[Tuple[_T, _V]]:
+        func = self._func
+        return ((k, func(v)) for k, v in iter_items(self._mapping))
+
+
+class _RekeyedView(_FuncView[_V, _W]):
+    # new keys cannot be traced back to old ones, so the first access builds
+    # (and keeps) the transformed mapping
+    __slots__ = ("_materialised",)
+
+    def __init__(self, mapping: Mapping[Any, Any], func: Callable) -> None:
+        super().__init__(mapping, func)
+        self._materialised: Optional[Dict[_V, _W]] = None
+
+    def __getitem__(self, key: _V) -> _W:
+        return self.dict()[key]
+
+    def __iter__(self) -> Iterator[_V]:
+        return iter(self.dict())
+
+    def __len__(self) -> int:
+        return len(self.dict())
+
+    def dict(self) -> Dict[_V, _W]:
+        if self._materialised is None:
+            self._materialised = dict(self.iter_items())
+        return self._materialised
+
+
+class MapKeysView(_RekeyedView[_V, _U]):
+    __slots__ = ()
+
+    def iter_items(self) -> Iterator[Tuple[_V, _U]]:
+        if self._materialised is not None:
+            return iter(self._materialised.items())
+        func = self._func
+        return ((func(k), v) for k, v in iter_items(self._mapping))
+
+
+class MapItemsView(_RekeyedView[_V, _W]):
+    __slots__ = ()
+
+    def iter_items(self) -> Iterator[Tuple[_V, _W]]:
+        if self._materialised is not None:
+            return iter(self._materialised.items())
+        func = self._func
+        return (func(k, v) for k, v in iter_items(self._mapping))
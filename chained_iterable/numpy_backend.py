@@ -0,0 +1,130 @@
+from itertools import accumulate
+from operator import add
+from operator import mul
+from sys import modules
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Optional
+
+
+# numpy is looked up rather than imported, so that importing this package
+# doesn't pay for it; a vector can only exist once numpy has been imported
+
+
+def loaded_numpy() -> Any:
+    return modules.get("numpy")
+
+
+def import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        raise ImportError(
+            "numpy is required for array-backed iterables; "
+            "install chained_iterable[numpy]",
+        )
+    return numpy
+
+
+def is_vector(x: Any) -> bool:
+    numpy = loaded_numpy()
+    return numpy is not None and isinstance(x, numpy.ndarray) and x.ndim == 1
+
+
+def as_ufunc(func: Any, nin: int) -> Any:
+    numpy = loaded_numpy()
+    if numpy is None:
+        return None
+    # ufuncs equivalent to the operators that the pure-Python paths default
+    # to; compared by identity, since `func` may be unhashable
+    if func is add:
+        ufunc = numpy.add
+    elif func is mul:
+        ufunc = numpy.multiply
+    else:
+        ufunc = func
+    if isinstance(ufunc, numpy.ufunc) and ufunc.nin == nin and ufunc.nout == 1:
+        return ufunc
+    else:
+        return None
+
+
+def to_array(iterable: Iterable[Any], dtype: Optional[Any] = None) -> Any:
+    numpy = import_numpy()
+    if isinstance(iterable, numpy.ndarray):
+        return iterable if dtype is None else iterable.astype(dtype, copy=False)
+    elif dtype is None:
+        return numpy.array(list(iterable))
+    else:
+        return numpy.fromiter(iterable, dtype=dtype)
+
+
+# numpy's integer arithmetic wraps around silently on overflow, so integer
+# vectors are only summed by numpy when no partial sum can leave 64 bits
+
+
+def sums_fit(vector: Any) -> bool:
+    if vector.dtype.kind not in "biu" or not len(vector):
+        return True
+    bound = max(abs(int(vector.min())), abs(int(vector.max())))
+    return bound * len(vector) < 2 ** 63
+
+
+def to_python(x: Any) -> Any:
+    return x.item() if isinstance(x, loaded_numpy().generic) else x
+
+
+# vectorised stages; callers check `is_vector` and `as_ufunc` first
+
+
+def accumulate_vector(
+    vector: Any, func: Callable[[Any, Any], Any], initial: Optional[Any],
+) -> Any:
+    numpy = loaded_numpy()
+    if initial is not None:
+        vector = numpy.concatenate((numpy.asarray([initial]), vector))
+    ufunc = as_ufunc(func, 2)
+    kind = vector.dtype.kind
+    if kind not in "biu" or ufunc is numpy.maximum or ufunc is numpy.minimum:
+        return ufunc.accumulate(vector)
+    elif kind != "b" and ufunc is numpy.add and sums_fit(vector):
+        # accumulate keeps the dtype, so widen it like sum does
+        return ufunc.accumulate(
+            vector, dtype=numpy.int64 if kind == "i" else numpy.uint64,
+        )
+    else:
+        # bools would be added as a logical or, and other integer operations
+        # may overflow
+        return accumulate(vector.tolist(), func)
+
+
+def filter_vector(vector: Any, func: Optional[Callable[[Any], bool]]) -> Any:
+    mask = vector if func is None else as_ufunc(func, 1)(vector)
+    return vector[mask.astype(bool)]
+
+
+def map_vector(vector: Any, func: Callable[[Any], Any]) -> Any:
+    return as_ufunc(func, 1)(vector)
+
+
+def max_vector(vector: Any) -> Any:
+    return to_python(vector.max())
+
+
+def min_vector(vector: Any) -> Any:
+    return to_python(vector.min())
+
+
+def quantify_vector(vector: Any, pred: Callable[[Any], bool]) -> int:
+    mask = vector if pred is bool else as_ufunc(pred, 1)(vector)
+    return int(loaded_numpy().count_nonzero(mask))
+
+
+def sum_vector(vector: Any, start: Any) -> Any:
+    if not len(vector):
+        return start
+    elif sums_fit(vector):
+        return start + to_python(vector.sum())
+    else:
+        return sum(vector.tolist(), start)
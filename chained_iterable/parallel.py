@@ -0,0 +1,332 @@
+from collections import deque
+from concurrent.futures import Executor
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from functools import partial
+from functools import reduce
+from itertools import chain
+from itertools import starmap
+from operator import add
+from os import cpu_count
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Generator
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Sized
+from typing import Tuple
+from typing import TypeVar
+from typing import Union
+
+from more_itertools import chunked
+from more_itertools.recipes import quantify
+
+
+_T = TypeVar("_T")
+_U = TypeVar("_U")
+ExecutorLike = Union[str, Executor]
+
+
+# shards per worker for sized inputs, and the shard size for unsized ones
+SHARDS_PER_WORKER = 4
+SHARD_SIZE = 10_000
+
+
+EXECUTORS: Dict[str, Callable[..., Executor]] = {
+    "process": ProcessPoolExecutor,
+    "thread": ThreadPoolExecutor,
+}
+
+
+def get_executor(executor: str, workers: Optional[int]) -> Executor:
+    try:
+        cls = EXECUTORS[executor]
+    except KeyError:
+        raise ValueError(
+            f"Expected an executor in {sorted(EXECUTORS)}; got {executor!r}",
+        ) from None
+    else:
+        return cls(max_workers=workers)
+
+
+# chunk workers; module-level so that process pools can pickle them
+
+
+def extremum_chunk(
+    func: Callable[..., _T], kwargs: Dict[str, Any], chunk: List[_T],
+) -> _T:
+    return func(chunk, **kwargs)
+
+
+def filter_chunk(
+    func: Optional[Callable[[_T], bool]], chunk: List[_T],
+) -> List[_T]:
+    return list(filter(func, chunk))
+
+
+def quantify_chunk(pred: Callable[[_T], bool], chunk: List[_T]) -> int:
+    return quantify(chunk, pred=pred)
+
+
+def reduce_chunk(
+    func: Callable[[Any, _T], Any], args: Tuple[Any, ...], chunk: List[_T],
+) -> Any:
+    return reduce(func, chunk, *args)
+
+
+def starmap_chunk(func: Callable[..., _U], chunk: List[Tuple]) -> List[_U]:
+    return list(starmap(func, chunk))
+
+
+# engine
+
+
+def map_chunks(
+    func: Callable[[Any], _U],
+    chunks: Iterable[Any],
+    *,
+    executor: ExecutorLike,
+    workers: Optional[int] = None,
+    ordered: bool = True,
+) -> Iterator[_U]:
+    if isinstance(executor, Executor):
+        pool, owned = executor, False
+    else:
+        pool, owned = get_executor(executor, workers), True
+    max_in_flight = 2 * (workers or cpu_count() or 1)
+    submit = _submit_ordered if ordered else _submit_unordered
+    results = submit(pool, func, chunks, max_in_flight)
+    try:
+        yield from results
+    finally:
+        results.close()
+        if owned:
+            pool.shutdown()
+
+
+def _submit_ordered(
+    pool: Executor,
+    func: Callable[[Any], _U],
+    chunks: Iterable[Any],
+    max_in_flight: int,
+) -> Generator[_U, None, None]:
+    pending: Deque[Future] = deque()
+    try:
+        for chunk in chunks:
+            pending.append(pool.submit(func, chunk))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _submit_unordered(
+    pool: Executor,
+    func: Callable[[Any], _U],
+    chunks: Iterable[Any],
+    max_in_flight: int,
+) -> Generator[_U, None, None]:
+    pending: Set[Future] = set()
+    try:
+        for chunk in chunks:
+            pending.add(pool.submit(func, chunk))
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def shard(
+    iterable: Iterable[_T], workers: Optional[int], chunksize: Optional[int],
+) -> Iterator[List[_T]]:
+    if chunksize is None:
+        if isinstance(iterable, Sized):
+            shards = SHARDS_PER_WORKER * (workers or cpu_count() or 1)
+            chunksize = max(-(-len(iterable) // shards), 1)
+        else:
+            chunksize = SHARD_SIZE
+    elif chunksize < 1:
+        raise ValueError(f"Expected a positive chunksize; got {chunksize}")
+    return chunked(iterable, chunksize)
+
+
+def _run(
+    chunk_func: Callable[..., List[_U]],
+    func: Any,
+    iterable: Iterable[Any],
+    *,
+    executor: ExecutorLike,
+    workers: Optional[int],
+    chunksize: int,
+    ordered: bool,
+) -> Iterator[_U]:
+    if chunksize < 1:
+        raise ValueError(f"Expected a positive chunksize; got {chunksize}")
+    results = map_chunks(
+        partial(chunk_func, func),
+        chunked(iterable, chunksize),
+        executor=executor,
+        workers=workers,
+        ordered=ordered,
+    )
+    return chain.from_iterable(results)
+
+
+def parallel_filter(
+    func: Optional[Callable[[_T], bool]],
+    iterable: Iterable[_T],
+    *,
+    executor: ExecutorLike,
+    workers: Optional[int] = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+) -> Iterator[_T]:
+    return _run(
+        filter_chunk,
+        func,
+        iterable,
+        executor=executor,
+        workers=workers,
+        chunksize=chunksize,
+        ordered=ordered,
+    )
+
+
+def parallel_map(
+    func: Callable[..., _U],
+    iterable: Iterable[Any],
+    *iterables: Iterable[Any],
+    executor: ExecutorLike,
+    workers: Optional[int] = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+) -> Iterator[_U]:
+    return parallel_starmap(
+        func,
+        zip(iterable, *iterables),
+        executor=executor,
+        workers=workers,
+        chunksize=chunksize,
+        ordered=ordered,
+    )
+
+
+def parallel_starmap(
+    func: Callable[..., _U],
+    iterable: Iterable[Tuple],
+    *,
+    executor: ExecutorLike,
+    workers: Optional[int] = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+) -> Iterator[_U]:
+    return _run(
+        starmap_chunk,
+        func,
+        iterable,
+        executor=executor,
+        workers=workers,
+        chunksize=chunksize,
+        ordered=ordered,
+    )
+
+
+# aggregates; each shard is reduced in the pool and the partial results are
+# combined in the calling process
+
+
+def parallel_extremum(
+    func: Callable[..., _T],
+    iterable: Iterable[_T],
+    *,
+    kwargs: Dict[str, Any],
+    executor: ExecutorLike,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> _T:
+    shard_kwargs = {k: v for k, v in kwargs.items() if k == "key"}
+    partials = map_chunks(
+        partial(extremum_chunk, func, shard_kwargs),
+        shard(iterable, workers, chunksize),
+        executor=executor,
+        workers=workers,
+    )
+    return func(partials, **kwargs)
+
+
+def parallel_quantify(
+    pred: Callable[[_T], bool],
+    iterable: Iterable[_T],
+    *,
+    executor: ExecutorLike,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> int:
+    partials = map_chunks(
+        partial(quantify_chunk, pred),
+        shard(iterable, workers, chunksize),
+        executor=executor,
+        workers=workers,
+        ordered=False,
+    )
+    return sum(partials)
+
+
+def parallel_reduce(
+    func: Callable[[Any, _T], Any],
+    iterable: Iterable[_T],
+    *args: Any,
+    combine: Optional[Callable[[Any, Any], Any]] = None,
+    executor: ExecutorLike,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> Any:
+    # without `combine`, `func` must be associative and the initial value is
+    # folded in once; with it, every shard starts from the initial value
+    partials = map_chunks(
+        partial(reduce_chunk, func, () if combine is None else args),
+        shard(iterable, workers, chunksize),
+        executor=executor,
+        workers=workers,
+    )
+    if combine is None:
+        return reduce(func, partials, *args)
+    else:
+        return reduce(combine, partials, *args)
+
+
+def parallel_sum(
+    iterable: Iterable[_T],
+    *args: Any,
+    executor: ExecutorLike,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> Any:
+    # shards are folded with `add` rather than `sum`, whose start of 0 would
+    # reject non-numeric elements such as lists
+    return parallel_reduce(
+        add,
+        iterable,
+        *args,
+        executor=executor,
+        workers=workers,
+        chunksize=chunksize,
+    )
@@ -0,0 +1,164 @@
+from time import perf_counter
+from time import process_time
+from types import TracebackType
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Type
+from typing import TypeVar
+
+
+_T = TypeVar("_T")
+
+
+class StageStats(NamedTuple):
+    """Statistics of one stage of a profiled pipeline.
+
+    Times are exclusive: time spent pulling from upstream stages is
+    attributed to those stages instead.
+    """
+
+    position: int
+    name: str
+    items_in: Optional[int]
+    items_out: int
+    wall_time: float
+    cpu_time: float
+
+    @property
+    def throughput(self) -> float:
+        return self.items_out / self.wall_time if self.wall_time else 0.0
+
+
+def stage_name(func: Callable[..., Any], args: Sequence[Any]) -> str:
+    name = getattr(func, "__name__", type(func).__name__)
+    names = [getattr(arg, "__name__", "?") for arg in args if callable(arg)]
+    return f"{name}({', '.join(names)})"
+
+
+class ProfiledStage(Iterator[_T]):
+    """An iterator which times and counts the elements pulled through it."""
+
+    __slots__ = (
+        "_child_cpu",
+        "_child_wall",
+        "_iterator",
+        "cpu",
+        "index",
+        "items",
+        "name",
+        "profiler",
+        "upstream",
+        "wall",
+    )
+
+    def __init__(
+        self,
+        iterable: Iterable[_T],
+        profiler: "Profiler",
+        index: int,
+        name: str,
+        upstream: Optional["ProfiledStage"],
+    ) -> None:
+        self._child_cpu = 0.0
+        self._child_wall = 0.0
+        self._iterator = iter(iterable)
+        self.cpu = 0.0
+        self.index = index
+        self.items = 0
+        self.name = name
+        self.profiler = profiler
+        self.upstream = upstream
+        self.wall = 0.0
+
+    def __next__(self) -> _T:
+        stack = self.profiler.stack
+        stack.append(self)
+        wall, cpu = perf_counter(), process_time()
+        try:
+            x = next(self._iterator)
+        except StopIteration:
+            self.profiler.finish(self)
+            raise
+        finally:
+            wall, cpu = perf_counter() - wall, process_time() - cpu
+            stack.pop()
+            self.wall += wall
+            self.cpu += cpu
+            if stack:
+                caller = stack[-1]
+                caller._child_wall += wall
+                caller._child_cpu += cpu
+        self.items += 1
+        return x
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, items={self.items})"
+
+    def stats(self) -> StageStats:
+        return StageStats(
+            position=self.index,
+            name=self.name,
+            items_in=None if self.upstream is None else self.upstream.items,
+            items_out=self.items,
+            wall_time=max(self.wall - self._child_wall, 0.0),
+            cpu_time=max(self.cpu - self._child_cpu, 0.0),
+        )
+
+
+class Profiler:
+    """Collects per-stage statistics of the pipelines it profiles.
+
+    `callback` is called with each stage's statistics as soon as the stage is
+    exhausted, and for any remaining stages when used as a context manager.
+    """
+
+    __slots__ = ("_reported", "callback", "stack", "stages")
+
+    def __init__(
+        self, callback: Optional[Callable[[StageStats], Any]] = None,
+    ) -> None:
+        self._reported: List[bool] = []
+        self.callback = callback
+        self.stack: List[ProfiledStage] = []
+        self.stages: List[ProfiledStage] = []
+
+    def __enter__(self) -> "Profiler":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        for stage in self.stages:
+            self.finish(stage)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.stages!r})"
+
+    def finish(self, stage: ProfiledStage) -> None:
+        if not self._reported[stage.index]:
+            self._reported[stage.index] = True
+            if self.callback is not None:
+                self.callback(stage.stats())
+
+    def report(self) -> List[StageStats]:
+        return [stage.stats() for stage in self.stages]
+
+    def wrap(
+        self,
+        iterable: Iterable[_T],
+        name: str,
+        upstream: Optional[ProfiledStage] = None,
+    ) -> ProfiledStage[_T]:
+        stage = ProfiledStage(iterable, self, len(self.stages), name, upstream)
+        self.stages.append(stage)
+        self._reported.append(False)
+        return stage
@@ -0,0 +1,220 @@
+from bisect import bisect_right
+from bisect import insort
+from hashlib import blake2b
+from math import ceil
+from math import log
+from math import sqrt
+from pickle import dumps
+from pickle import HIGHEST_PROTOCOL
+from typing import Any
+from typing import Hashable
+from typing import List
+
+from chained_iterable.errors import EmptyIterableError
+
+
+class P2Quantile:
+    """A streaming quantile estimate in constant memory (the P² algorithm).
+
+    See Jain & Chlamtac, "The P² algorithm for dynamic calculation of
+    quantiles and histograms without storing observations" (1985).
+    """
+
+    __slots__ = ("_q", "_count", "_heights", "_positions", "_desired", "_steps")
+
+    def __init__(self, q: float) -> None:
+        if not 0 <= q <= 1:
+            raise ValueError(f"Expected a quantile in [0, 1]; got {q}")
+        self._q = q
+        self._count = 0
+        self._heights: List[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * q, 1 + 4 * q, 3 + 2 * q, 5]
+        self._steps = [0, q / 2, q, (1 + q) / 2, 1]
+
+    def update(self, x: float) -> None:
+        self._count += 1
+        heights = self._heights
+        if self._count <= 5:
+            insort(heights, x)
+            return
+        if x < heights[0]:
+            heights[0] = x
+            cell = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            cell = 3
+        else:
+            cell = bisect_right(heights, x) - 1
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i, step in enumerate(self._steps):
+            self._desired[i] += step
+        for i in range(1, 4):
+            delta = self._desired[i] - positions[i]
+            if (delta >= 1 and positions[i + 1] - positions[i] > 1) or (
+                delta <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                sign = 1 if delta > 0 else -1
+                height = self._parabolic(i, sign)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, sign)
+                heights[i] = height
+                positions[i] += sign
+
+    def result(self) -> float:
+        heights = self._heights
+        if not heights:
+            raise EmptyIterableError
+        elif self._count <= 5:
+            index = self._q * (len(heights) - 1)
+            lower = int(index)
+            upper = min(lower + 1, len(heights) - 1)
+            fraction = index - lower
+            return heights[lower] + fraction * (heights[upper] - heights[lower])
+        else:
+            return heights[2]
+
+    def _linear(self, i: int, sign: int) -> float:
+        heights, positions = self._heights, self._positions
+        return heights[i] + sign * (heights[i + sign] - heights[i]) / (
+            positions[i + sign] - positions[i]
+        )
+
+    def _parabolic(self, i: int, sign: int) -> float:
+        heights, positions = self._heights, self._positions
+        below = positions[i] - positions[i - 1]
+        above = positions[i + 1] - positions[i]
+        return heights[i] + sign / (below + above) * (
+            (below + sign) * (heights[i + 1] - heights[i]) / above
+            + (above - sign) * (heights[i] - heights[i - 1]) / below
+        )
+
+
+class BloomFilter:
+    """A fixed-size set of picklables which may report false positives.
+
+    Elements are identified by their pickles rather than by `hash`. It is
+    sized so that, after `capacity` additions, membership tests are wrong
+    with probability about `error_rate`. `add` returns whether the element
+    was absent.
+    """
+
+    __slots__ = ("_bits", "_num_bits", "_num_hashes")
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        if capacity < 1:
+            raise ValueError(f"Expected a positive capacity; got {capacity}")
+        elif not 0 < error_rate < 1:
+            raise ValueError(
+                f"Expected an error rate in (0, 1); got {error_rate}",
+            )
+        num_bits = ceil(-capacity * log(error_rate) / log(2) ** 2)
+        self._bits = bytearray(-(-num_bits // 8))
+        self._num_bits = num_bits
+        self._num_hashes = max(round(num_bits / capacity * log(2)), 1)
+
+    def __contains__(self, x: Any) -> bool:
+        bits = self._bits
+        return all(bits[i >> 3] & (1 << (i & 7)) for i in self._positions(x))
+
+    def add(self, x: Any) -> bool:
+        bits = self._bits
+        absent = False
+        for i in self._positions(x):
+            byte, mask = i >> 3, 1 << (i & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                absent = True
+        return absent
+
+    def _positions(self, x: Any) -> List[int]:
+        # double hashing over a digest, since `hash` maps small ints to
+        # themselves and collides outright for some values, like -1 and -2
+        digest = blake2b(dumps(x, HIGHEST_PROTOCOL), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        step = int.from_bytes(digest[8:], "little") | 1
+        num_bits = self._num_bits
+        return [(first + i * step) % num_bits for i in range(self._num_hashes)]
+
+
+class Welford:
+    """A running count, mean and variance, updated stably in constant memory.
+
+    See Welford, "Note on a method for calculating corrected sums of squares
+    and products" (1962).
+    """
+
+    __slots__ = ("count", "_mean", "_m2")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def update(self, x: float) -> None:
+        self.count += 1
+        delta = x - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (x - self._mean)
+
+    @property
+    def mean(self) -> float:
+        if not self.count:
+            raise EmptyIterableError
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        # the population variance
+        if not self.count:
+            raise EmptyIterableError
+        return self._m2 / self.count
+
+    @property
+    def std(self) -> float:
+        return sqrt(self.variance)
+
+
+class HyperLogLog:
+    """An estimate of the number of distinct hashables, in 2 ** precision bytes.
+
+    Its relative error is about 1.04 / sqrt(2 ** precision). See Flajolet et
+    al., "HyperLogLog: the analysis of a near-optimal cardinality estimation
+    algorithm" (2007).
+    """
+
+    __slots__ = ("_precision", "_registers")
+
+    def __init__(self, precision: int = 14) -> None:
+        if not 4 <= precision <= 16:
+            raise ValueError(
+                f"Expected a precision in [4, 16]; got {precision}",
+            )
+        self._precision = precision
+        self._registers = bytearray(2 ** precision)
+
+    def update(self, x: Hashable) -> None:
+        # a splitmix64 finalizer, since small ints hash to themselves
+        h = hash(x) & 0xFFFFFFFFFFFFFFFF
+        h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+        h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+        h ^= h >> 31
+        precision = self._precision
+        index = h >> (64 - precision)
+        rest = h & ((1 << (64 - precision)) - 1)
+        rank = 64 - precision - rest.bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def result(self) -> int:
+        registers = self._registers
+        m = len(registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in registers)
+        zeros = registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # linear counting is more accurate while registers are empty
+            estimate = m * log(m / zeros)
+        return round(estimate)
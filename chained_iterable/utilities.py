@@ -1,15 +1,33 @@
+from array import array
+from collections.abc import Sequence
 from enum import auto
 from enum import Enum
+from itertools import chain
+from itertools import compress
 from sys import version_info
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Tuple
 from typing import TypeVar
 
+from more_itertools import chunked
+
 from chained_iterable.errors import UnsupportVersionError
 
 
 _T = TypeVar("_T")
+_U = TypeVar("_U")
+# arrays only count as sequences from Python 3.10, and registering them
+# ourselves would change the ABC for every program importing this package
+SEQUENCES = (Sequence, array)
+
+
+def identity(x: _T) -> _T:
+    return x
 
 
 def last_helper(_: Any, second: _T) -> _T:  # noqa: U101
@@ -21,6 +39,29 @@ def len_helper(pair: Tuple[int, Any]) -> int:
     return first
 
 
+# batches
+
+
+def batched(iterable: Iterable[_T], n: int) -> Iterator[List[_T]]:
+    if n < 1:
+        raise ValueError(f"Expected a positive batch size; got {n}")
+    return iter(chunked(iterable, n))
+
+
+def filter_batches(
+    func: Callable[[List[_T]], Iterable[bool]], iterable: Iterable[_T], n: int,
+) -> Iterator[_T]:
+    return chain.from_iterable(
+        compress(batch, func(batch)) for batch in batched(iterable, n)
+    )
+
+
+def map_batches(
+    func: Callable[[List[_T]], Iterable[_U]], iterable: Iterable[_T], n: int,
+) -> Iterator[_U]:
+    return chain.from_iterable(map(func, batched(iterable, n)))
+
+
 # sentinel
 
 
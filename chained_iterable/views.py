@@ -0,0 +1,130 @@
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import overload
+from typing import Sequence
+from typing import Tuple
+from typing import TypeVar
+from typing import Union
+
+
+_T = TypeVar("_T")
+_U = TypeVar("_U")
+
+
+def slice_view(sequence: Sequence[_T], item: slice) -> Sequence[_T]:
+    if isinstance(sequence, (range, SliceView)):
+        # these already slice lazily
+        return sequence[item]
+    else:
+        return SliceView(sequence, range(len(sequence))[item])
+
+
+class EnumerateView(Sequence[Tuple[int, _T]]):
+    """A lazy, random-access view of `enumerate` over a sequence."""
+
+    __slots__ = ("_sequence", "_start")
+
+    def __init__(self, sequence: Sequence[_T], start: int = 0) -> None:
+        self._sequence = sequence
+        self._start = start
+
+    @overload  # noqa: U100
+    def __getitem__(self, item: int) -> Tuple[int, _T]:
+        ...
+
+    @overload  # noqa: F811,U100
+    def __getitem__(self, item: slice) -> Sequence[Tuple[int, _T]]:
+        ...
+
+    def __getitem__(  # noqa: F811
+        self, item: Union[int, slice],
+    ) -> Union[Tuple[int, _T], Sequence[Tuple[int, _T]]]:
+        if isinstance(item, slice):
+            return slice_view(self, item)
+        else:
+            index = range(len(self))[item]
+            return self._start + index, self._sequence[index]
+
+    def __iter__(self) -> Iterator[Tuple[int, _T]]:
+        return enumerate(self._sequence, start=self._start)
+
+    def __len__(self) -> int:
+        return len(self._sequence)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._sequence!r}, {self._start})"
+
+
+class MapView(Sequence[_U]):
+    """A lazy, random-access view of `map` over sequences."""
+
+    __slots__ = ("_func", "_sequences")
+
+    def __init__(
+        self, func: Callable[..., _U], *sequences: Sequence[Any],
+    ) -> None:
+        self._func = func
+        self._sequences = sequences
+
+    @overload  # noqa: U100
+    def __getitem__(self, item: int) -> _U:
+        ...
+
+    @overload  # noqa: F811,U100
+    def __getitem__(self, item: slice) -> Sequence[_U]:
+        ...
+
+    def __getitem__(  # noqa: F811
+        self, item: Union[int, slice],
+    ) -> Union[_U, Sequence[_U]]:
+        if isinstance(item, slice):
+            return slice_view(self, item)
+        else:
+            index = range(len(self))[item]
+            return self._func(*(x[index] for x in self._sequences))
+
+    def __iter__(self) -> Iterator[_U]:
+        return map(self._func, *self._sequences)
+
+    def __len__(self) -> int:
+        return min(len(x) for x in self._sequences)
+
+    def __repr__(self) -> str:
+        sequences = ", ".join(map(repr, self._sequences))
+        return f"{type(self).__name__}({self._func!r}, {sequences})"
+
+
+class SliceView(Sequence[_T]):
+    """A lazy, random-access view of a slice of a sequence."""
+
+    __slots__ = ("_sequence", "_indices")
+
+    def __init__(self, sequence: Sequence[_T], indices: range) -> None:
+        self._sequence = sequence
+        self._indices = indices
+
+    @overload  # noqa: U100
+    def __getitem__(self, item: int) -> _T:
+        ...
+
+    @overload  # noqa: F811,U100
+    def __getitem__(self, item: slice) -> Sequence[_T]:
+        ...
+
+    def __getitem__(  # noqa: F811
+        self, item: Union[int, slice],
+    ) -> Union[_T, Sequence[_T]]:
+        if isinstance(item, slice):
+            return type(self)(self._sequence, self._indices[item])
+        else:
+            return self._sequence[self._indices[item]]
+
+    def __iter__(self) -> Iterator[_T]:
+        return map(self._sequence.__getitem__, self._indices)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._sequence!r}, {self._indices!r})"
@@ -0,0 +1,229 @@
+from array import array
+from bisect import bisect_right
+from collections import deque
+from heapq import merge
+from itertools import islice
+from operator import ge
+from operator import itemgetter
+from operator import le
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+from typing import TypeVar
+
+
+_T = TypeVar("_T")
+Timestamp = Callable[[Any], float]
+
+
+class Window(NamedTuple):
+    """The elements of one timestamped window, with its bounds."""
+
+    start: float
+    end: float
+    items: List[Any]
+
+
+def check_positive(name: str, n: float) -> None:
+    if n <= 0:
+        raise ValueError(f"Expected a positive {name}; got {n}")
+
+
+def check_lateness(lateness: float) -> None:
+    if lateness < 0:
+        raise ValueError(f"Expected a non-negative lateness; got {lateness}")
+
+
+# count-based windows
+
+
+def sliding_window(
+    iterable: Iterable[_T], n: int, step: int = 1,
+) -> Iterator[Tuple[_T, ...]]:
+    check_positive("window size", n)
+    check_positive("step", step)
+    return _sliding_window(iterable, n, step)
+
+
+def _sliding_window(
+    iterable: Iterable[_T], n: int, step: int,
+) -> Iterator[Tuple[_T, ...]]:
+    # a ring buffer: the deque drops its oldest elements as new ones arrive
+    iterator = iter(iterable)
+    window = deque(islice(iterator, n), maxlen=n)
+    if len(window) < n:
+        return
+    yield tuple(window)
+    if step == 1:
+        append = window.append
+        for x in iterator:
+            append(x)
+            yield tuple(window)
+        return
+    while True:
+        chunk = list(islice(iterator, step))
+        if len(chunk) < step:
+            return
+        window.extend(chunk)
+        yield tuple(window)
+
+
+# rolling aggregates, each in amortised constant time per element
+
+
+def rolling_sum(iterable: Iterable[Any], n: int) -> Iterator[Any]:
+    check_positive("window size", n)
+    return _rolling_sum(iterable, n)
+
+
+def _rolling_sum(iterable: Iterable[Any], n: int) -> Iterator[Any]:
+    iterator = iter(iterable)
+    window = deque(islice(iterator, n), maxlen=n)
+    if len(window) < n:
+        return
+    total = sum(window)
+    yield total
+    for i, x in enumerate(iterator, start=1):
+        total += x - window[0]
+        window.append(x)
+        if i % n == 0:
+            # re-summing once per window bounds any floating-point drift
+            total = sum(window)
+        yield total
+
+
+def rolling_mean(iterable: Iterable[Any], n: int) -> Iterator[float]:
+    return (total / n for total in rolling_sum(iterable, n))
+
+
+def rolling_extremum(
+    iterable: Iterable[_T], n: int, dominates: Callable[[Any, Any], bool],
+) -> Iterator[_T]:
+    check_positive("window size", n)
+    return _rolling_extremum(iterable, n, dominates)
+
+
+def _rolling_extremum(
+    iterable: Iterable[_T], n: int, dominates: Callable[[Any, Any], bool],
+) -> Iterator[_T]:
+    # a monotonic deque of (index, value): each value is dominated by the ones
+    # before it, so the front is the window's extremum
+    candidates: Deque[Tuple[int, _T]] = deque()
+    for i, x in enumerate(iterable):
+        while candidates and dominates(x, candidates[-1][1]):
+            candidates.pop()
+        candidates.append((i, x))
+        if candidates[0][0] <= i - n:
+            candidates.popleft()
+        if i >= n - 1:
+            yield candidates[0][1]
+
+
+def rolling_max(iterable: Iterable[_T], n: int) -> Iterator[_T]:
+    return rolling_extremum(iterable, n, ge)
+
+
+def rolling_min(iterable: Iterable[_T], n: int) -> Iterator[_T]:
+    return rolling_extremum(iterable, n, le)
+
+
+# time-based windows; an element is dropped as late if its timestamp is more
+# than `lateness` behind the greatest timestamp seen so far, and windows are
+# emitted once no element which is not late could still fall into them
+
+
+def tumbling_window(
+    iterable: Iterable[_T], size: float, key: Timestamp, lateness: float = 0,
+) -> Iterator[Window]:
+    check_positive("window size", size)
+    check_lateness(lateness)
+    return _tumbling_window(iterable, size, key, lateness)
+
+
+def _tumbling_window(
+    iterable: Iterable[_T], size: float, key: Timestamp, lateness: float,
+) -> Iterator[Window]:
+    windows: Dict[float, List[_T]] = {}
+    watermark = float("-inf")
+    for x in iterable:
+        timestamp = key(x)
+        if timestamp < watermark:
+            continue
+        start = timestamp // size * size
+        windows.setdefault(start, []).append(x)
+        if timestamp - lateness > watermark:
+            watermark = timestamp - lateness
+            for start in sorted(windows):
+                if start + size > watermark:
+                    break
+                yield Window(start, start + size, windows.pop(start))
+    for start in sorted(windows):
+        yield Window(start, start + size, windows[start])
+
+
+def session_window(
+    iterable: Iterable[_T], gap: float, key: Timestamp, lateness: float = 0,
+) -> Iterator[Window]:
+    check_positive("gap", gap)
+    check_lateness(lateness)
+    return _session_window(iterable, gap, key, lateness)
+
+
+def _session_window(
+    iterable: Iterable[_T], gap: float, key: Timestamp, lateness: float,
+) -> Iterator[Window]:
+    # open sessions as [start, end, items, arrivals], ordered by start and
+    # pairwise more than `gap` apart, with their starts mirrored for bisection
+    sessions: List[List[Any]] = []
+    starts: List[float] = []
+    watermark = float("-inf")
+    for arrival, x in enumerate(iterable):
+        timestamp = key(x)
+        if timestamp < watermark:
+            continue
+        i = bisect_right(starts, timestamp + gap)
+        # only the last two sessions starting by then can be within `gap`
+        matches = [
+            j
+            for j in range(max(i - 2, 0), i)
+            if timestamp <= sessions[j][1] + gap
+        ]
+        if not matches:
+            sessions.insert(
+                i, [timestamp, timestamp, [x], array("q", [arrival])],
+            )
+            starts.insert(i, timestamp)
+        else:
+            j = matches[0]
+            session = sessions[j]
+            if len(matches) == 2:
+                # the element bridges two sessions, which keep arrival order
+                _, end, items, arrivals = sessions.pop(j + 1)
+                del starts[j + 1]
+                merged = list(
+                    merge(
+                        zip(session[3], session[2]),
+                        zip(arrivals, items),
+                        key=itemgetter(0),
+                    ),
+                )
+                session[1] = end
+                session[2] = [item for _, item in merged]
+                session[3] = array("q", [index for index, _ in merged])
+            session[0] = starts[j] = min(session[0], timestamp)
+            session[1] = max(session[1], timestamp)
+            session[2].append(x)
+            session[3].append(arrival)
+        if timestamp - lateness > watermark:
+            watermark = timestamp - lateness
+            while sessions and sessions[0][1] + gap < watermark:
+                del starts[0]
+                yield Window(*sessions.pop(0)[:3])
+    for start, end, items, _ in sessions:
+        yield Window(start, end, items)
@@ -0,0 +1,73 @@
+from operator import mul
+from statistics import mean
+from statistics import pstdev
+from statistics import pvariance
+from typing import List
+
+from hypothesis import given
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+from pytest import approx
+from pytest import raises
+
+from chained_iterable import ChainedIterable
+from chained_iterable import ChainedMapping
+from chained_iterable import EmptyIterableError
+from chained_iterable.sketches import P2Quantile
+
+
+@given(ints=lists(integers(-1000, 1000), min_size=1))
+def test_aggregate(ints: List[int]) -> None:
+    # a single pass over an iterator
+    result = ChainedIterable(iter(ints)).aggregate(
+        count="count",
+        total="sum",
+        lo="min",
+        hi="max",
+        mean="mean",
+        var="var",
+        product=(mul, 1),
+        median=P2Quantile(0.5),
+    )
+    assert isinstance(result, ChainedMapping)
+    product = 1
+    for x in ints:
+        product *= x
+    assert result["count"] == len(ints)
+    assert result["total"] == sum(ints)
+    assert result["lo"] == min(ints)
+    assert result["hi"] == max(ints)
+    assert result["mean"] == approx(mean(ints))
+    assert result["var"] == approx(pvariance(ints), abs=1e-6)
+    assert result["product"] == product
+    assert min(ints) <= result["median"] <= max(ints)
+
+
+@given(ints=lists(integers(0, 100), min_size=1))
+def test_describe(ints: List[int]) -> None:
+    result = ChainedIterable(ints).describe()
+    assert set(result) == {
+        "count",
+        "distinct",
+        "max",
+        "mean",
+        "min",
+        "std",
+        "sum",
+    }
+    assert result["count"] == len(ints)
+    assert result["distinct"] == len(set(ints))
+    assert result["std"] == approx(pstdev(ints), abs=1e-6)
+
+
+def test_aggregate_errors() -> None:
+    assert ChainedIterable([]).aggregate(n="count", total="sum") == {
+        "n": 0,
+        "total": 0,
+    }
+    with raises(EmptyIterableError):
+        ChainedIterable([]).describe()
+    with raises(ValueError, match="Expected a reducer in"):
+        ChainedIterable([]).aggregate(x="median")
+    with raises(TypeError, match="Expected a reducer name"):
+        ChainedIterable([]).aggregate(x=len)
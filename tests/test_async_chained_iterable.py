@@ -0,0 +1,174 @@
+from asyncio import new_event_loop
+from asyncio import sleep
+from itertools import groupby
+from itertools import islice
+from operator import add
+from operator import neg
+from typing import Any
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from hypothesis import given
+from hypothesis.strategies import integers
+from hypothesis.strategies import just
+from hypothesis.strategies import lists
+from hypothesis.strategies import tuples
+from pytest import mark
+from pytest import raises
+
+from chained_iterable import AsyncChainedIterable
+from chained_iterable import EmptyIterableError
+
+
+def _run(awaitable: Awaitable[Any]) -> Any:
+    loop = new_event_loop()
+    try:
+        return loop.run_until_complete(awaitable)
+    finally:
+        loop.close()
+
+
+async def _aiter(ints: List[int]) -> AsyncIterator[int]:
+    for x in ints:
+        await sleep(0)
+        yield x
+
+
+async def _slow_neg(x: int) -> int:
+    await sleep(0.001 * (x % 3))
+    return -x
+
+
+async def _is_even(x: int) -> bool:
+    await sleep(0)
+    return x % 2 == 0
+
+
+# core
+
+
+@given(input_=integers() | lists(integers()))
+def test_init(input_: Any) -> None:
+    if isinstance(input_, int):
+        with raises(
+            TypeError,
+            match="AsyncChainedIterable expected an iterable or async "
+            "iterable, but 'int' object is not iterable",
+        ):
+            AsyncChainedIterable(input_)
+    else:
+        assert _run(AsyncChainedIterable(input_).list()) == input_
+        assert _run(AsyncChainedIterable(_aiter(input_)).list()) == input_
+
+
+# stages
+
+
+@given(ints=lists(integers()), concurrency=integers(1, 5))
+def test_map(ints: List[int], concurrency: int) -> None:
+    iterable = AsyncChainedIterable(_aiter(ints)).map(
+        _slow_neg, concurrency=concurrency,
+    )
+    assert isinstance(iterable, AsyncChainedIterable)
+    assert _run(iterable.list()) == [-x for x in ints]
+    assert _run(AsyncChainedIterable(ints).map(neg).list()) == [
+        -x for x in ints
+    ]
+
+
+@mark.parametrize("concurrency", [1, 2, 5])
+def test_map_concurrency(concurrency: int) -> None:
+    in_flight = peak = 0
+
+    async def tracked(x: int) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await sleep(0.001)
+        in_flight -= 1
+        return x
+
+    iterable = AsyncChainedIterable(range(10)).map(
+        tracked, concurrency=concurrency,
+    )
+    assert _run(iterable.list()) == list(range(10))
+    assert peak == concurrency
+
+
+def test_map_error() -> None:
+    with raises(ValueError, match="Expected a positive concurrency; got 0"):
+        AsyncChainedIterable([]).map(neg, concurrency=0)
+
+
+@given(ints=lists(integers()))
+def test_filter_and_enumerate(ints: List[int]) -> None:
+    iterable = AsyncChainedIterable(_aiter(ints)).filter(_is_even).enumerate()
+    assert _run(iterable.list()) == list(
+        enumerate(x for x in ints if x % 2 == 0)
+    )
+
+
+@given(
+    ints=lists(integers()),
+    start=integers(0, 10),
+    stop=integers(0, 10) | just(None),
+    step=integers(1, 3) | just(None),
+)
+def test_islice(
+    ints: List[int], start: int, stop: Optional[int], step: Optional[int],
+) -> None:
+    iterable = AsyncChainedIterable(_aiter(ints)).islice(start, stop, step)
+    assert _run(iterable.list()) == list(islice(ints, start, stop, step))
+    assert _run(AsyncChainedIterable(ints).take(start).list()) == ints[:start]
+
+
+@given(ints=lists(integers(0, 3)))
+def test_groupby(ints: List[int]) -> None:
+    iterable = AsyncChainedIterable(_aiter(ints)).groupby()
+    assert _run(iterable.list()) == [(k, list(g)) for k, g in groupby(ints)]
+
+
+@given(pairs=lists(tuples(integers(), integers())))
+def test_starmap(pairs: List[Tuple[int, int]]) -> None:
+    iterable = AsyncChainedIterable(_aiter(pairs)).starmap(add)
+    assert _run(iterable.list()) == [x + y for x, y in pairs]
+
+
+# reductions
+
+
+def test_max_and_min_empty() -> None:
+    for method_name in ["max", "min"]:
+        with raises(ValueError, match=r"\(\) arg is an empty sequence"):
+            _run(getattr(AsyncChainedIterable([]), method_name)())
+
+
+@given(ints=lists(integers()))
+def test_reductions(ints: List[int]) -> None:
+    iterable = AsyncChainedIterable(ints)
+    assert _run(iterable.sum()) == sum(ints)
+    assert _run(iterable.len()) == len(ints)
+    assert _run(iterable.max(default=None)) == max(ints, default=None)
+    assert _run(iterable.min(key=neg, default=None)) == min(
+        ints, key=neg, default=None,
+    )
+    # ties go to the first extreme element, as with the built-ins
+    assert _run(iterable.max(key=abs, default=None)) == max(
+        ints, key=abs, default=None,
+    )
+    assert _run(iterable.min(key=abs, default=None)) == min(
+        ints, key=abs, default=None,
+    )
+    if ints:
+        assert _run(iterable.first()) == ints[0]
+        assert _run(iterable.last()) == ints[-1]
+        assert _run(iterable.reduce(add)) == sum(ints)
+    else:
+        for method_name in ["first", "last"]:
+            with raises(EmptyIterableError):
+                _run(getattr(iterable, method_name)())
+        with raises(EmptyIterableError):
+            _run(iterable.reduce(add))
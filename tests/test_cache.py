@@ -0,0 +1,21 @@
+from typing import List
+from typing import Tuple
+
+from hypothesis import given
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+from hypothesis.strategies import text
+from hypothesis.strategies import tuples
+
+from chained_iterable.cache import SpillFile
+
+
+@given(elements=lists(tuples(integers(), text())))
+def test_spill_file(elements: List[Tuple[int, str]]) -> None:
+    spill = SpillFile()
+    for element in elements:
+        spill.append(element)
+    assert len(spill) == len(elements)
+    assert list(spill) == elements
+    assert [spill[i] for i in reversed(range(len(spill)))] == elements[::-1]
+    spill.close()
@@ -1,9 +1,17 @@
 from functools import reduce
+from itertools import chain
 from itertools import count
+from itertools import dropwhile
+from itertools import filterfalse
 from itertools import islice
+from itertools import starmap
 from operator import add
+from operator import itemgetter
 from operator import mod
+from operator import neg
 from operator import sub
+from operator import truth
+from random import Random
 from re import escape
 from sys import maxsize
 from typing import Any
@@ -17,21 +25,25 @@ from typing import Union
 
 from hypothesis import assume
 from hypothesis import given
+from hypothesis import settings
 from hypothesis.strategies import booleans
 from hypothesis.strategies import composite
 from hypothesis.strategies import data
 from hypothesis.strategies import dictionaries
 from hypothesis.strategies import fixed_dictionaries
+from hypothesis.strategies import floats
 from hypothesis.strategies import integers
 from hypothesis.strategies import just
 from hypothesis.strategies import lists
 from hypothesis.strategies import sampled_from
 from hypothesis.strategies import tuples
 from more_itertools import chunked
+from pytest import importorskip
 from pytest import mark
 from pytest import raises
 
 from chained_iterable import ChainedIterable
+from chained_iterable import ChainedMapping
 from chained_iterable import EmptyIterableError
 from chained_iterable import MultipleElementsError
 from chained_iterable.errors import UnsupportVersionError
@@ -83,6 +95,16 @@ def _int_and_int_to_int_funcs(draw: Any) -> Callable[[int, int], int]:
     return lambda x, y: combiner(func_1(x), func_2(y))
 
 
+def _groups(
+    ints: List[int], key: Callable[[int], Any],
+) -> List[Tuple[Any, List[int]]]:
+    keys = list(map(key, ints))
+    return [
+        (k, [x for x, k_x in zip(ints, keys) if k_x == k])
+        for k in dict.fromkeys(keys)
+    ]
+
+
 # core
 
 
@@ -106,6 +128,34 @@ def test_eq(ints: List[int], other: Union[int, List[int]]) -> None:
     )
 
 
+@given(ints=lists(integers(0, 3)), other=lists(integers(0, 3)))
+def test_equals_and_diff(ints: List[int], other: List[int]) -> None:
+    iterable = ChainedIterable(iter(ints))
+    diff = ChainedIterable(iter(ints)).diff(iter(other))
+    mismatches = [i for i, (x, y) in enumerate(zip(ints, other)) if x != y] + (
+        [min(len(ints), len(other))] if len(ints) != len(other) else []
+    )
+    if mismatches:
+        i = mismatches[0]
+        assert diff == (
+            i,
+            ints[i] if i < len(ints) else sentinel,
+            other[i] if i < len(other) else sentinel,
+        )
+    else:
+        assert diff is None
+    assert iterable.equals(other) is (ints == other)
+    assert ChainedIterable(ints).equals(other, key=truth) is (
+        list(map(truth, ints)) == list(map(truth, other))
+    )
+
+
+def test_equals_short_circuits() -> None:
+    assert not ChainedIterable(range(10)).equals(range(11))
+    assert ChainedIterable(count()) != chain([-1], count())
+    assert ChainedIterable(count()).diff(chain([-1], count())) == (0, 0, -1)
+
+
 @given(ints=lists(integers()), index=integers())
 def test_get_item(ints: List[int], index: int) -> None:
     iterable = ChainedIterable(iter(ints))
@@ -128,9 +178,48 @@ def test_get_item(ints: List[int], index: int) -> None:
             iterable[index]
 
 
+@given(ints=lists(integers()), index=integers(-1000, 1000))
+def test_get_item_sequence(ints: List[int], index: int) -> None:
+    iterable = ChainedIterable(ints).map(neg).enumerate()
+    expected = list(enumerate(map(neg, ints)))
+    if -len(ints) <= index < len(ints):
+        _assert_same_type_and_equal(iterable[index], expected[index])
+    else:
+        with raises(IndexError, match="ChainedIterable index out of range"):
+            iterable[index]
+
+
+@given(
+    ints=lists(integers()),
+    start=integers(-20, 20) | just(None),
+    stop=integers(-20, 20) | just(None),
+    step=integers(-5, 5).filter(bool) | just(None),
+)
+def test_get_item_slice(
+    ints: List[int],
+    start: Optional[int],
+    stop: Optional[int],
+    step: Optional[int],
+) -> None:
+    iterable = ChainedIterable(ints)[start:stop:step]
+    assert isinstance(iterable, ChainedIterable)
+    assert iterable == ints[start:stop:step]
+    assert iterable.len() == len(ints[start:stop:step])
+    assert iterable.reversed() == ints[start:stop:step][::-1]
+
+
 @given(ints=lists(integers()))
 def test_iter(ints: List[int]) -> None:
     assert list(ChainedIterable(iter(ints))) == ints
+    assert type(iter(ChainedIterable(ints))) is type(iter(ints))
+
+
+@given(ints=lists(integers()))
+def test_init_unwraps(ints: List[int]) -> None:
+    iterable = ChainedIterable(ChainedIterable(ints))
+    assert iterable._iterable is ints
+    mapping = dict(enumerate(ints))
+    assert ChainedMapping(ChainedMapping(mapping))._mapping is mapping
 
 
 @given(ints=lists(integers()))
@@ -177,6 +266,27 @@ def test_filter(ints: List[int], func: Callable[[int], bool]) -> None:
     assert iterable == filter(func, ints)
 
 
+@given(ints=lists(integers()), chunksize=integers(1, 10), ordered=booleans())
+@mark.parametrize("executor", ["process", "thread"])
+@settings(max_examples=10, deadline=None)
+def test_filter_parallel(
+    ints: List[int], executor: str, chunksize: int, ordered: bool,
+) -> None:
+    iterable = ChainedIterable(iter(ints)).filter(
+        truth,
+        executor=executor,
+        workers=2,
+        chunksize=chunksize,
+        ordered=ordered,
+    )
+    assert isinstance(iterable, ChainedIterable)
+    expected = list(filter(truth, ints))
+    if ordered:
+        assert iterable == expected
+    else:
+        assert iterable.sorted() == sorted(expected)
+
+
 @given(ints=lists(integers()))
 @mark.parametrize("func", [frozenset, list, set, tuple])
 def test_frozenset_and_list_and_set_and_tuple(
@@ -194,6 +304,61 @@ def test_map(ints: List[int], func: Callable[[int], int]) -> None:
     assert iterable == map(func, ints)
 
 
+@given(ints=lists(integers()), chunksize=integers(1, 10), ordered=booleans())
+@mark.parametrize("executor", ["process", "thread"])
+@settings(max_examples=10, deadline=None)
+def test_map_parallel(
+    ints: List[int], executor: str, chunksize: int, ordered: bool,
+) -> None:
+    iterable = ChainedIterable(iter(ints)).map(
+        neg, executor=executor, workers=2, chunksize=chunksize, ordered=ordered,
+    )
+    assert isinstance(iterable, ChainedIterable)
+    expected = list(map(neg, ints))
+    if ordered:
+        assert iterable == expected
+    else:
+        assert iterable.sorted() == sorted(expected)
+
+
+def test_map_parallel_errors() -> None:
+    with raises(ValueError, match="Expected an executor in"):
+        ChainedIterable.range(10).map(neg, executor="fiber").list()
+    with raises(ValueError, match="Expected a positive chunksize; got 0"):
+        ChainedIterable.range(10).map(neg, executor="thread", chunksize=0)
+
+
+def _count_one(count: int, _: int) -> int:
+    return count + 1
+
+
+@given(ints=lists(integers()), chunksize=integers(1, 10) | just(None))
+@mark.parametrize("executor", ["process", "thread"])
+@settings(max_examples=10, deadline=None)
+def test_aggregates_parallel(
+    ints: List[int], executor: str, chunksize: Optional[int],
+) -> None:
+    iterable = ChainedIterable(ints)
+    kwargs = {"executor": executor, "workers": 2, "chunksize": chunksize}
+    assert iterable.sum(**kwargs) == sum(ints)
+    assert iterable.sum(10, **kwargs) == sum(ints, 10)
+    assert ChainedIterable([[x] for x in ints]).sum([], **kwargs) == ints
+    assert iterable.reduce(add, 10, **kwargs) == sum(ints, 10)
+    assert iterable.reduce(_count_one, 0, combine=add, **kwargs) == len(ints)
+    assert iterable.quantify(truth, **kwargs) == sum(map(truth, ints))
+    assert iterable.max(key=neg, default=None, **kwargs) == max(
+        ints, key=neg, default=None,
+    )
+    assert iterable.min(default=None, **kwargs) == min(ints, default=None)
+    if ints:
+        singletons = ChainedIterable([(x,) for x in ints])
+        assert singletons.reduce(add, **kwargs) == tuple(ints)
+        assert iterable.max(**kwargs) == max(ints)
+    else:
+        with raises(ValueError):
+            iterable.max(**kwargs)
+
+
 @given(
     data=data(),
     ints=lists(integers()),
@@ -263,6 +428,28 @@ def test_sorted(
     )
 
 
+@given(
+    ints=lists(integers()),
+    key=_int_to_any_funcs(),
+    reverse=booleans(),
+    limit=integers(0, 10),
+)
+def test_sorted_limit(
+    ints: List[int], key: Callable[[int], Any], reverse: bool, limit: int,
+) -> None:
+    _assert_same_type_and_equal(
+        ChainedIterable(iter(ints)).sorted(
+            key=key, reverse=reverse, limit=limit,
+        ),
+        sorted(ints, key=key, reverse=reverse)[:limit],
+    )
+
+
+def test_sorted_limit_error() -> None:
+    with raises(ValueError, match="Expected a non-negative limit; got -1"):
+        ChainedIterable([1, 2]).sorted(limit=-1)
+
+
 @given(
     ints=lists(integers()), args=just(()) | tuples(integers()),
 )
@@ -284,6 +471,73 @@ def test_zip(ints: List[int], iterables: List[List[int]]) -> None:
 # public
 
 
+@given(ints=lists(integers()), key=_int_to_any_funcs(), initial=integers())
+def test_aggregate_by(
+    ints: List[int], key: Callable[[int], Any], initial: int,
+) -> None:
+    mapping = ChainedIterable(iter(ints)).aggregate_by(key, add, initial)
+    assert isinstance(mapping, ChainedMapping)
+    assert mapping == {
+        k: reduce(add, group, initial) for k, group in _groups(ints, key)
+    }
+
+
+def test_aggregate_by_mutable_initial() -> None:
+    def append(xs: List[int], x: int) -> List[int]:
+        xs.append(x)
+        return xs
+
+    initial: List[int] = []
+    mapping = ChainedIterable([1, 2, 3, 4]).aggregate_by(
+        lambda x: x % 2, append, initial,
+    )
+    assert mapping == {1: [1, 3], 0: [2, 4]}
+    assert initial == []
+
+
+@given(ints=lists(integers()), n=integers(1, 10))
+def test_batched_and_unbatch(ints: List[int], n: int) -> None:
+    batches = ChainedIterable(iter(ints)).batched(n)
+    assert isinstance(batches, ChainedIterable)
+    expected = list(chunked(ints, n))
+    assert batches == expected
+    assert ChainedIterable(expected).unbatch() == ints
+
+
+@given(ints=lists(integers()), n=integers(-10, 0))
+def test_batched_error(ints: List[int], n: int) -> None:
+    with raises(ValueError, match=f"Expected a positive batch size; got {n}"):
+        ChainedIterable(iter(ints)).batched(n)
+
+
+@given(ints=lists(integers()), size=integers(1, 10))
+def test_map_and_filter_batches(ints: List[int], size: int) -> None:
+    calls = []
+
+    def negate(batch: List[int]) -> List[int]:
+        calls.append(len(batch))
+        return [-x for x in batch]
+
+    def positive(batch: List[int]) -> List[bool]:
+        return [x > 0 for x in batch]
+
+    iterable = ChainedIterable(iter(ints)).map_batches(negate, size)
+    assert isinstance(iterable, ChainedIterable)
+    assert iterable.filter_batches(positive, size) == [
+        -x for x in ints if x < 0
+    ]
+    assert calls == [len(chunk) for chunk in chunked(ints, size)]
+
+
+@given(ints=lists(integers()), key=_int_to_any_funcs() | just(None))
+def test_count_by(ints: List[int], key: Optional[Callable[[int], Any]]) -> None:
+    mapping = ChainedIterable(iter(ints)).count_by(key)
+    assert isinstance(mapping, ChainedMapping)
+    assert mapping == {
+        k: len(group) for k, group in _groups(ints, key or (lambda x: x))
+    }
+
+
 @given(ints=lists(integers()))
 def test_cache(ints: List[int]) -> None:
     iterable = ChainedIterable(iter(ints)).cache()
@@ -291,6 +545,176 @@ def test_cache(ints: List[int]) -> None:
     assert iterable == ints
 
 
+@given(
+    ints=lists(integers()),
+    max_items=integers(0, 10) | just(None),
+    max_bytes=integers(0, 1000) | just(None),
+    index=integers(0, 100),
+)
+def test_cache_replay(
+    ints: List[int],
+    max_items: Optional[int],
+    max_bytes: Optional[int],
+    index: int,
+) -> None:
+    iterable = ChainedIterable(iter(ints)).cache(
+        max_items=max_items, max_bytes=max_bytes,
+    )
+    first, second = iter(iterable), iter(iterable)
+    assert list(islice(first, index)) == ints[:index]
+    assert list(second) == ints
+    assert list(first) == ints[index:]
+    assert iterable == ints
+    if index < len(ints):
+        assert iterable[index] == ints[index]
+    else:
+        with raises(IndexError, match="ChainedIterable index out of range"):
+            iterable[index]
+
+
+@given(ints=lists(integers()), max_items=integers(0, 10) | just(None))
+def test_cache_len_and_reversed(
+    ints: List[int], max_items: Optional[int],
+) -> None:
+    iterable = ChainedIterable(iter(ints)).cache(max_items=max_items)
+    assert iterable.reversed().list() == ints[::-1]
+    assert iterable.len() == len(ints)
+    assert iterable == ints
+    assert ChainedIterable(iter(ints)).cache().len() == len(ints)
+
+
+@given(
+    numbers=lists(integers(-(2 ** 63), 2 ** 63 - 1))
+    | lists(floats(allow_nan=False)),
+    max_items=integers(0, 10) | just(None),
+    index=integers(0, 100),
+)
+def test_cache_compact(
+    numbers: List[Union[int, float]], max_items: Optional[int], index: int,
+) -> None:
+    iterable = ChainedIterable(iter(numbers)).cache(
+        max_items=max_items, compact=True,
+    )
+    assert repr(list(iterable)) == repr(numbers)
+    if index < len(numbers):
+        assert repr(iterable[index]) == repr(numbers[index])
+    with raises(TypeError, match=escape("Expected only ints; got a(n) str")):
+        ChainedIterable([1, "a"]).cache(compact=True).list()
+
+
+@given(
+    numbers=lists(integers(-(2 ** 63), 2 ** 63 - 1))
+    | lists(floats(allow_nan=False))
+)
+def test_array_and_memoryview(numbers: List[Union[int, float]]) -> None:
+    iterable = ChainedIterable(iter(numbers)).array()
+    assert isinstance(iterable, ChainedIterable)
+    assert iterable.len() == len(numbers)
+    assert iterable[-1:].list() == numbers[-1:]
+    assert repr(iterable.list()) == repr(numbers)
+    view = iterable.memoryview()
+    assert view.obj is iterable._iterable
+    assert repr(view.tolist()) == repr(numbers)
+    assert repr(ChainedIterable(numbers).memoryview().tolist()) == repr(numbers)
+    assert repr(ChainedIterable(numbers).array("d").list()) == repr(
+        [float(x) for x in numbers],
+    )
+    with raises(TypeError, match=escape("Expected only ints; got a(n) bool")):
+        ChainedIterable([1, True]).array()
+    with raises(
+        TypeError, match=escape("Expected an int or float; got a(n) str")
+    ):
+        ChainedIterable(["a"]).array()
+    with raises(OverflowError, match="Expected only ints within 64 bits"):
+        ChainedIterable([1, 2 ** 70]).array()
+    with raises(OverflowError, match="Expected only ints within 64 bits"):
+        ChainedIterable([2 ** 70]).cache(compact=True).list()
+
+
+@given(
+    pairs=lists(tuples(integers(0, 5), integers())),
+    reverse=booleans(),
+    run_size=integers(1, 10),
+)
+def test_external_sorted(
+    pairs: List[Tuple[int, int]], reverse: bool, run_size: int,
+) -> None:
+    key = itemgetter(0)
+    iterable = ChainedIterable(iter(pairs)).external_sorted(
+        key=key, reverse=reverse, run_size=run_size,
+    )
+    assert isinstance(iterable, ChainedIterable)
+    assert iterable == sorted(pairs, key=key, reverse=reverse)
+
+
+def test_external_sorted_many_runs() -> None:
+    resource = importorskip("resource")
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (min(soft, 256), hard))
+    try:
+        iterable = ChainedIterable(range(10_000, 0, -1)).external_sorted(
+            run_size=10,
+        )
+        assert iterable.list() == list(range(1, 10_001))
+    finally:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+
+def test_external_sorted_error() -> None:
+    with raises(ValueError, match="Expected a positive run size; got 0"):
+        ChainedIterable([]).external_sorted(run_size=0)
+
+
+@given(
+    ints=lists(integers()),
+    stages=lists(
+        tuples(sampled_from(["filter", "filterfalse"]), _int_to_bool_funcs())
+        | tuples(just("map"), _int_to_int_funcs())
+        | tuples(sampled_from(["filter", "filterfalse"]), just(None)),
+    ),
+)
+def test_fuse(ints: List[int], stages: List[Tuple[str, Any]]) -> None:
+    fused = ChainedIterable(ints).fuse()
+    unfused = ChainedIterable(ints)
+    for method_name, func in stages:
+        fused = getattr(fused, method_name)(func)
+        unfused = getattr(unfused, method_name)(func)
+    assert isinstance(fused, ChainedIterable)
+    assert fused == unfused.list()
+
+
+@given(pairs=lists(tuples(integers(), integers())))
+def test_fuse_starmap(pairs: List[Tuple[int, int]]) -> None:
+    iterable = ChainedIterable(pairs).fuse().starmap(add)
+    assert isinstance(iterable, ChainedIterable)
+    assert iterable == starmap(add, pairs)
+
+
+@given(
+    ints=lists(integers()),
+    key=_int_to_any_funcs(),
+    value=_int_to_int_funcs() | just(None),
+    func=just(None) | just(add),
+)
+def test_group_by_key(
+    ints: List[int],
+    key: Callable[[int], Any],
+    value: Optional[Callable[[int], int]],
+    func: Optional[Callable[[int, int], int]],
+) -> None:
+    mapping = ChainedIterable(iter(ints)).group_by_key(
+        key, value=value, reduce=func,
+    )
+    assert isinstance(mapping, ChainedMapping)
+    expected = {
+        k: [x if value is None else value(x) for x in group]
+        for k, group in _groups(ints, key)
+    }
+    if func is not None:
+        expected = {k: reduce(func, v) for k, v in expected.items()}
+    assert mapping == expected
+
+
 @given(ints=lists(integers()))
 @mark.parametrize("method_name, index", [("first", 0), ("last", -1)])
 def test_first_and_last(ints: List[int], method_name: str, index: int) -> None:
@@ -307,6 +731,116 @@ def test_len(ints: List[int]) -> None:
     _assert_same_type_and_equal(ChainedIterable(iter(ints)).len(), len(ints))
 
 
+@given(ints=lists(integers()), func=_int_to_int_funcs())
+def test_len_sequence(ints: List[int], func: Callable[[int], int]) -> None:
+    iterable = ChainedIterable(ints).map(func).enumerate()
+    _assert_same_type_and_equal(iterable.len(), len(ints))
+    if ints:
+        assert iterable.last() == (len(ints) - 1, func(ints[-1]))
+    else:
+        with raises(EmptyIterableError):
+            iterable.last()
+
+
+@given(ints=lists(integers()), n=integers(0, 10), key=_int_to_any_funcs())
+@mark.parametrize("reverse", [True, False])
+def test_nlargest_and_nsmallest(
+    ints: List[int], n: int, key: Callable[[int], Any], reverse: bool,
+) -> None:
+    method_name = "nlargest" if reverse else "nsmallest"
+    iterable = getattr(ChainedIterable(iter(ints)), method_name)(n, key=key)
+    assert isinstance(iterable, ChainedIterable)
+    assert iterable == sorted(ints, key=key, reverse=reverse)[:n]
+
+
+@given(ints=lists(integers(-1000, 1000), min_size=1), q=floats(0, 1))
+def test_approx_quantile(ints: List[int], q: float) -> None:
+    estimate = ChainedIterable(iter(ints)).approx_quantile(q)
+    assert min(ints) <= estimate <= max(ints)
+
+
+def test_approx_median() -> None:
+    ints = list(range(10_001))
+    Random(0).shuffle(ints)
+    assert abs(ChainedIterable(ints).approx_median() - 5000) < 100
+    with raises(EmptyIterableError):
+        ChainedIterable([]).approx_median()
+
+
+@given(
+    left=lists(tuples(integers(0, 5), integers())),
+    right=lists(tuples(integers(0, 5), integers())),
+)
+@mark.parametrize("cls", [iter, list])
+def test_join(
+    left: List[Tuple[int, int]],
+    right: List[Tuple[int, int]],
+    cls: Callable[[List[Tuple[int, int]]], Iterable[Tuple[int, int]]],
+) -> None:
+    key = itemgetter(0)
+    iterable = ChainedIterable(cls(left)).join(right, key=key, other_key=key)
+    assert isinstance(iterable, ChainedIterable)
+    assert iterable.sorted() == sorted(
+        (x, y) for x in left for y in right if key(x) == key(y)
+    )
+
+
+@given(
+    left=lists(integers(0, 5)),
+    right=dictionaries(integers(0, 5), integers()),
+    fillvalue=integers(),
+)
+def test_join_mapping(
+    left: List[int], right: Dict[int, int], fillvalue: int,
+) -> None:
+    index = ChainedMapping(right)
+    assert ChainedIterable(left).join(index) == [
+        (x, right[x]) for x in left if x in right
+    ]
+    assert ChainedIterable(left).left_join(index, fillvalue=fillvalue) == [
+        (x, right.get(x, fillvalue)) for x in left
+    ]
+
+
+@given(
+    left=lists(tuples(integers(0, 5), integers())),
+    right=lists(tuples(integers(0, 5), integers())),
+)
+def test_left_and_semi_and_anti_join(
+    left: List[Tuple[int, int]], right: List[Tuple[int, int]],
+) -> None:
+    key = itemgetter(0)
+    keys = {key(y) for y in right}
+    iterable = ChainedIterable(left)
+    assert iterable.left_join(right, key=key, other_key=key) == [
+        pair
+        for x in left
+        for pair in ([(x, y) for y in right if key(x) == key(y)] or [(x, None)])
+    ]
+    assert iterable.semi_join(right, key=key, other_key=key) == [
+        x for x in left if key(x) in keys
+    ]
+    assert iterable.anti_join(right, key=key, other_key=key) == [
+        x for x in left if key(x) not in keys
+    ]
+
+
+@given(
+    left=lists(tuples(integers(0, 5), integers())),
+    right=lists(tuples(integers(0, 5), integers())),
+)
+def test_merge_join(
+    left: List[Tuple[int, int]], right: List[Tuple[int, int]],
+) -> None:
+    key = itemgetter(0)
+    left, right = sorted(left, key=key), sorted(right, key=key)
+    iterable = ChainedIterable(iter(left)).merge_join(
+        iter(right), key=key, other_key=key,
+    )
+    assert isinstance(iterable, ChainedIterable)
+    assert iterable == [(x, y) for x in left for y in right if key(x) == key(y)]
+
+
 @given(ints=lists(integers()))
 def test_one(ints: List[int]) -> None:
     iterable = ChainedIterable(iter(ints))
@@ -326,6 +860,10 @@ def test_pipe(ints: List[int], n: int) -> None:
     iterable = ChainedIterable(iter(ints)).pipe(chunked, n)
     assert isinstance(iterable, ChainedIterable)
     assert iterable == chunked(ints, n)
+    with raises(
+        TypeError, match="ChainedIterable expected an iterable, but 'int'",
+    ):
+        ChainedIterable(ints).pipe(len)
 
 
 # functools
@@ -358,6 +896,20 @@ def test_reduce(
 # itertools
 
 
+@given(ints=lists(integers()), func=_int_to_bool_funcs())
+@mark.parametrize("func_itertools", [dropwhile, filterfalse])
+def test_dropwhile_and_filterfalse(
+    ints: List[int],
+    func: Callable[[int], bool],
+    func_itertools: Callable[..., Iterable[int]],
+) -> None:
+    iterable = getattr(ChainedIterable(iter(ints)), func_itertools.__name__)(
+        func,
+    )
+    assert isinstance(iterable, ChainedIterable)
+    assert iterable == func_itertools(func, ints)
+
+
 @given(
     start=integers(), step=integers(), length=integers(0, 1000),
 )
@@ -365,3 +917,173 @@ def test_count(start: int, step: int, length: int) -> None:
     iterable = ChainedIterable.count(start=start, step=step)
     assert isinstance(iterable, ChainedIterable)
     assert iterable[:length] == islice(count(start=start, step=step), length)
+
+
+@given(ints=lists(integers()), n=integers(0, 5))
+def test_tee(ints: List[int], n: int) -> None:
+    iterable = ChainedIterable(iter(ints)).tee(n)
+    assert isinstance(iterable, ChainedIterable)
+    assert iterable.map(list).list() == [ints] * n
+
+
+# itertools-recipes
+
+
+@given(ints=lists(integers()), n=integers(0, 1000))
+@mark.parametrize("cls", [iter, list])
+def test_tail(
+    ints: List[int], n: int, cls: Callable[[List[int]], Iterable[int]],
+) -> None:
+    iterable = ChainedIterable(cls(ints)).tail(n)
+    assert isinstance(iterable, ChainedIterable)
+    assert iterable == ints[max(len(ints) - n, 0) :]
+
+
+@given(ints=lists(integers()), n=integers(0, 1000), default=integers())
+@mark.parametrize("cls", [iter, list])
+def test_nth(
+    ints: List[int],
+    n: int,
+    default: int,
+    cls: Callable[[List[int]], Iterable[int]],
+) -> None:
+    _assert_same_type_and_equal(
+        ChainedIterable(cls(ints)).nth(n, default=default),
+        ints[n] if n < len(ints) else default,
+    )
+
+
+@given(ints=lists(integers(0, 10)), key=_int_to_int_funcs())
+def test_unique_everseen(ints: List[int], key: Callable[[int], int]) -> None:
+    iterable = ChainedIterable(iter(ints)).unique_everseen(key=key)
+    assert isinstance(iterable, ChainedIterable)
+    seen, expected = set(), []
+    for x in ints:
+        if key(x) not in seen:
+            seen.add(key(x))
+            expected.append(x)
+    assert iterable == expected
+    assert (
+        ChainedIterable(ints).unique_everseen(key=key, error_rate=1e-9)
+        == expected
+    )
+    assert (
+        ChainedIterable([[x] for x in ints])
+        .unique_everseen(key=lambda x: [key(*x)], serialize=tuple)
+        .map(itemgetter(0))
+        == expected
+    )
+
+
+@given(ints=lists(integers(0, 10)), window=integers(1, 5))
+def test_unique_everseen_window(ints: List[int], window: int) -> None:
+    iterable = ChainedIterable(iter(ints)).unique_everseen(window=window)
+    recent: List[int] = []
+    expected = []
+    for x in ints:
+        if x in recent:
+            recent.remove(x)
+        else:
+            expected.append(x)
+        recent = (recent + [x])[-window:]
+    assert iterable == expected
+
+
+def test_unique_everseen_bloom_colliding_hashes() -> None:
+    assert hash(-1) == hash(-2)
+    iterable = ChainedIterable([-1, -2, -1]).unique_everseen(error_rate=1e-9)
+    assert iterable.list() == [-1, -2]
+
+
+def test_unique_everseen_errors() -> None:
+    with raises(ValueError, match="Expected a positive window; got 0"):
+        ChainedIterable([]).unique_everseen(window=0)
+    with raises(ValueError, match="Expected at most one of window and"):
+        ChainedIterable([]).unique_everseen(window=1, error_rate=0.1)
+    with raises(ValueError, match="Expected a positive capacity; got 0"):
+        ChainedIterable([]).unique_everseen(capacity=0, error_rate=0.1)
+
+
+# mapping
+
+
+@given(mapping=dictionaries(integers(), integers()), n=integers(0, 10))
+@mark.parametrize("kind", ["keys", "values", "items"])
+@mark.parametrize("reverse", [True, False])
+def test_mapping_nlargest_and_nsmallest(
+    mapping: Dict[int, int], n: int, kind: str, reverse: bool,
+) -> None:
+    method_name = f"{'nlargest' if reverse else 'nsmallest'}_{kind}"
+    _assert_same_type_and_equal(
+        getattr(ChainedMapping(mapping), method_name)(n),
+        sorted(getattr(mapping, kind)(), reverse=reverse)[:n],
+    )
+
+
+@given(
+    mapping=dictionaries(integers(), integers()),
+    key_pred=_int_to_bool_funcs(),
+    value_pred=_int_to_bool_funcs(),
+    key_func=_int_to_int_funcs(),
+    value_func=_int_to_int_funcs(),
+    lazy=booleans(),
+)
+def test_mapping_transforms(
+    mapping: Dict[int, int],
+    key_pred: Callable[[int], bool],
+    value_pred: Callable[[int], bool],
+    key_func: Callable[[int], int],
+    value_func: Callable[[int], int],
+    lazy: bool,
+) -> None:
+    chained = ChainedMapping(mapping)
+    if lazy:
+        chained = chained.lazy()
+    result = (
+        chained.filter_keys(key_pred)
+        .filter_values(value_pred)
+        .filter_items(lambda k, v: key_pred(v) or value_pred(k))
+        .map_values(value_func)
+        .map_keys(key_func)
+        .map_items(lambda k, v: (v, k))
+    )
+    expected = {
+        k: v
+        for k, v in mapping.items()
+        if key_pred(k) and value_pred(v) and (key_pred(v) or value_pred(k))
+    }
+    expected = {key_func(k): value_func(v) for k, v in expected.items()}
+    expected = {v: k for k, v in expected.items()}
+    assert isinstance(result, ChainedMapping)
+    _assert_same_type_and_equal(result.dict(), expected)
+    assert len(result) == len(expected)
+    assert result.list_items() == list(expected.items())
+    for key, value in expected.items():
+        assert result[key] == value
+
+
+@given(
+    mapping=dictionaries(integers(), integers()),
+    pred=_int_to_bool_funcs(),
+    func=_int_to_int_funcs(),
+)
+def test_mapping_lazy_lookups(
+    mapping: Dict[int, int],
+    pred: Callable[[int], bool],
+    func: Callable[[int], int],
+) -> None:
+    calls: List[int] = []
+
+    def traced(x: int) -> int:
+        calls.append(x)
+        return func(x)
+
+    lazy = ChainedMapping(mapping).lazy().filter_keys(pred).map_values(traced)
+    assert not calls
+    for key, value in mapping.items():
+        if pred(key):
+            assert lazy[key] == func(value)
+        else:
+            with raises(KeyError):
+                lazy[key]
+    assert calls == [v for k, v in mapping.items() if pred(k)]
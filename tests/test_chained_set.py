@@ -6,11 +6,17 @@ from typing import Union
 
 from hypothesis import given
 from hypothesis import infer
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
 from hypothesis.strategies import sampled_from
+from hypothesis.strategies import sets
 from pytest import raises
 
+from chained_iterable.chained_set import CBitmapSet
 from chained_iterable.chained_set import CFrozenSet
 from chained_iterable.chained_set import CSet
+from chained_iterable.chained_set import CSortedSet
+from chained_iterable.chained_set import SetExpression
 
 
 classes = sampled_from([CSet, CFrozenSet])
@@ -87,3 +93,157 @@ def test_pop(x: Set[int]) -> None:
     else:
         with raises(KeyError, match="pop from an empty set"):
             cset.pop()
+
+
+@given(cls=classes, x=infer, y=infer, z=infer, w=infer)
+def test_lazy(
+    cls: CSetOrCFrozenset, x: Set[int], y: Set[int], z: List[int], w: Set[int],
+) -> None:
+    expression = cls(x).lazy().union(y).intersection(z).difference(w) ^ {0, 1}
+    assert isinstance(expression, SetExpression)
+    expected = x.union(y).intersection(z).difference(w) ^ {0, 1}
+    assert set(expression) == expected
+    assert len(list(expression)) == len(expression) == len(expected)
+    for i in chain(x, y, z, w, [0, 1]):
+        assert (i in expression) is (i in expected)
+    assert expression == expected
+    cset = expression.set()
+    assert isinstance(cset, CSet)
+    assert cset == expected
+    assert isinstance(expression.frozenset(), CFrozenSet)
+
+
+@given(x=infer, xs=infer)
+def test_lazy_flattens(x: Set[int], xs: List[Set[int]]) -> None:
+    expression = CSet(x).lazy()
+    for other in xs:
+        expression = expression & other
+    assert expression == x.intersection(*xs)
+    if len(xs) > 1:
+        assert len(expression._operands) == len(xs) + 1
+
+
+# alternative backends
+
+
+backends = sampled_from([CSortedSet, CBitmapSet])
+Backend = Union[Type[CSortedSet], Type[CBitmapSet]]
+# spans several bitmap containers
+ids = sets(integers(0, 2 ** 18))
+
+
+@given(cls=backends, x=ids, y=ids, z=ids)
+def test_backend_algebra(
+    cls: Backend, x: Set[int], y: Set[int], z: Set[int],
+) -> None:
+    cset = cls(x)
+    assert list(cset) == sorted(x)
+    assert len(cset) == len(x)
+    for method in ["union", "intersection", "difference"]:
+        result = getattr(cset, method)(y, cls(z))
+        assert isinstance(result, cls)
+        assert list(result) == sorted(getattr(x, method)(y, z))
+    result = cset.symmetric_difference(y)
+    assert isinstance(result, cls)
+    assert list(result) == sorted(x ^ y)
+    assert (cset | y) == (x | y)
+    assert (cset & y) == (x & y)
+    assert (cset - y) == (x - y)
+    assert (cset ^ y) == (x ^ y)
+    assert cset.lazy().union(y).set() == x | y
+
+
+@given(cls=backends, x=ids, y=lists(integers(0, 2 ** 18)))
+def test_backend_mutation(cls: Backend, x: Set[int], y: List[int]) -> None:
+    cset = cls(x)
+    expected = set(x)
+    for i in y:
+        assert cset.add(i) is cset
+        expected.add(i)
+    assert cset == expected
+    for i in y[::2]:
+        assert cset.discard(i) is cset
+        expected.discard(i)
+    assert cset == expected
+    assert len(cset) == len(expected)
+    copy = cset.copy()
+    copy.add(2 ** 18 + 1)
+    assert (2 ** 18 + 1) not in cset
+    if expected:
+        assert cset.pop() is cset
+        expected.discard(max(expected))
+        assert list(cset) == sorted(expected)
+    with raises(KeyError, match="-1"):
+        cset.remove(-1)
+    assert not cset.clear()
+
+
+@given(cls=backends, x=ids, lo=integers(0, 2 ** 18), hi=integers(0, 2 ** 18))
+def test_backend_rank_select_range(
+    cls: Backend, x: Set[int], lo: int, hi: int,
+) -> None:
+    cset = cls(x)
+    expected = sorted(x)
+    assert cset.rank(lo) == sum(1 for i in x if i < lo)
+    for i, value in enumerate(expected):
+        assert cset.select(i) == value
+    with raises(IndexError, match="index out of range"):
+        cset.select(len(expected))
+    result = cset.range(lo, hi)
+    assert isinstance(result, cls)
+    assert list(result) == [i for i in expected if lo <= i < hi]
+    assert list(cset.range(lo)) == [i for i in expected if lo <= i]
+
+
+def test_bitmap_dense_containers() -> None:
+    evens = CBitmapSet(range(0, 200_000, 2))
+    thirds = CBitmapSet(range(0, 200_000, 3))
+    assert any(isinstance(c, int) for c in evens._containers.values())
+    assert (evens & thirds) == set(range(0, 200_000, 6))
+    assert (evens | thirds) == set(range(0, 200_000, 2)) | set(
+        range(0, 200_000, 3),
+    )
+    assert (evens - thirds) == set(range(0, 200_000, 2)) - set(
+        range(0, 200_000, 3),
+    )
+    assert (evens ^ thirds) == set(range(0, 200_000, 2)) ^ set(
+        range(0, 200_000, 3),
+    )
+    assert evens.rank(100_001) == 50_001
+    assert evens.select(50_000) == 100_000
+    assert list(evens.range(99_999, 100_005)) == [100_000, 100_002, 100_004]
+    assert 100_001 not in evens.add(100_000).discard(100_002)
+    assert 100_002 not in evens
+    assert len(evens) == 99_999
+
+
+@given(cls=backends, x=ids, y=ids)
+def test_backend_results_do_not_share_state(
+    cls: Backend, x: Set[int], y: Set[int],
+) -> None:
+    left, right = cls(x), cls(y)
+    for method in ["union", "intersection", "difference"]:
+        getattr(left, method)(right).add(2 ** 18 + 1).discard(min(x, default=0))
+    left.symmetric_difference(right).add(2 ** 18 + 1).clear()
+    left.copy().add(2 ** 18 + 1)
+    cls(left).add(2 ** 18 + 1)
+    left.range(0, 2 ** 17).add(2 ** 18 + 1)
+    assert list(left) == sorted(x)
+    assert len(left) == len(x)
+    assert list(right) == sorted(y)
+    assert len(right) == len(y)
+
+
+def test_bitmap_errors() -> None:
+    with raises(ValueError, match="Expected a non-negative int; got -1"):
+        CBitmapSet([-1])
+    with raises(TypeError, match="Expected a non-negative int; got 'a'"):
+        CBitmapSet().add("a")
+
+
+@given(x=sets(integers()))
+def test_sorted_typecode(x: Set[int]) -> None:
+    x = {i for i in x if -(2 ** 63) <= i < 2 ** 63}
+    cset = CSortedSet(x, typecode="q")
+    assert list(cset) == sorted(x)
+    assert cset.union([0]).add(1) == x | {0, 1}
@@ -0,0 +1,93 @@
+from os import remove
+from tempfile import NamedTemporaryFile
+from typing import List
+
+from hypothesis import given
+from hypothesis.strategies import binary
+from hypothesis.strategies import integers
+from hypothesis.strategies import sampled_from
+from pytest import raises
+
+from chained_iterable import ChainedIterable
+
+
+def _write(data: bytes) -> str:
+    with NamedTemporaryFile(delete=False) as file:
+        file.write(data)
+    return file.name
+
+
+def _read_ranges(path: str, parts: int, **kwargs: object) -> List[bytes]:
+    return (
+        ChainedIterable.file_ranges(path, parts)
+        .map(
+            lambda range_: ChainedIterable.from_file(
+                path, start=range_[0], stop=range_[1], **kwargs,
+            )
+            .map(bytes)
+            .list(),
+        )
+        .unbatch()
+        .list()
+    )
+
+
+@given(data=binary(), parts=integers(1, 5))
+def test_lines(data: bytes, parts: int) -> None:
+    path = _write(data)
+    try:
+        with open(path, "rb") as file:
+            expected = list(file)
+        iterable = ChainedIterable.from_file(path)
+        assert isinstance(iterable, ChainedIterable)
+        assert iterable.map(bytes).list() == expected
+        assert _read_ranges(path, parts) == expected
+    finally:
+        remove(path)
+
+
+@given(
+    data=binary(),
+    delimiter=sampled_from([b"\x00", b"\r\n"]),
+    parts=integers(1, 5),
+)
+def test_delimited(data: bytes, delimiter: bytes, parts: int) -> None:
+    path = _write(data)
+    try:
+        expected = data.split(delimiter)
+        if expected[-1] == b"":
+            expected.pop()
+        kwargs = {"mode": "delimited", "delimiter": delimiter}
+        assert (
+            ChainedIterable.from_file(path, **kwargs).map(bytes).list()
+            == expected
+        )
+        assert _read_ranges(path, parts, **kwargs) == expected
+    finally:
+        remove(path)
+
+
+@given(data=binary(), size=integers(1, 5), parts=integers(1, 5))
+def test_fixed(data: bytes, size: int, parts: int) -> None:
+    path = _write(data)
+    try:
+        expected = [data[i : i + size] for i in range(0, len(data), size)]
+        kwargs = {"mode": "fixed", "size": size}
+        assert (
+            ChainedIterable.from_file(path, **kwargs).map(bytes).list()
+            == expected
+        )
+        assert _read_ranges(path, parts, **kwargs) == expected
+    finally:
+        remove(path)
+
+
+def test_errors() -> None:
+    with raises(ValueError, match="Expected mode to be one of"):
+        ChainedIterable.from_file("path", mode="words")
+    with raises(ValueError, match="Expected a positive record size; got None"):
+        ChainedIterable.from_file("path", mode="fixed")
+    with raises(ValueError, match="Expected a non-empty delimiter"):
+        ChainedIterable.from_file("path", mode="delimited", delimiter=b"")
+    with raises(ValueError, match="Expected a positive number of parts; got 0"):
+        ChainedIterable.file_ranges("path", 0)
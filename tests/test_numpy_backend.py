@@ -0,0 +1,135 @@
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from operator import add
+from operator import mul
+from subprocess import run
+from sys import executable
+from typing import Any
+from typing import Callable
+from typing import List
+
+from hypothesis import given
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+from pytest import importorskip
+from pytest import mark
+
+from chained_iterable import ChainedIterable
+
+
+numpy = importorskip("numpy")
+small_ints = integers(-1000, 1000)
+
+
+@given(ints=lists(small_ints))
+def test_from_array_and_to_numpy(ints: List[int]) -> None:
+    iterable = ChainedIterable.from_array(ints, dtype=numpy.int64)
+    assert isinstance(iterable, ChainedIterable)
+    array = iterable.to_numpy()
+    assert isinstance(array, numpy.ndarray)
+    assert array.tolist() == ints
+    assert ChainedIterable(iter(ints)).to_numpy(dtype=float).tolist() == ints
+
+
+@given(ints=lists(small_ints))
+def test_map_and_filter(ints: List[int]) -> None:
+    iterable = (
+        ChainedIterable.from_array(ints, dtype=numpy.int64)
+        .map(numpy.negative)
+        .filter(numpy.signbit)
+    )
+    assert isinstance(iterable, ChainedIterable)
+    assert isinstance(iterable.to_numpy(), numpy.ndarray)
+    assert iterable == [-x for x in ints if x > 0]
+    assert ChainedIterable.from_array(ints).filter(None) == filter(None, ints)
+
+
+@given(ints=lists(small_ints))
+def test_map_not_vectorisable(ints: List[int]) -> None:
+    iterable = ChainedIterable.from_array(ints, dtype=numpy.int64).map(abs)
+    assert iterable == map(abs, ints)
+
+
+@given(ints=lists(small_ints, min_size=1))
+@mark.parametrize("func", [max, min, sum])
+def test_reductions(ints: List[int], func: Callable[..., int]) -> None:
+    array = ChainedIterable.from_array(ints, dtype=numpy.int64)
+    assert getattr(array, func.__name__)() == func(ints)
+
+
+def test_reductions_are_exact() -> None:
+    array = ChainedIterable.from_array([2 ** 62, 2 ** 62], dtype=numpy.int64)
+    assert array.sum() == 2 ** 63
+    assert array.accumulate().list() == [2 ** 62, 2 ** 63]
+    for method in ["max", "min", "sum"]:
+        assert type(getattr(array, method)()) is int
+    assert type(ChainedIterable.from_array([0.5]).sum()) is float
+    empty = ChainedIterable.from_array([], dtype=numpy.int64)
+    assert type(empty.sum()) is int
+    assert ChainedIterable.from_array([], dtype=float).sum(1) == 1
+    int8s = ChainedIterable.from_array([100, 100], dtype=numpy.int8)
+    assert int8s.accumulate().list() == [100, 200]
+    bools = ChainedIterable.from_array([True, True])
+    assert bools.accumulate().list() == [True, 2]
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(max_workers=2)
+        self.submitted = 0
+
+    def submit(self, *args: Any, **kwargs: Any) -> Future:
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+@mark.parametrize("method", ["max", "min", "sum"])
+def test_reductions_use_executor(method: str) -> None:
+    array = ChainedIterable.from_array(list(range(10)), dtype=numpy.int64)
+    expected = getattr(ChainedIterable(range(10)), method)()
+    with _CountingExecutor() as executor:
+        assert getattr(array, method)(executor=executor) == expected
+    assert executor.submitted
+
+
+@given(ints=lists(integers(-10, 10), max_size=15))
+@mark.parametrize("func", [add, mul, numpy.maximum])
+def test_accumulate(ints: List[int], func: Callable[[Any, Any], Any]) -> None:
+    array = ChainedIterable.from_array(ints, dtype=numpy.int64)
+    assert array.accumulate(func) == ChainedIterable(ints).accumulate(func)
+
+
+@given(ints=lists(small_ints))
+def test_dotproduct_and_quantify(ints: List[int]) -> None:
+    array = ChainedIterable.from_array(ints, dtype=numpy.int64)
+    assert array.dotproduct(numpy.array(ints)) == sum(x * x for x in ints)
+    assert array.quantify() == sum(map(bool, ints))
+    assert array.quantify(numpy.signbit) == sum(x < 0 for x in ints)
+
+
+class _Threshold:
+    # defines __eq__ but not __hash__, so it is unhashable
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __call__(self, x: int) -> bool:
+        return x > self.value
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _Threshold) and other.value == self.value
+
+
+@given(ints=lists(small_ints))
+def test_unhashable_callables(ints: List[int]) -> None:
+    threshold = _Threshold(0)
+    iterable = ChainedIterable.from_array(ints, dtype=numpy.int64)
+    assert iterable.filter(threshold).list() == [x for x in ints if x > 0]
+    assert iterable.map(threshold).list() == [x > 0 for x in ints]
+
+
+def test_import_is_lazy() -> None:
+    code = (
+        "import sys, chained_iterable; "
+        "assert 'numpy' not in sys.modules, 'numpy was imported'"
+    )
+    run([executable, "-c", code], check=True)
@@ -0,0 +1,52 @@
+from operator import neg
+from typing import List
+
+from hypothesis import given
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+
+from chained_iterable import ChainedIterable
+from chained_iterable import Profiler
+from chained_iterable import StageStats
+
+
+def _is_even(x: int) -> bool:
+    return x % 2 == 0
+
+
+@given(ints=lists(integers()))
+def test_profile(ints: List[int]) -> None:
+    reported: List[StageStats] = []
+    profiler = Profiler(callback=reported.append)
+    iterable = ChainedIterable(ints).profile(profiler).map(neg).filter(_is_even)
+    assert isinstance(iterable, ChainedIterable)
+    evens = [-x for x in ints if x % 2 == 0]
+    assert iterable.list() == evens
+    report = profiler.report()
+    assert [stats.name for stats in report] == [
+        "source",
+        "map(neg)",
+        "filter(_is_even)",
+    ]
+    assert [stats.items_in for stats in report] == [None, len(ints), len(ints)]
+    assert [stats.items_out for stats in report] == [
+        len(ints),
+        len(ints),
+        len(evens),
+    ]
+    for stats in report:
+        assert stats.wall_time >= 0
+        assert stats.throughput >= 0
+    assert [stats[:4] for stats in reported] == [stats[:4] for stats in report]
+
+
+@given(ints=lists(integers(), min_size=1))
+def test_profile_context_manager(ints: List[int]) -> None:
+    reported: List[StageStats] = []
+    with Profiler(callback=reported.append) as profiler:
+        first = ChainedIterable(ints).profile(profiler).map(neg).first()
+    assert first == -ints[0]
+    assert [(stats.name, stats.items_out) for stats in reported] == [
+        ("source", 1),
+        ("map(neg)", 1),
+    ]
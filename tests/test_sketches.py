@@ -0,0 +1,86 @@
+from typing import List
+
+from hypothesis import given
+from hypothesis.strategies import floats
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+from pytest import approx
+from pytest import mark
+from pytest import raises
+
+from chained_iterable.errors import EmptyIterableError
+from chained_iterable.sketches import BloomFilter
+from chained_iterable.sketches import HyperLogLog
+from chained_iterable.sketches import P2Quantile
+from chained_iterable.sketches import Welford
+
+
+@given(ints=lists(integers(-1000, 1000), min_size=1, max_size=5))
+def test_p2_quantile_exact_for_small_inputs(ints: List[int]) -> None:
+    estimate = P2Quantile(0.5)
+    for x in ints:
+        estimate.update(x)
+    sorted_ints = sorted(ints)
+    n = len(ints)
+    expected = (sorted_ints[(n - 1) // 2] + sorted_ints[n // 2]) / 2
+    assert estimate.result() == expected
+
+
+@given(q=floats(1.01, 10) | floats(-10, -0.01))
+def test_p2_quantile_error(q: float) -> None:
+    with raises(ValueError, match="Expected a quantile in"):
+        P2Quantile(q)
+
+
+@given(ints=lists(integers()))
+def test_bloom_filter_has_no_false_negatives(ints: List[int]) -> None:
+    bloom = BloomFilter(max(len(ints), 1))
+    for x in ints:
+        bloom.add(x)
+    assert all(x in bloom for x in ints)
+
+
+def test_bloom_filter_error_rate() -> None:
+    bloom = BloomFilter(1_000, error_rate=0.01)
+    assert sum(bloom.add(x) for x in range(1_000)) > 980
+    false_positives = sum(x in bloom for x in range(1_000, 11_000))
+    assert false_positives < 300
+
+
+def test_bloom_filter_errors() -> None:
+    with raises(ValueError, match="Expected a positive capacity; got 0"):
+        BloomFilter(0)
+    with raises(ValueError, match=r"Expected an error rate in \(0, 1\); got 1"):
+        BloomFilter(10, error_rate=1)
+
+
+@given(values=lists(floats(-1e6, 1e6), min_size=1))
+def test_welford(values: List[float]) -> None:
+    moments = Welford()
+    for x in values:
+        moments.update(x)
+    mean = sum(values) / len(values)
+    assert moments.count == len(values)
+    assert moments.mean == approx(mean, abs=1e-6)
+    assert moments.variance == approx(
+        sum((x - mean) ** 2 for x in values) / len(values), rel=1e-6, abs=1e-6,
+    )
+
+
+def test_welford_empty() -> None:
+    with raises(EmptyIterableError):
+        Welford().mean
+
+
+@mark.parametrize("n", [0, 10, 1_000, 100_000])
+def test_hyper_log_log(n: int) -> None:
+    distinct = HyperLogLog()
+    for x in range(n):
+        distinct.update(x)
+        distinct.update(x)
+    assert distinct.result() == approx(n, rel=0.05)
+
+
+def test_hyper_log_log_error() -> None:
+    with raises(ValueError, match="Expected a precision in"):
+        HyperLogLog(17)
@@ -0,0 +1,131 @@
+from operator import itemgetter
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from hypothesis import given
+from hypothesis.strategies import floats
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+from pytest import mark
+from pytest import raises
+
+from chained_iterable import ChainedIterable
+from chained_iterable.utilities import identity
+from chained_iterable.windows import Window
+
+
+events = lists(integers(0, 50)).map(lambda ts: list(zip(ts, range(len(ts)))))
+
+
+def _accepted(
+    events: List[Tuple[int, int]], lateness: int,
+) -> List[Tuple[int, int]]:
+    accepted, latest = [], None
+    for event in events:
+        if latest is None or event[0] >= latest - lateness:
+            accepted.append(event)
+            latest = event[0] if latest is None else max(latest, event[0])
+    return accepted
+
+
+@given(ints=lists(integers()), n=integers(1, 5), step=integers(1, 5))
+def test_sliding_window(ints: List[int], n: int, step: int) -> None:
+    iterable = ChainedIterable(ints).sliding_window(n, step=step)
+    assert isinstance(iterable, ChainedIterable)
+    assert iterable.list() == [
+        tuple(ints[i : i + n]) for i in range(0, len(ints) - n + 1, step)
+    ]
+
+
+@given(ints=lists(integers()), n=integers(1, 5))
+def test_rolling(ints: List[int], n: int) -> None:
+    windows = [ints[i : i + n] for i in range(len(ints) - n + 1)]
+    assert ChainedIterable(ints).rolling_sum(n).list() == list(
+        map(sum, windows),
+    )
+    assert ChainedIterable(ints).rolling_mean(n).list() == [
+        sum(window) / n for window in windows
+    ]
+    assert ChainedIterable(ints).rolling_max(n).list() == list(
+        map(max, windows),
+    )
+    assert ChainedIterable(ints).rolling_min(n).list() == list(
+        map(min, windows),
+    )
+
+
+@given(
+    values=lists(floats(-1e6, 1e6), min_size=1), n=integers(1, 5),
+)
+def test_rolling_sum_floats(values: List[float], n: int) -> None:
+    windows = [values[i : i + n] for i in range(len(values) - n + 1)]
+    for total, window in zip(ChainedIterable(values).rolling_sum(n), windows):
+        assert abs(total - sum(window)) <= 1e-6 * n
+
+
+@given(events=events, size=integers(1, 10), lateness=integers(0, 10))
+def test_tumbling_window(
+    events: List[Tuple[int, int]], size: int, lateness: int,
+) -> None:
+    windows = (
+        ChainedIterable(events)
+        .tumbling_window(size, itemgetter(0), lateness=lateness)
+        .list()
+    )
+    expected: Dict[int, List[Tuple[int, int]]] = {}
+    for event in _accepted(events, lateness):
+        expected.setdefault(event[0] // size * size, []).append(event)
+    assert windows == [
+        Window(start, start + size, expected[start])
+        for start in sorted(expected)
+    ]
+
+
+@given(events=events, gap=integers(1, 10), lateness=integers(0, 10))
+def test_session_window(
+    events: List[Tuple[int, int]], gap: int, lateness: int,
+) -> None:
+    sessions = (
+        ChainedIterable(events)
+        .session_window(gap, itemgetter(0), lateness=lateness)
+        .list()
+    )
+    expected: List[List[Tuple[int, int]]] = []
+    for event in sorted(_accepted(events, lateness)):
+        if expected and event[0] - expected[-1][-1][0] <= gap:
+            expected[-1].append(event)
+        else:
+            expected.append([event])
+    # items are in order of arrival, which is the second field of each event
+    assert sessions == [
+        Window(items[0][0], items[-1][0], sorted(items, key=itemgetter(1)))
+        for items in expected
+    ]
+
+
+def test_session_window_bridging_keeps_arrival_order() -> None:
+    sessions = ChainedIterable([1, 10, 2, 11, 6]).session_window(
+        5, identity, lateness=10,
+    )
+    assert sessions.list() == [Window(1, 11, [1, 10, 2, 11, 6])]
+
+
+@mark.parametrize(
+    "method, args, message",
+    [
+        ("sliding_window", (0,), "Expected a positive window size; got 0"),
+        ("sliding_window", (1, 0), "Expected a positive step; got 0"),
+        ("rolling_sum", (0,), "Expected a positive window size; got 0"),
+        ("rolling_max", (-1,), "Expected a positive window size; got -1"),
+        ("session_window", (0, abs), "Expected a positive gap; got 0"),
+        (
+            "tumbling_window",
+            (1, abs, -1),
+            "Expected a non-negative lateness; got -1",
+        ),
+    ],
+)
+def test_errors(method: str, args: Tuple, message: str) -> None:
+    with raises(ValueError, match=message):
+        getattr(ChainedIterable([]), method)(*args)